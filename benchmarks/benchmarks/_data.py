@@ -0,0 +1,231 @@
+"""Synthetic datasets for the benchmarks
+
+Datasets are generated once and cached in the directory `DVPIO_BENCHMARK_DATA` (defaults to `dvpio-benchmarks` in
+the temporary directory of the system), so that repeated runs and runs of different commits share the same files.
+Set `DVPIO_BENCHMARK_QUICK=1` to only run the smallest size of every benchmark.
+"""
+
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shapely
+import tifffile
+from geopandas import GeoDataFrame
+from pylibCZIrw import czi as pyczi
+from spatialdata.models import PointsModel, ShapesModel
+
+DATA_DIR = os.environ.get("DVPIO_BENCHMARK_DATA", os.path.join(tempfile.gettempdir(), "dvpio-benchmarks"))
+QUICK = os.environ.get("DVPIO_BENCHMARK_QUICK", "0") == "1"
+
+# Calibration points of the LMD (source) and image (target) coordinate system
+CALIBRATION_POINTS_LMD = np.array([[0, 0], [0, 100_000], [50_000, 50_000]], dtype=float)
+CALIBRATION_POINTS_IMAGE = np.array([[10, 20], [10, 50_020], [25_010, 25_020]], dtype=float)
+
+
+def sizes(*values: int) -> list[int]:
+    """Benchmark sizes, only the smallest size in quick mode"""
+    return list(values[:1]) if QUICK else list(values)
+
+
+def _cached(name: str, writer: Callable[[str], None]) -> str:
+    """Return path of a cached dataset, generate it with writer(path) if it does not exist"""
+    path = os.path.join(DATA_DIR, name)
+    if not os.path.exists(path):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        # Write to a temporary file with the same extension, so that interrupted runs do not leave incomplete files
+        tmp_path = os.path.join(DATA_DIR, f".{os.getpid()}.{name}")
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+    return path
+
+
+def _tile(rng: np.random.Generator, shape: tuple[int, ...], dtype: type) -> np.ndarray:
+    """Random tile with 12 bit of information per pixel, so that compression is effective but not trivial"""
+    high = 4096 if np.dtype(dtype).itemsize > 1 else 256
+    return rng.integers(0, high, size=shape, dtype=dtype)
+
+
+def _in_tissue(x: int, y: int, tile: int, size: int) -> bool:
+    """Whether a tile is within the (circular) tissue region of a synthetic slide"""
+    center = size / 2
+    return (x + tile / 2 - center) ** 2 + (y + tile / 2 - center) ** 2 <= (0.5 * size) ** 2
+
+
+def czi_image(size: int, tile: int = 1024, n_channel: int = 2) -> str:
+    """Tiled, zstd compressed (size x size) CZI image with uint16 channels
+
+    Tiles (subblocks) are only written within a circular tissue region, the corners of the slide are empty.
+    """
+
+    def write(path: str) -> None:
+        rng = np.random.default_rng(0)
+        with pyczi.create_czi(path, compression_options="zstd1:ExplicitLevel=1") as czidoc_w:
+            for y in range(0, size, tile):
+                for x in range(0, size, tile):
+                    if not _in_tissue(x, y, tile, size):
+                        continue
+                    for channel in range(n_channel):
+                        czidoc_w.write(_tile(rng, (tile, tile, 1), np.uint16), plane={"C": channel}, location=(x, y))
+
+    return _cached(f"image_{size}_{tile}_{n_channel}.czi", write)
+
+
+def _tiff_tiles(
+    rng: np.random.Generator, shape: tuple[int, ...], tile: int, dtype: type, planar: bool = True
+) -> Iterator[np.ndarray]:
+    """Tiles of a planar (c, y, x) or contiguous (y, x, s) image in the order expected by :class:`tifffile.TiffWriter`"""
+    if planar:
+        n_planes, height, width, samples = shape[0], shape[1], shape[2], ()
+    else:
+        n_planes, height, width, samples = 1, shape[0], shape[1], shape[2:]
+
+    for _ in range(n_planes):
+        for _ in range(0, height, tile):
+            for _ in range(0, width, tile):
+                yield _tile(rng, (tile, tile, *samples), dtype)
+
+
+def tiff_image(size: int, tile: int = 512, n_channel: int = 2, n_levels: int = 4) -> str:
+    """Tiled, pyramidal, zlib compressed (size x size) OME-TIFF with uint16 channels
+
+    Pyramid levels are stored as SubIFDs.
+    """
+
+    def write(path: str) -> None:
+        rng = np.random.default_rng(0)
+        with tifffile.TiffWriter(path, bigtiff=True, ome=True) as tif:
+            for level in range(n_levels):
+                shape = (n_channel, size >> level, size >> level)
+                tif.write(
+                    _tiff_tiles(rng, shape, tile, np.uint16),
+                    shape=shape,
+                    dtype=np.uint16,
+                    tile=(tile, tile),
+                    compression="zlib",
+                    metadata={"axes": "CYX"} if level == 0 else None,
+                    subifds=n_levels - 1 if level == 0 else None,
+                    subfiletype=1 if level > 0 else 0,
+                )
+
+    return _cached(f"image_{size}_{tile}_{n_channel}_{n_levels}.ome.tif", write)
+
+
+def openslide_image(size: int, tile: int = 512, n_levels: int = 4) -> str:
+    """Tiled, pyramidal, zlib compressed (size x size) RGB TIFF that is read by openslide as generic TIFF
+
+    Pyramid levels are stored as consecutive pages.
+    """
+
+    def write(path: str) -> None:
+        rng = np.random.default_rng(0)
+        with tifffile.TiffWriter(path, bigtiff=True) as tif:
+            for level in range(n_levels):
+                shape = (size >> level, size >> level, 3)
+                tif.write(
+                    _tiff_tiles(rng, shape, tile, np.uint8, planar=False),
+                    shape=shape,
+                    dtype=np.uint8,
+                    tile=(tile, tile),
+                    photometric="rgb",
+                    compression="zlib",
+                    subfiletype=1 if level > 0 else 0,
+                )
+
+    return _cached(f"image_{size}_{tile}_{n_levels}.tiff", write)
+
+
+def _polygons(n_shapes: int, n_vertices: int = 16, extent: float = 50_000, seed: int = 0) -> np.ndarray:
+    """Closed circular polygons (n_shapes, n_vertices + 1, 2) with random centers and radii"""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0, extent, size=(n_shapes, 1, 2))
+    radii = rng.uniform(5, 20, size=(n_shapes, 1, 1))
+    angles = np.linspace(0, 2 * np.pi, n_vertices + 1)
+    angles[-1] = 0
+    unit_circle = np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    return centers + radii * unit_circle
+
+
+def lmd_shapes(n_shapes: int) -> str:
+    """LMD XML file with n_shapes polygons"""
+
+    def write(path: str) -> None:
+        polygons = np.round(_polygons(n_shapes)).astype(int)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("<?xml version='1.0' encoding='UTF-8'?>\n<ImageData>\n  <GlobalCoordinates>1</GlobalCoordinates>\n")
+            for idx, (x, y) in enumerate(CALIBRATION_POINTS_LMD.astype(int), start=1):
+                # LMD files store calibration points in units of 1/100
+                f.write(f"  <X_CalibrationPoint_{idx}>{x * 100}</X_CalibrationPoint_{idx}>\n")
+                f.write(f"  <Y_CalibrationPoint_{idx}>{y * 100}</Y_CalibrationPoint_{idx}>\n")
+            f.write(f"  <ShapeCount>{n_shapes}</ShapeCount>\n")
+            for shape_idx, polygon in enumerate(polygons, start=1):
+                points = "".join(
+                    f"    <X_{idx}>{x}</X_{idx}>\n    <Y_{idx}>{y}</Y_{idx}>\n"
+                    for idx, (x, y) in enumerate(polygon, start=1)
+                )
+                f.write(
+                    f"  <Shape_{shape_idx}>\n    <PointCount>{len(polygon)}</PointCount>\n"
+                    f"    <CapID>A{shape_idx % 12 + 1}</CapID>\n{points}  </Shape_{shape_idx}>\n"
+                )
+            f.write("</ImageData>\n")
+
+    return _cached(f"shapes_{n_shapes}.xml", write)
+
+
+def shapes(n_shapes: int) -> ShapesModel:
+    """In-memory ShapesModel with n_shapes polygons"""
+    polygons = shapely.polygons(_polygons(n_shapes))
+    return ShapesModel.parse(
+        GeoDataFrame(
+            {"name": np.arange(n_shapes).astype(str), "well": np.array(["A1", "B1", "C1"])[np.arange(n_shapes) % 3]},
+            geometry=polygons,
+        )
+    )
+
+
+def calibration_points(points: np.ndarray) -> PointsModel:
+    """Calibration points as PointsModel"""
+    return PointsModel.parse(pd.DataFrame(points, columns=["x", "y"]))
+
+
+def precursor_report(n_rows: int, n_proteins: int = 10_000, rows_per_run: int = 100_000) -> str:
+    """AlphaDIA precursor report in parquet format (`alphadia_parquet` reader) with n_rows precursors
+
+    The report is written in row groups, so that reports larger than the available memory can be generated.
+    """
+    n_runs = max(2, n_rows // rows_per_run)
+    row_group_size = 1_000_000
+
+    def write(path: str) -> None:
+        rng = np.random.default_rng(0)
+        sequences = np.array(["PEPTIDEK", "ACDEFGHIK", "LMNPQRSTK", "VWYACDEFR", "GHIKLMNPR"])
+        writer = None
+        for start in range(0, n_rows, row_group_size):
+            n = min(row_group_size, n_rows - start)
+            proteins = rng.integers(0, n_proteins, size=n)
+            df = pd.DataFrame(
+                {
+                    "run": pd.Categorical.from_codes(
+                        rng.integers(0, n_runs, size=n), categories=[f"run_{idx}" for idx in range(n_runs)]
+                    ).astype(str),
+                    "sequence": sequences[rng.integers(0, len(sequences), size=n)],
+                    "charge": rng.integers(1, 5, size=n),
+                    "mods": "",
+                    "mod_sites": "",
+                    "proteins": np.char.add("P", proteins.astype(str)),
+                    "intensity": rng.lognormal(12, 2, size=n),
+                    "rt_observed": rng.uniform(0, 60, size=n),
+                    "precursor_idx": np.arange(start, start + n),
+                }
+            )
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+        writer.close()
+
+    return _cached(f"precursors_{n_rows}.parquet", write)
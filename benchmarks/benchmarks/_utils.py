@@ -0,0 +1,26 @@
+"""Measurements that are not covered by the asv benchmark types"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import dask
+import dask.array as da
+
+
+def throughput(func: Callable[[], Any], n_items: int) -> float:
+    """Number of items processed per second by a single call of func"""
+    start = time.perf_counter()
+    func()
+    return n_items / (time.perf_counter() - start)
+
+
+def tasks_per_second(array: da.Array) -> float:
+    """Number of chunks of a lazy image that are read per second with the threaded scheduler
+
+    The chunks are reduced immediately, so that the image is never held in memory as a whole.
+    """
+    n_tasks = array.npartitions
+    reduced = array.max()
+    with dask.config.set(scheduler="threads"):
+        return throughput(reduced.compute, n_tasks)
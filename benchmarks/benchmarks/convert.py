@@ -0,0 +1,41 @@
+"""Benchmarks of the conversion of slide images to OME-Zarr"""
+
+import os
+import tempfile
+
+from dvpio.convert import convert_image
+
+from ._data import czi_image, sizes
+from ._utils import throughput
+
+CHUNK_SIZE = (1024, 1024)
+
+
+class ConvertImage:
+    params = sizes(8192, 32768)
+    param_names = ["size"]
+    timeout = 1800
+
+    def setup(self, size: int) -> None:
+        self.path = czi_image(size)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def teardown(self, size: int) -> None:
+        self.tmp_dir.cleanup()
+
+    def convert(self) -> None:
+        # Finished conversions are not repeated, write every repetition to a new store
+        store = os.path.join(tempfile.mkdtemp(dir=self.tmp_dir.name), "image.zarr")
+        convert_image(self.path, store, image_type="czi", chunk_size=CHUNK_SIZE)
+
+    def time_convert_image(self, size: int) -> None:
+        self.convert()
+
+    def peakmem_convert_image(self, size: int) -> None:
+        self.convert()
+
+    def track_tasks_per_second(self, size: int) -> float:
+        n_chunks = -(-size // CHUNK_SIZE[0]) * -(-size // CHUNK_SIZE[1])
+        return throughput(self.convert, n_chunks)
+
+    track_tasks_per_second.unit = "tasks/s"
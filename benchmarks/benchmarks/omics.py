@@ -0,0 +1,55 @@
+"""Benchmarks of reading precursor reports"""
+
+import warnings
+
+from dvpio.read.omics import read_precursor_table
+from dvpio.read.omics._anndata import AnnDataFactory
+
+from ._data import precursor_report, sizes
+from ._utils import throughput
+
+READER_TYPE = "alphadia_parquet"
+
+
+class ReadPrecursorTable:
+    params = sizes(10**6, 10**7, 10**8)
+    param_names = ["n_rows"]
+    timeout = 3600
+
+    def setup(self, n_rows: int) -> None:
+        self.path = precursor_report(n_rows)
+        warnings.simplefilter("ignore")
+
+    def time_read_precursor_table(self, n_rows: int) -> None:
+        read_precursor_table(self.path, reader_type=READER_TYPE)
+
+    def peakmem_read_precursor_table(self, n_rows: int) -> None:
+        read_precursor_table(self.path, reader_type=READER_TYPE)
+
+    def track_rows_per_second(self, n_rows: int) -> float:
+        return throughput(lambda: read_precursor_table(self.path, reader_type=READER_TYPE), n_rows)
+
+    track_rows_per_second.unit = "rows/s"
+
+
+class CreateAnnData:
+    """Conversion of the loaded report to AnnData, excluding parsing of the file"""
+
+    params = sizes(10**6, 10**7, 10**8)
+    param_names = ["n_rows"]
+    timeout = 3600
+
+    def setup(self, n_rows: int) -> None:
+        warnings.simplefilter("ignore")
+        self.factory = AnnDataFactory.from_files(precursor_report(n_rows), reader_type=READER_TYPE)
+
+    def time_create_anndata(self, n_rows: int) -> None:
+        self.factory.create_anndata()
+
+    def peakmem_create_anndata(self, n_rows: int) -> None:
+        self.factory.create_anndata()
+
+    def track_rows_per_second(self, n_rows: int) -> float:
+        return throughput(self.factory.create_anndata, n_rows)
+
+    track_rows_per_second.unit = "rows/s"
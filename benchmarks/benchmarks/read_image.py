@@ -0,0 +1,115 @@
+"""Benchmarks of the image readers
+
+Every reader is benchmarked for the construction of the lazy image (metadata parsing and graph construction),
+for reading the full image, and for reading a small region of interest.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from dvpio.read.image import read_czi, read_openslide, read_tiff
+from dvpio.read.image._utils import _compute_chunks, _read_chunks
+
+from ._data import czi_image, openslide_image, sizes, tiff_image
+from ._utils import tasks_per_second
+
+CHUNK_SIZE = (1024, 1024)
+# Region of interest (x, y, width, height) in the center of the slide
+ROI_SIZE = 2048
+
+
+class _ImageReader(ABC):
+    """Common benchmarks of all image readers, subclasses define the dataset and the reader"""
+
+    params = sizes(8192, 32768)
+    param_names = ["size"]
+    # Generating the largest datasets takes a few minutes on the first run
+    timeout = 1800
+
+    @abstractmethod
+    def read(self, **kwargs):
+        """Read the dataset lazily, keyword arguments are passed to the reader"""
+
+    @abstractmethod
+    def setup(self, size: int) -> None:
+        """Generate the dataset of the given size and store its path in `self.path`"""
+
+    def time_construct(self, size: int) -> None:
+        self.read()
+
+    def time_compute(self, size: int) -> None:
+        self.read().data.max().compute()
+
+    def peakmem_compute(self, size: int) -> None:
+        self.read().data.max().compute()
+
+    def time_compute_roi(self, size: int) -> None:
+        offset = (size - ROI_SIZE) // 2
+        self.read(roi=(offset, offset, ROI_SIZE, ROI_SIZE)).data.compute()
+
+    def track_tasks_per_second(self, size: int) -> float:
+        return tasks_per_second(self.read().data)
+
+    track_tasks_per_second.unit = "tasks/s"
+
+
+class ReadCZI(_ImageReader):
+    def setup(self, size: int) -> None:
+        self.path = czi_image(size)
+
+    def read(self, **kwargs):
+        return read_czi(self.path, chunk_size=CHUNK_SIZE, **kwargs)
+
+    def time_compute_auto_chunks(self, size: int) -> None:
+        read_czi(self.path, chunk_size="auto").data.max().compute()
+
+
+class ReadTIFF(_ImageReader):
+    def setup(self, size: int) -> None:
+        self.path = tiff_image(size)
+
+    def read(self, roi=None, **kwargs):
+        image = read_tiff(self.path, chunk_size=CHUNK_SIZE, pyramidal=False, **kwargs)
+        if roi is not None:
+            x, y, width, height = roi
+            image = image[:, y : y + height, x : x + width]
+        return image
+
+    def time_construct_pyramidal(self, size: int) -> None:
+        read_tiff(self.path, chunk_size=CHUNK_SIZE, pyramidal=True)
+
+
+class ReadOpenslide(_ImageReader):
+    def setup(self, size: int) -> None:
+        self.path = openslide_image(size)
+
+    def read(self, **kwargs):
+        return read_openslide(self.path, chunk_size=CHUNK_SIZE, pyramidal=False, **kwargs)
+
+
+class ReadChunks:
+    """Construction and slicing of the lazy image, independent of the file format"""
+
+    params = sizes(10**4, 10**6)
+    param_names = ["n_tiles"]
+
+    def setup(self, n_tiles: int) -> None:
+        n_tiles_per_axis = int(np.sqrt(n_tiles))
+        self.coords = _compute_chunks(
+            dimensions=(n_tiles_per_axis * 256, n_tiles_per_axis * 256), chunk_size=(256, 256)
+        )
+        self.array = self.read_chunks()
+
+    @staticmethod
+    def _get_tile(slide, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        return np.zeros((1, height, width), dtype=np.uint8)
+
+    def read_chunks(self):
+        return _read_chunks(self._get_tile, slide=None, coords=self.coords, n_channel=1, dtype=np.uint8)
+
+    def time_read_chunks(self, n_tiles: int) -> None:
+        self.read_chunks()
+
+    def time_compute_single_tile(self, n_tiles: int) -> None:
+        self.array[:, :256, :256].compute(scheduler="synchronous")
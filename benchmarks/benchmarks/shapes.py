@@ -0,0 +1,102 @@
+"""Benchmarks of reading, transforming, and writing LMD shapes"""
+
+import os
+import tempfile
+
+from spatialdata.transformations import Affine, set_transformation
+
+from dvpio.read.shapes import read_lmd, transform_shapes
+from dvpio.write import write_lmd
+
+from ._data import CALIBRATION_POINTS_IMAGE, CALIBRATION_POINTS_LMD, calibration_points, lmd_shapes, shapes, sizes
+from ._utils import throughput
+
+
+class ReadLMD:
+    params = sizes(10**4, 10**5, 10**6)
+    param_names = ["n_shapes"]
+    timeout = 1800
+
+    def setup(self, n_shapes: int) -> None:
+        self.path = lmd_shapes(n_shapes)
+        self.calibration_points = calibration_points(CALIBRATION_POINTS_IMAGE)
+
+    def time_read_lmd(self, n_shapes: int) -> None:
+        read_lmd(self.path, calibration_points_image=self.calibration_points)
+
+    def peakmem_read_lmd(self, n_shapes: int) -> None:
+        read_lmd(self.path, calibration_points_image=self.calibration_points)
+
+    def track_shapes_per_second(self, n_shapes: int) -> float:
+        return throughput(lambda: read_lmd(self.path, calibration_points_image=self.calibration_points), n_shapes)
+
+    track_shapes_per_second.unit = "shapes/s"
+
+
+class TransformShapes:
+    params = sizes(10**4, 10**5, 10**6)
+    param_names = ["n_shapes"]
+    timeout = 600
+
+    def setup(self, n_shapes: int) -> None:
+        self.shapes = shapes(n_shapes)
+        self.calibration_points_source = calibration_points(CALIBRATION_POINTS_LMD)
+        self.calibration_points_target = calibration_points(CALIBRATION_POINTS_IMAGE)
+
+    def transform(self):
+        return transform_shapes(
+            self.shapes,
+            calibration_points_target=self.calibration_points_target,
+            calibration_points_source=self.calibration_points_source,
+        )
+
+    def time_transform_shapes(self, n_shapes: int) -> None:
+        self.transform()
+
+    def peakmem_transform_shapes(self, n_shapes: int) -> None:
+        self.transform()
+
+    def track_shapes_per_second(self, n_shapes: int) -> float:
+        return throughput(self.transform, n_shapes)
+
+    track_shapes_per_second.unit = "shapes/s"
+
+
+class WriteLMD:
+    params = sizes(10**4, 10**5, 10**6)
+    param_names = ["n_shapes"]
+    timeout = 1800
+
+    def setup(self, n_shapes: int) -> None:
+        self.shapes = shapes(n_shapes)
+        set_transformation(
+            self.shapes,
+            Affine([[2, 0, 0], [0, 2, 0], [0, 0, 1]], input_axes=("x", "y"), output_axes=("x", "y")),
+            to_coordinate_system="to_lmd",
+        )
+        self.calibration_points = calibration_points(CALIBRATION_POINTS_IMAGE)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "shapes.xml")
+
+    def teardown(self, n_shapes: int) -> None:
+        self.tmp_dir.cleanup()
+
+    def write(self) -> None:
+        write_lmd(
+            self.path,
+            annotation=self.shapes,
+            calibration_points=self.calibration_points,
+            annotation_name_column="name",
+            annotation_well_column="well",
+        )
+
+    def time_write_lmd(self, n_shapes: int) -> None:
+        self.write()
+
+    def peakmem_write_lmd(self, n_shapes: int) -> None:
+        self.write()
+
+    def track_shapes_per_second(self, n_shapes: int) -> float:
+        return throughput(self.write, n_shapes)
+
+    track_shapes_per_second.unit = "shapes/s"
@@ -0,0 +1,3 @@
+from .image import convert_image
+
+__all__ = ["convert_image"]
@@ -0,0 +1,412 @@
+"""Streaming conversion of slide images to OME-Zarr"""
+
+import inspect
+import itertools
+import json
+import os
+import shutil
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from typing import Any, Literal
+
+import dask
+import dask.array as da
+import numpy as np
+import spatialdata as sd
+import zarr
+from dask.optimization import cull
+from dask.utils import parse_bytes
+from xarray import DataArray, Dataset, DataTree
+
+from dvpio.read.image import read_czi, read_openslide
+
+# Stored next to the zarr metadata of the converted element
+_MANIFEST_NAME = ".dvpio_convert.json"
+# Number of finished chunks after which the manifest is persisted
+_MANIFEST_FLUSH_INTERVAL = 64
+
+_READERS: dict[str, Callable[..., DataArray | DataTree]] = {"czi": read_czi, "openslide": read_openslide}
+
+
+def _get_levels(element: DataArray | DataTree) -> list[da.Array]:
+    """Return the dask arrays of all scales of an image, from highest to lowest resolution"""
+    if isinstance(element, DataArray):
+        return [element.data]
+    scales = sorted(element.children, key=lambda scale: int(scale.removeprefix("scale")))
+    return [next(iter(element[scale].data_vars.values())).data for scale in scales]
+
+
+def _is_regular(chunks: tuple[tuple[int, ...], ...]) -> bool:
+    """Whether all chunks along every axis have the same size except for a smaller last chunk"""
+    return all(len(set(c[:-1])) <= 1 and c[-1] <= c[0] for c in chunks)
+
+
+def _first_chunk(element: DataArray | DataTree) -> DataArray | DataTree:
+    """All-zero first chunk of every scale of an image, with its coordinates and transformations
+
+    Used as a stand-in for the image that defines the metadata and the (regular) chunk grid of the store.
+    """
+
+    def first_chunk(array: DataArray) -> DataArray:
+        head = array[tuple(slice(0, size) for size in array.data.chunksize)]
+        return head.copy(data=da.zeros(head.shape, dtype=head.dtype, chunks=-1))
+
+    if isinstance(element, DataArray):
+        return first_chunk(element)
+    return DataTree.from_dict(
+        {
+            scale: Dataset({name: first_chunk(array) for name, array in element[scale].data_vars.items()})
+            for scale in element.children
+        }
+    )
+
+
+def _write_template(element: DataArray | DataTree, store: str, element_name: str) -> None:
+    """Write the metadata and the empty arrays of an image without computing any of its chunks
+
+    The first chunk of every scale is written with spatialdata and the arrays are resized to the shape of the scale
+    afterwards, so that the chunks of the image can be written directly into the arrays.
+    """
+    sdata = sd.SpatialData(images={element_name: _first_chunk(element)})
+    sdata.write(store)
+
+    group = zarr.open_group(os.path.join(store, "images", element_name), mode="r+")
+    shapes = [level.shape for level in _get_levels(element)]
+    for path, shape in zip(_get_dataset_paths(group), shapes, strict=True):
+        group[path].resize(shape)
+
+    # The scales of the pyramid are defined by the shapes of the arrays
+    attrs = group.attrs.asdict()
+    multiscale = attrs.get("ome", attrs)["multiscales"][0]
+    for dataset, shape in zip(multiscale["datasets"], shapes, strict=True):
+        for transformation in dataset["coordinateTransformations"]:
+            if transformation["type"] == "scale":
+                transformation["scale"] = [full / size for full, size in zip(shapes[0], shape, strict=True)]
+    group.attrs.update(attrs)
+    sdata.write_consolidated_metadata()
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize numpy values and other reader arguments that are not supported by json"""
+    if isinstance(value, np.generic | np.ndarray):
+        return value.tolist()
+    return repr(value)
+
+
+def _reader_arguments(image_type: str, path: str, kwargs: dict[str, Any]) -> str:
+    """Normalized reader arguments as json string, including all defaults of the reader
+
+    Arguments that are passed explicitly with their default value and omitted arguments result in the same string.
+    """
+    reader = _READERS[image_type]
+    arguments = inspect.signature(reader).bind(path, **kwargs)
+    arguments.apply_defaults()
+    arguments = dict(arguments.arguments)
+    # Identified by the source file
+    arguments.pop("path")
+    return json.dumps(arguments, sort_keys=True, default=_json_default)
+
+
+def _fingerprint(path: str, image_type: str, kwargs: dict[str, Any], levels: list[da.Array]) -> dict[str, Any]:
+    """Identify a conversion by its source file, the reader arguments, and the layout of the target arrays"""
+    stat = os.stat(path)
+    return {
+        "source": path,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "image_type": image_type,
+        "kwargs": _reader_arguments(image_type, path, kwargs),
+        "levels": [
+            # Finished chunks are recorded as indices of the chunk grid of the source
+            {"shape": list(level.shape), "chunks": [list(chunks) for chunks in level.chunks], "dtype": level.dtype.str}
+            for level in levels
+        ],
+    }
+
+
+def _write_manifest(path: str, manifest: dict[str, Any]) -> None:
+    """Atomically replace the manifest file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, path)
+
+
+def _read_manifest(path: str) -> dict[str, Any] | None:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _get_dataset_paths(group: zarr.Group) -> list[str]:
+    """Paths of the arrays of all scales of an OME-Zarr image group"""
+    attrs = group.attrs.asdict()
+    # NGFF >= 0.5 nests the metadata under `ome`
+    multiscales = attrs.get("ome", attrs)["multiscales"]
+    return [dataset["path"] for dataset in multiscales[0]["datasets"]]
+
+
+def _compute_block(graph: Mapping, key: tuple) -> np.ndarray:
+    """Compute a single block from the materialized graph of an array"""
+    subgraph, _ = cull(graph, [key])
+    return np.asarray(dask.get(subgraph, key))
+
+
+class _ChunkLocks:
+    """Locks of the chunks of a zarr array
+
+    Writes of a region that only covers a part of a chunk read, update, and write the full chunk. Concurrent writes
+    to different parts of the same chunk are serialized, so that no update is lost.
+    """
+
+    def __init__(self, chunks: tuple[int, ...]) -> None:
+        self.chunks = chunks
+        self._locks: dict[tuple[int, ...], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def hold(self, region: tuple[slice, ...]) -> Iterator[None]:
+        """Hold the locks of all chunks that overlap with the region"""
+        # Locks are always acquired in the same (lexicographic) order, which prevents deadlocks
+        keys = itertools.product(
+            *(range(s.start // size, (s.stop - 1) // size + 1) for s, size in zip(region, self.chunks, strict=True))
+        )
+        with self._lock:
+            locks = [self._locks.setdefault(key, threading.Lock()) for key in keys]
+        with ExitStack() as stack:
+            for lock in locks:
+                stack.enter_context(lock)
+            yield
+
+
+def _write_block(
+    graph: Mapping,
+    name: str,
+    array: zarr.Array,
+    level: da.Array,
+    index: tuple[int, ...],
+    locks: _ChunkLocks | None = None,
+) -> None:
+    """Compute a single block and write it to the corresponding region of the zarr array
+
+    If the block is not aligned with the zarr chunks, `locks` serialize writes to shared chunks.
+    """
+    block = _compute_block(graph, (name, *index))
+    region = tuple(slice(sum(chunks[:i]), sum(chunks[: i + 1])) for chunks, i in zip(level.chunks, index, strict=True))
+    if locks is None:
+        array[region] = block
+        return
+    with locks.hold(region):
+        array[region] = block
+
+
+def _stream_element(
+    element: DataArray | DataTree,
+    store: str,
+    element_name: str,
+    fingerprint: Callable[[list[da.Array]], dict[str, Any]],
+    n_workers: int = 4,
+    memory_limit: int | str | None = None,
+    overwrite: bool = False,
+) -> None:
+    """Stream all chunks of a lazy image into a SpatialData zarr store
+
+    The store layout and metadata are written first with an empty image. Afterwards, chunks are computed
+    and written independently. Finished chunks are recorded in a manifest, so that an interrupted
+    conversion can be resumed by calling the function with the same arguments.
+
+    Every chunk of the source is computed once and written to its region of the zarr arrays. Irregular chunk
+    grids (e.g. chunks aligned to CZI subblocks) are not rechunked, which would read source chunks repeatedly,
+    instead the zarr arrays use a regular grid of the largest chunk size and writes to shared zarr chunks are
+    serialized.
+
+    Parameters
+    ----------
+    element
+        Lazy image (single or multiscale)
+    store
+        Path to the zarr store
+    element_name
+        Name of the image in the store
+    fingerprint
+        Function that identifies the conversion given the dask arrays of all scales
+    n_workers
+        Number of threads that compute and write chunks
+    memory_limit
+        Approximate upper bound of the memory used by chunks in flight
+    overwrite
+        Whether to replace an existing store that does not belong to the same conversion
+    """
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be a positive integer, not {n_workers}")
+
+    levels = _get_levels(element)
+
+    group_path = os.path.join(store, "images", element_name)
+    manifest_path = os.path.join(group_path, _MANIFEST_NAME)
+
+    expected = fingerprint(levels)
+    manifest = _read_manifest(manifest_path)
+
+    if manifest is not None and manifest["fingerprint"] != expected:
+        if not overwrite:
+            raise ValueError(f"Store {store} belongs to a different conversion and overwrite is False")
+        manifest = None
+    if manifest is None and os.path.exists(store):
+        if not overwrite:
+            raise ValueError(f"Path {store} exists and overwrite is False")
+        shutil.rmtree(store)
+
+    if manifest is None:
+        _write_template(element, store, element_name)
+        manifest = {"fingerprint": expected, "complete": False, "done": [[] for _ in levels]}
+        _write_manifest(manifest_path, manifest)
+
+    if manifest["complete"]:
+        return
+
+    group = zarr.open_group(group_path, mode="r+")
+    arrays = [group[path] for path in _get_dataset_paths(group)]
+    # Source chunks that are not aligned with the zarr chunks (or shards) share zarr chunks with other source chunks
+    locks = []
+    for level, array in zip(levels, arrays, strict=True):
+        write_chunks = getattr(array, "shards", None) or array.chunks
+        aligned = _is_regular(level.chunks) and tuple(level.chunksize) == tuple(write_chunks)
+        locks.append(None if aligned else _ChunkLocks(write_chunks))
+
+    # Bound the number of chunks that are held in memory at the same time
+    max_chunk_bytes = max(np.prod(level.chunksize) * level.dtype.itemsize for level in levels)
+    max_in_flight = n_workers
+    if memory_limit is not None:
+        memory_limit = parse_bytes(memory_limit) if isinstance(memory_limit, str) else memory_limit
+        max_in_flight = int(max(1, min(n_workers, memory_limit // max_chunk_bytes)))
+
+    done = [set(level_done) for level_done in manifest["done"]]
+    n_pending_flush = 0
+    level_idx, in_flight = 0, {}
+
+    def flush() -> None:
+        manifest["done"] = [sorted(level_done) for level_done in done]
+        _write_manifest(manifest_path, manifest)
+
+    executor = ThreadPoolExecutor(max_workers=n_workers)
+    try:
+        for level_idx, (level, array) in enumerate(zip(levels, arrays, strict=True)):
+            # Materialize the graph once, single blocks are culled from it
+            graph = dict(level.__dask_graph__())
+            in_flight: dict[Future, int] = {}
+
+            for flat_index in range(int(np.prod(level.numblocks))):
+                if flat_index in done[level_idx]:
+                    continue
+                if len(in_flight) >= max_in_flight:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        future.result()
+                        done[level_idx].add(in_flight.pop(future))
+                        n_pending_flush += 1
+                index = tuple(map(int, np.unravel_index(flat_index, level.numblocks)))
+                future = executor.submit(_write_block, graph, level.name, array, level, index, locks[level_idx])
+                in_flight[future] = flat_index
+
+                if n_pending_flush >= _MANIFEST_FLUSH_INTERVAL:
+                    flush()
+                    n_pending_flush = 0
+
+            for future in wait(in_flight).done:
+                future.result()
+                done[level_idx].add(in_flight.pop(future))
+    finally:
+        # Wait for running chunks before progress is recorded, also if a chunk failed
+        executor.shutdown(wait=True, cancel_futures=True)
+        for future in list(in_flight):
+            if not future.cancelled() and future.exception() is None:
+                done[level_idx].add(in_flight.pop(future))
+        flush()
+
+    manifest["complete"] = True
+    flush()
+
+
+def convert_image(
+    path: str,
+    store: str,
+    image_type: Literal["czi", "openslide"],
+    element_name: str = "image",
+    n_workers: int = 4,
+    memory_limit: int | str | None = None,
+    overwrite: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Convert a slide image to a SpatialData zarr store (OME-Zarr image)
+
+    The slide is read lazily and streamed chunk by chunk to disk, so that images larger than the
+    available memory can be converted. Chunks are computed and written in parallel by `n_workers` threads,
+    and at most `n_workers` chunks are held in memory at the same time. Finished chunks are recorded in a manifest
+    within the store. If a conversion is interrupted, calling the function again with the same arguments
+    resumes the conversion and only writes the missing chunks.
+
+    Parameters
+    ----------
+    path
+        Path to the slide image
+    store
+        Path to the zarr store that is created
+    image_type
+        Type of the slide image. `czi` uses :func:`dvpio.read.image.read_czi` and
+        `openslide` uses :func:`dvpio.read.image.read_openslide`
+    element_name
+        Name of the image element in the store
+    n_workers
+        Number of threads that read and write chunks in parallel
+    memory_limit
+        Approximate upper bound for the memory used by chunks that are processed at the same time,
+        either in bytes or as string (e.g. `"2GiB"`). Reduces the number of parallel chunks if necessary.
+        Defaults to `None` (`n_workers` chunks)
+    overwrite
+        Whether to replace an existing store that does not belong to the same conversion, i.e. that was created
+        from a different or modified file, or with a different image type or reader arguments.
+        Unfinished conversions of the same file with the same arguments are always resumed.
+    kwargs
+        Passed to the reader, e.g. `chunk_size`, which also defines the chunk size of the zarr arrays.
+        The arguments must select a single image, e.g. not `scene="all"` or multiple timepoints
+        for :func:`dvpio.read.image.read_czi`
+
+    Returns
+    -------
+    None
+        Saves to store, the result can be read with :func:`spatialdata.read_zarr`
+
+    Example
+    -------
+    .. code-block:: python
+
+        from dvpio.convert import convert_image
+        import spatialdata as sd
+
+        convert_image("slide.czi", "slide.zarr", image_type="czi", chunk_size=(4096, 4096), pyramidal=True)
+        sdata = sd.read_zarr("slide.zarr")
+    """
+    if image_type not in _READERS:
+        raise ValueError(f"Parameter image_type needs to be one of {list(_READERS)}, not {image_type}")
+
+    path = os.path.abspath(path)
+    element = _READERS[image_type](path, **kwargs)
+    if isinstance(element, dict):
+        raise ValueError(
+            f"The reader returned multiple images ({list(element)}), convert_image converts a single image. "
+            "Select a single scene or timepoint, or convert them separately"
+        )
+
+    _stream_element(
+        element,
+        store=store,
+        element_name=element_name,
+        fingerprint=lambda levels: _fingerprint(path, image_type, kwargs, levels),
+        n_workers=n_workers,
+        memory_limit=memory_limit,
+        overwrite=overwrite,
+    )
@@ -1,6 +1,33 @@
-from ._metadata import read_metadata
+from ._cache import clear_tile_cache, configure_disk_tile_cache, configure_tile_cache, tile_cache_info
+from ._instrument import (
+    TileEvent,
+    TileReadSummary,
+    add_tile_event_callback,
+    record_tile_events,
+    remove_tile_event_callback,
+)
+from ._metadata import read_metadata, scan_metadata
+from .coverage import read_coverage_mask
 from .custom import read_custom
 from .czi import read_czi
 from .openslide import read_openslide
+from .tiff import read_tiff
 
-__all__ = ["read_czi", "read_openslide", "read_custom", "read_metadata"]
+__all__ = [
+    "read_czi",
+    "read_openslide",
+    "read_tiff",
+    "read_custom",
+    "read_metadata",
+    "scan_metadata",
+    "read_coverage_mask",
+    "configure_tile_cache",
+    "configure_disk_tile_cache",
+    "tile_cache_info",
+    "clear_tile_cache",
+    "record_tile_events",
+    "add_tile_event_callback",
+    "remove_tile_event_callback",
+    "TileEvent",
+    "TileReadSummary",
+]
@@ -0,0 +1,439 @@
+"""Caches for decoded image tiles"""
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Literal
+
+import numpy as np
+from dask.utils import parse_bytes
+from numcodecs import Blosc
+from numpy.typing import NDArray
+
+from ._instrument import _set_cache_status
+
+_EVICTION_POLICIES = ("lru", "fifo")
+# The disk cache is trimmed to this fraction of its maximum size, so that the directory is not rescanned on every write
+_DISK_EVICTION_LOW_WATER_MARK = 0.9
+
+
+class _TileCache:
+    """Process-wide, byte-bounded cache of decoded tiles
+
+    Tiles are stored as copies and returned as copies, so that callers can safely modify them.
+    The cache is shared between all threads of a process and guarded by a lock.
+
+    Parameters
+    ----------
+    max_bytes
+        Maximum size of all cached tiles in bytes. `0` disables the cache
+    policy
+        Which tile is evicted first if the cache is full.
+
+            - `lru`: least recently used tile
+            - `fifo`: least recently added tile
+    """
+
+    def __init__(self, max_bytes: int | str = 0, policy: Literal["lru", "fifo"] = "lru") -> None:
+        self._lock = threading.Lock()
+        self._tiles: OrderedDict[Hashable, NDArray] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.configure(max_bytes=max_bytes, policy=policy)
+
+    def configure(self, max_bytes: int | str | None = None, policy: Literal["lru", "fifo"] | None = None) -> None:
+        """Change the byte budget or eviction policy, evicts tiles if required"""
+        if policy is not None:
+            if policy not in _EVICTION_POLICIES:
+                raise ValueError(f"policy must be one of {_EVICTION_POLICIES}, not {policy}")
+            self.policy = policy
+
+        if max_bytes is not None:
+            max_bytes = parse_bytes(max_bytes) if isinstance(max_bytes, str) else max_bytes
+            if max_bytes < 0:
+                raise ValueError(f"max_bytes must be non-negative, not {max_bytes}")
+            with self._lock:
+                self.max_bytes = max_bytes
+                self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: Hashable) -> NDArray | None:
+        """Return a copy of the cached tile or None"""
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.policy == "lru":
+                self._tiles.move_to_end(key)
+        return tile.copy()
+
+    def put(self, key: Hashable, tile: NDArray) -> None:
+        """Store a copy of the tile, tiles larger than the budget are not stored"""
+        if tile.nbytes > self.max_bytes:
+            return
+        tile = tile.copy()
+        with self._lock:
+            if key in self._tiles:
+                self.nbytes -= self._tiles.pop(key).nbytes
+            self._tiles[key] = tile
+            self.nbytes += tile.nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes:
+            _, tile = self._tiles.popitem(last=False)
+            self.nbytes -= tile.nbytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all tiles and reset counters"""
+        with self._lock:
+            self._tiles.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "n_tiles": len(self._tiles),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "policy": self.policy,
+            }
+
+
+class _DiskTileCache:
+    """Persistent, size-capped cache of decoded tiles in a local directory
+
+    Tiles are stored as Blosc (zstd) compressed `.npy` files in one subdirectory per slide file. Files are written
+    atomically, so that multiple threads and processes can share the same directory. The modification time of a tile
+    file is updated on every access. Once the directory exceeds `max_bytes`, the least recently used tiles are deleted
+    until the directory is below 90% of `max_bytes`.
+
+    Parameters
+    ----------
+    directory
+        Cache directory on a local disk. `None` disables the cache
+    max_bytes
+        Maximum size of all cached tiles on disk in bytes
+    clevel
+        Compression level of zstd
+    """
+
+    _SUFFIX = ".npy.zst"
+
+    def __init__(self, directory: str | None = None, max_bytes: int | str = "10GiB", clevel: int = 3) -> None:
+        self._lock = threading.Lock()
+        # Held by the thread that scans the directory and deletes tiles
+        self._evict_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.configure(directory=directory, max_bytes=max_bytes, clevel=clevel)
+
+    def configure(self, directory: str | None, max_bytes: int | str = "10GiB", clevel: int = 3) -> None:
+        max_bytes = parse_bytes(max_bytes) if isinstance(max_bytes, str) else max_bytes
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be non-negative, not {max_bytes}")
+
+        with self._lock:
+            self.directory = os.path.abspath(directory) if directory is not None else None
+            self.max_bytes = max_bytes
+            self._codec = Blosc(cname="zstd", clevel=clevel, shuffle=Blosc.SHUFFLE)
+            self.nbytes = 0
+            if self.directory is not None:
+                os.makedirs(self.directory, exist_ok=True)
+
+        if self.directory is not None:
+            self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None and self.max_bytes > 0
+
+    def _path(self, key: tuple[Hashable, ...]) -> str:
+        """Tiles are grouped by slide file (first element of key)"""
+        slide, tile = key[0], key[1:]
+        slide_digest = hashlib.sha1(repr(slide).encode()).hexdigest()
+        tile_digest = hashlib.sha1(repr(tile).encode()).hexdigest()
+        return os.path.join(self.directory, slide_digest, f"{tile_digest}{self._SUFFIX}")
+
+    def _scan(self) -> list[tuple[float, str, int]]:
+        """Return (last access, path, size) of all cached tiles"""
+        files = []
+        for slide_dir in os.scandir(self.directory):
+            if not slide_dir.is_dir():
+                continue
+            for entry in os.scandir(slide_dir.path):
+                if entry.name.endswith(self._SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        # Removed by another process
+                        continue
+                    files.append((stat.st_mtime, entry.path, stat.st_size))
+        return files
+
+    def get(self, key: tuple[Hashable, ...]) -> NDArray | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return np.load(io.BytesIO(self._codec.decode(data)), allow_pickle=False)
+
+    def put(self, key: tuple[Hashable, ...], tile: NDArray) -> None:
+        buffer = io.BytesIO()
+        np.save(buffer, tile, allow_pickle=False)
+        data = self._codec.encode(buffer.getvalue())
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        # Size of a replaced tile of the same key
+        try:
+            replaced_size = os.stat(path).st_size
+        except FileNotFoundError:
+            replaced_size = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.nbytes += len(data) - replaced_size
+            exceeded = self.nbytes > self.max_bytes
+        if exceeded:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used tiles until the cache is below the low water mark, if it exceeds max_bytes
+
+        The directory is scanned without holding the lock of the cache, so that other threads can read and write tiles
+        in the meantime. Only one thread evicts at a time, other threads skip the eviction.
+        """
+        if not self._evict_lock.acquire(blocking=False):
+            return
+        try:
+            # Other processes might write to the same directory, recount from disk
+            files = sorted(self._scan())
+            nbytes = sum(size for _, _, size in files)
+            n_evicted = 0
+            if nbytes > self.max_bytes:
+                target = self.max_bytes * _DISK_EVICTION_LOW_WATER_MARK
+                for _, path, size in files:
+                    if nbytes <= target:
+                        break
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        continue
+                    nbytes -= size
+                    n_evicted += 1
+
+            with self._lock:
+                self.nbytes = nbytes
+                self.evictions += n_evicted
+        finally:
+            self._evict_lock.release()
+
+    def clear(self) -> None:
+        """Delete all cached tiles and reset counters"""
+        with self._lock:
+            if self.directory is not None:
+                for _, path, _ in self._scan():
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "directory": self.directory,
+            }
+
+
+_TILE_CACHE = _TileCache()
+_DISK_TILE_CACHE = _DiskTileCache()
+
+
+def _file_identity(path: str) -> tuple[str, int, int]:
+    """Identify a file by its absolute path, modification time and size"""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert (nested) lists and dicts into hashable tuples"""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _read_cached_tile(
+    func: Callable[..., NDArray], cache_key: Hashable, slide: Any, x0: int, y0: int, width: int, height: int, **kwargs
+) -> NDArray:
+    """Read a tile with func, served from the in-memory or on-disk tile cache if possible"""
+    memory, disk = _TILE_CACHE.enabled, _DISK_TILE_CACHE.enabled
+    if not (memory or disk):
+        return func(slide, x0=x0, y0=y0, width=width, height=height, **kwargs)
+
+    key = (cache_key, func.__module__, func.__qualname__, int(x0), int(y0), int(width), int(height), _freeze(kwargs))
+
+    tile = _TILE_CACHE.get(key) if memory else None
+    if tile is not None:
+        _set_cache_status("memory")
+        return tile
+
+    tile = _DISK_TILE_CACHE.get(key) if disk else None
+    if tile is None:
+        _set_cache_status("miss")
+        tile = func(slide, x0=x0, y0=y0, width=width, height=height, **kwargs)
+        if disk:
+            _DISK_TILE_CACHE.put(key, tile)
+    else:
+        _set_cache_status("disk")
+
+    if memory:
+        _TILE_CACHE.put(key, tile)
+    return tile
+
+
+def configure_tile_cache(max_bytes: int | str | None = None, policy: Literal["lru", "fifo"] | None = None) -> None:
+    """Configure the in-memory tile cache of the image readers
+
+    Tiles that are read by :func:`~dvpio.read.image.read_czi` and :func:`~dvpio.read.image.read_openslide`
+    are stored in a process-wide cache. Repeated computations of the same region (e.g. when panning in napari or
+    in multiple analysis passes) are then served from memory instead of decoding the file again.
+    Tiles are identified by file path, modification time, level, channels, scene, and region.
+    The cache is disabled by default.
+
+    Parameters
+    ----------
+    max_bytes
+        Maximum memory used by cached tiles, in bytes or as string (e.g. `"2GiB"`). `0` disables the cache.
+        If `None`, the current value is kept
+    policy
+        Eviction policy if the cache is full. `lru` evicts the least recently used tile, `fifo` evicts the
+        least recently added tile. If `None`, the current value is kept
+
+    Example
+    -------
+    .. code-block:: python
+
+        from dvpio.read.image import configure_tile_cache, read_czi, tile_cache_info
+
+        configure_tile_cache(max_bytes="4GiB")
+        img = read_czi(path)
+        img[:, :1000, :1000].compute()  # Decodes tiles
+        img[:, :1000, :1000].compute()  # Served from cache
+        tile_cache_info()
+    """
+    _TILE_CACHE.configure(max_bytes=max_bytes, policy=policy)
+
+
+def configure_disk_tile_cache(directory: str | None, max_bytes: int | str = "10GiB", clevel: int = 3) -> None:
+    """Configure the persistent on-disk tile cache of the image readers
+
+    Tiles that are read by :func:`~dvpio.read.image.read_czi` and :func:`~dvpio.read.image.read_openslide`
+    are stored compressed in a local directory and reused across sessions. This avoids transferring and decoding
+    the same data again if slides are stored on slow (network) file systems. Cached tiles are identified by
+    file path, modification time, size, and the tile region, and become invalid when the slide file changes.
+    The least recently used tiles are deleted if the cache exceeds `max_bytes`.
+    The cache is disabled by default. If used together with :func:`configure_tile_cache`, tiles are looked up
+    in memory first.
+
+    The configuration applies to the current process. For dask schedulers that start new processes
+    (e.g. `processes` with the spawn start method or `distributed`), configure the cache on the workers.
+
+    Parameters
+    ----------
+    directory
+        Cache directory on a local disk, is created if it does not exist. `None` disables the cache
+    max_bytes
+        Maximum size of the cache directory, in bytes or as string (e.g. `"50GB"`)
+    clevel
+        Compression level (zstd) of the cached tiles
+
+    Example
+    -------
+    .. code-block:: python
+
+        from dvpio.read.image import configure_disk_tile_cache, read_czi
+
+        configure_disk_tile_cache("/scratch/dvpio-cache", max_bytes="100GB")
+        img = read_czi("/nfs/slides/slide.czi")
+    """
+    _DISK_TILE_CACHE.configure(directory=directory, max_bytes=max_bytes, clevel=clevel)
+
+
+def tile_cache_info() -> dict[str, Any]:
+    """Return statistics of the in-memory and on-disk tile caches
+
+    Returns
+    -------
+    dict
+        - hits: Number of tiles served from the cache
+        - misses: Number of tiles that were not cached
+        - evictions: Number of tiles removed from the full cache
+        - n_tiles: Number of cached tiles
+        - nbytes: Memory used by cached tiles in bytes
+        - max_bytes: Maximum memory of the cache in bytes
+        - policy: Eviction policy
+        - disk: Statistics of the on-disk cache (hits, misses, evictions, nbytes, max_bytes, directory)
+    """
+    return {**_TILE_CACHE.info(), "disk": _DISK_TILE_CACHE.info()}
+
+
+def clear_tile_cache(disk: bool = False) -> None:
+    """Remove all tiles from the in-memory tile cache and reset its statistics
+
+    Parameters
+    ----------
+    disk
+        Whether to also delete all tiles of the on-disk cache
+    """
+    _TILE_CACHE.clear()
+    if disk:
+        _DISK_TILE_CACHE.clear()
@@ -0,0 +1,333 @@
+"""Timing events of the tile reads of the image readers"""
+
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+import numpy as np
+
+CacheStatus = Literal["disabled", "miss", "memory", "disk", "empty"]
+
+_CALLBACKS: list[Callable[["TileEvent"], None]] = []
+_CALLBACKS_LOCK = threading.Lock()
+# Event of the tile that is currently read by a thread
+_CURRENT = threading.local()
+
+
+@dataclass
+class TileEvent:
+    """Timing of a single tile read
+
+    Attributes
+    ----------
+    reader
+        Name of the function that reads the tile (e.g. `dvpio.read.image.czi._get_img`)
+    path
+        Slide that the tile is read from
+    x0/y0
+        Upper left corner of the tile in the coordinates of the reader
+    width/height
+        Size of the tile
+    params
+        Additional parameters of the read (e.g. channels, pyramid level, z-plane)
+    start
+        Start of the read (:func:`time.perf_counter` of the process that reads the tile)
+    duration
+        Latency of the read in seconds, including the tile cache and the conversion to (c, y, x) format
+    phases
+        Time in seconds spent in phases of the read. Readers report `decode` (file I/O and decoding by
+        the file format library), `transpose` (conversion to a contiguous (c, y, x) block), and `project`
+        (reduction of z-planes, see `z_projection` in :func:`~dvpio.read.image.read_czi`)
+    nbytes
+        Size of the returned tile in bytes
+    cache
+        Whether the tile was served from the `memory` or `disk` tile cache, read from the file (`miss`),
+        not read since it does not contain image data (`empty`), or read without cache (`disabled`)
+    thread
+        Identifier of the thread that read the tile
+    pid
+        Identifier of the process that read the tile
+    """
+
+    reader: str
+    path: str
+    x0: int
+    y0: int
+    width: int
+    height: int
+    params: dict[str, Any] = field(default_factory=dict)
+    start: float = 0.0
+    duration: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    nbytes: int = 0
+    cache: CacheStatus = "disabled"
+    thread: int = 0
+    pid: int = 0
+
+
+class TileReadSummary:
+    """Collects tile events and summarizes throughput and latencies
+
+    Returned by :func:`dvpio.read.image.record_tile_events`. All statistics are computed from the events
+    recorded so far and are safe to access while tiles are read.
+    """
+
+    def __init__(self) -> None:
+        self._events: list[TileEvent] = []
+        self._lock = threading.Lock()
+
+    def add(self, event: TileEvent) -> None:
+        """Add a tile event"""
+        with self._lock:
+            self._events.append(event)
+
+    @property
+    def events(self) -> list[TileEvent]:
+        """Recorded tile events in order of completion"""
+        with self._lock:
+            return list(self._events)
+
+    @property
+    def n_tiles(self) -> int:
+        """Number of read tiles"""
+        return len(self.events)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the read tiles in bytes"""
+        return sum(event.nbytes for event in self.events)
+
+    @property
+    def wall_time(self) -> float:
+        """Time in seconds from the start of the first to the end of the last tile read"""
+        events = self.events
+        if not events:
+            return 0.0
+        return max(event.start + event.duration for event in events) - min(event.start for event in events)
+
+    @property
+    def busy_time(self) -> float:
+        """Sum of the latencies of all tile reads in seconds
+
+        The ratio of busy time to wall time is the average number of concurrent reads. Values well below the
+        number of threads indicate that time is spent outside of the readers (e.g. dask scheduling or downstream tasks).
+        """
+        return sum(event.duration for event in self.events)
+
+    @property
+    def throughput(self) -> float:
+        """Read bytes per second of wall time"""
+        wall_time = self.wall_time
+        return self.nbytes / wall_time if wall_time > 0 else float("nan")
+
+    @property
+    def tiles_per_second(self) -> float:
+        """Read tiles per second of wall time"""
+        wall_time = self.wall_time
+        return self.n_tiles / wall_time if wall_time > 0 else float("nan")
+
+    @property
+    def cache(self) -> dict[str, int]:
+        """Number of tiles per cache status"""
+        return dict(Counter(event.cache for event in self.events))
+
+    @property
+    def phases(self) -> dict[str, float]:
+        """Total time in seconds spent in each phase of the reads"""
+        totals: Counter[str] = Counter()
+        for event in self.events:
+            totals.update(event.phases)
+        return dict(totals)
+
+    def latency(self, percentiles: tuple[float, ...] = (50, 90, 99)) -> dict[float, float]:
+        """Percentiles of the tile read latencies in seconds
+
+        Parameters
+        ----------
+        percentiles
+            Percentiles in the range [0, 100]
+
+        Returns
+        -------
+        dict
+            Mapping of percentile to latency. Latencies are `nan` if no tiles were read
+        """
+        durations = [event.duration for event in self.events]
+        if not durations:
+            return {q: float("nan") for q in percentiles}
+        return dict(zip(percentiles, np.percentile(durations, percentiles).tolist(), strict=True))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary statistics as dictionary"""
+        return {
+            "n_tiles": self.n_tiles,
+            "nbytes": self.nbytes,
+            "wall_time": self.wall_time,
+            "busy_time": self.busy_time,
+            "throughput": self.throughput,
+            "tiles_per_second": self.tiles_per_second,
+            "latency": self.latency(),
+            "phases": self.phases,
+            "cache": self.cache,
+        }
+
+    def __repr__(self) -> str:
+        latency = self.latency()
+        return (
+            f"{type(self).__name__}(n_tiles={self.n_tiles}, nbytes={self.nbytes}, "
+            f"throughput={self.throughput / 2**20:.1f} MiB/s, "
+            f"latency p50/p90/p99={latency[50] * 1e3:.1f}/{latency[90] * 1e3:.1f}/{latency[99] * 1e3:.1f} ms, "
+            f"cache={self.cache})"
+        )
+
+
+def _instrumented() -> bool:
+    """Whether tile events are recorded"""
+    return bool(_CALLBACKS)
+
+
+@contextmanager
+def _tile_event(
+    reader: str, path: Any, x0: int, y0: int, width: int, height: int, **params: Any
+) -> Iterator[TileEvent]:
+    """Time a tile read and emit its event to all callbacks
+
+    Readers and the tile cache add phases and the cache status to the event of the current thread
+    """
+    event = TileEvent(
+        reader=reader,
+        path=str(path),
+        x0=int(x0),
+        y0=int(y0),
+        width=int(width),
+        height=int(height),
+        params=params,
+        thread=threading.get_ident(),
+        pid=os.getpid(),
+    )
+    _CURRENT.event = event
+    event.start = time.perf_counter()
+    try:
+        yield event
+    finally:
+        event.duration = time.perf_counter() - event.start
+        _CURRENT.event = None
+
+    with _CALLBACKS_LOCK:
+        callbacks = list(_CALLBACKS)
+    for callback in callbacks:
+        callback(event)
+
+
+class _TilePhase:
+    """Add the time spent within the context to a phase of the current tile event
+
+    No-op if no tile event is recorded in the current thread
+    """
+
+    __slots__ = ("name", "event", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.event = getattr(_CURRENT, "event", None)
+        if self.event is not None:
+            self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.event is not None:
+            self.event.phases[self.name] = self.event.phases.get(self.name, 0.0) + time.perf_counter() - self.start
+
+
+def _set_cache_status(status: CacheStatus) -> None:
+    """Set the cache status of the current tile event"""
+    event = getattr(_CURRENT, "event", None)
+    if event is not None:
+        event.cache = status
+
+
+def add_tile_event_callback(callback: Callable[[TileEvent], None]) -> None:
+    """Register a callback that is called with a :class:`~dvpio.read.image.TileEvent` after every tile read
+
+    Tiles of all image readers (:func:`~dvpio.read.image.read_czi`, :func:`~dvpio.read.image.read_openslide`,
+    :func:`~dvpio.read.image.read_tiff`) emit events when the lazy image is computed. Callbacks are called
+    in the thread that read the tile and must be thread-safe. Events are only emitted in the current process,
+    i.e. for the `threads` and `synchronous` dask schedulers. Without registered callbacks, tiles are not timed.
+
+    Parameters
+    ----------
+    callback
+        Function that takes a :class:`~dvpio.read.image.TileEvent`
+
+    Example
+    -------
+    .. code-block:: python
+
+        import logging
+        from dvpio.read.image import add_tile_event_callback
+
+        add_tile_event_callback(lambda event: logging.debug("%s", event))
+    """
+    with _CALLBACKS_LOCK:
+        _CALLBACKS.append(callback)
+
+
+def remove_tile_event_callback(callback: Callable[[TileEvent], None]) -> None:
+    """Remove a callback registered with :func:`~dvpio.read.image.add_tile_event_callback`
+
+    Parameters
+    ----------
+    callback
+        Registered callback
+    """
+    with _CALLBACKS_LOCK:
+        _CALLBACKS.remove(callback)
+
+
+@contextmanager
+def record_tile_events(callback: Callable[[TileEvent], None] | None = None) -> Iterator[TileReadSummary]:
+    """Record the tile reads of all image readers within the context
+
+    Parameters
+    ----------
+    callback
+        Optional function that is additionally called with every :class:`~dvpio.read.image.TileEvent`
+        (see :func:`~dvpio.read.image.add_tile_event_callback`)
+
+    Returns
+    -------
+    :class:`~dvpio.read.image.TileReadSummary`
+        Collects all events within the context and provides throughput, percentile latencies, time spent per phase
+        (`decode`, `transpose`), and cache statistics
+
+    Example
+    -------
+    .. code-block:: python
+
+        from dvpio.read.image import read_czi, record_tile_events
+
+        img = read_czi(path)
+        with record_tile_events() as summary:
+            img.compute()
+
+        summary
+        # > TileReadSummary(n_tiles=12, nbytes=..., throughput=412.3 MiB/s, latency p50/p90/p99=...)
+        summary.latency((50, 95))
+        summary.phases
+        # > {"decode": 3.1, "transpose": 0.4}
+    """
+    summary = TileReadSummary()
+    callbacks = [summary.add] if callback is None else [summary.add, callback]
+    for cb in callbacks:
+        add_tile_event_callback(cb)
+    try:
+        yield summary
+    finally:
+        for cb in callbacks:
+            remove_tile_event_callback(cb)
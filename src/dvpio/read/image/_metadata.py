@@ -1,13 +1,35 @@
+import copy
+import functools
+import os
+import threading
+import warnings
+import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from itertools import repeat
 from typing import Any, ClassVar, Literal
 from warnings import warn
 
 import openslide
-from pydantic import BaseModel
+import pandas as pd
+import xmltodict
+from pydantic import BaseModel, ConfigDict, PrivateAttr, TypeAdapter, field_validator
 from pylibCZIrw.czi import open_czi
+from typing_extensions import TypedDict
+from xarray import DataArray, DataTree
 
 from dvpio._utils import is_parsed
 
+from ._cache import _file_identity
+
+# Parsed metadata of the most recently used files
+_METADATA_CACHE_SIZE = 128
+_METADATA_CACHE: OrderedDict[tuple, "ImageMetadata"] = OrderedDict()
+_METADATA_CACHE_LOCK = threading.Lock()
+
 
 def _get_value_from_nested_dict(nested_dict: dict, keys: list, default_return_value: Any = None) -> Any:
     """Get a specific value from a nested dictionary"""
@@ -19,8 +41,141 @@ def _get_value_from_nested_dict(nested_dict: dict, keys: list, default_return_va
     return nested_dict.get(keys[-1], default_return_value)
 
 
+class ParsedImageMetadata(TypedDict):
+    """Parsed metadata fields, see :func:`dvpio.read.image.read_metadata`"""
+
+    __pydantic_config__ = ConfigDict(extra="forbid")
+
+    image_type: str
+    objective_nominal_magnification: float | None
+    mpp_x: float | None
+    mpp_y: float | None
+    mpp_z: float | None
+    channel_id: list[int] | None
+    channel_names: list[str] | None
+
+
+_PARSED_IMAGE_METADATA_ADAPTER = TypeAdapter(ParsedImageMetadata)
+
+
+def _extract_xml_paths(xml: str, paths: Iterable[tuple[str, ...]]) -> dict[tuple[str, ...], Any]:
+    """Extract the elements at the given paths from an XML document without converting the full document
+
+    The document is parsed into an element tree by the C parser of :mod:`xml.etree.ElementTree`, and only matched
+    elements are converted with :func:`xmltodict.parse`, i.e. values are identical to the values in the fully
+    converted document. Repeated elements are returned as list, missing elements are not contained in the
+    returned dictionary.
+    """
+    root = ET.fromstring(xml)
+
+    values = {}
+    for path in paths:
+        path = tuple(path)
+        if path[0] != root.tag:
+            continue
+        elements = root.findall("/".join(path[1:])) if len(path) > 1 else [root]
+        if not elements:
+            continue
+        for element in elements:
+            element.tail = None
+        converted = [xmltodict.parse(ET.tostring(element))[element.tag] for element in elements]
+        values[path] = converted[0] if len(converted) == 1 else converted
+    return values
+
+
+@functools.cache
+def _parsed_property_names(cls: type["ImageMetadata"]) -> tuple[str, ...]:
+    """Names of all (cached) properties of a metadata class that are marked with `_is_parsed`"""
+    names = {}
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            getter = attr.fget if isinstance(attr, property) else getattr(attr, "func", None)
+            if isinstance(attr, property | cached_property) and getattr(getter, "_is_parsed", False):
+                names[name] = None
+            else:
+                names.pop(name, None)
+    return tuple(sorted(names))
+
+
+def _load_metadata(cls: type["ImageMetadata"], path: str, load: Callable[[], "ImageMetadata"]) -> "ImageMetadata":
+    """Return the parsed metadata of a file, parsed with load() only if the file is not cached
+
+    Metadata is cached by metadata class and file identity (path, modification time, size), so that
+    metadata of a changed file is parsed again. Cached instances are shared and must not be modified.
+    """
+    key = (cls, *_file_identity(path))
+    with _METADATA_CACHE_LOCK:
+        if key in _METADATA_CACHE:
+            _METADATA_CACHE.move_to_end(key)
+            return _METADATA_CACHE[key]
+
+    metadata = load()
+
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE[key] = metadata
+        while len(_METADATA_CACHE) > _METADATA_CACHE_SIZE:
+            _METADATA_CACHE.popitem(last=False)
+    return metadata
+
+
+def _clear_metadata_cache() -> None:
+    """Remove all parsed metadata from the cache"""
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE.clear()
+
+
+def _attach_metadata(
+    element: DataArray | DataTree | dict[Any, DataArray | DataTree],
+    metadata: "ImageMetadata",
+    channels: list[int] | None = None,
+) -> DataArray | DataTree | dict[Any, DataArray | DataTree]:
+    """Store the parsed metadata in the `metadata` attribute of an image or a mapping of images
+
+    Parameters
+    ----------
+    element
+        Image or mapping of images
+    metadata
+        Parsed metadata of the file
+    channels
+        Indices of the channels of the file that were read. The channel properties are subset to these channels.
+        Defaults to `None` (all channels)
+    """
+    # Some properties warn about missing values, which is expected when all properties are collected
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        parsed_properties = metadata.parsed_properties
+
+    if channels is not None:
+        parsed_properties = {
+            **parsed_properties,
+            **{
+                name: [parsed_properties[name][channel] for channel in channels]
+                for name in ("channel_id", "channel_names")
+                if parsed_properties[name] is not None
+            },
+        }
+
+    for image in element.values() if isinstance(element, dict) else [element]:
+        image.attrs["metadata"] = copy.deepcopy(parsed_properties)
+    return element
+
+
 class ImageMetadata(BaseModel, ABC):
-    metadata: dict[str, dict | list | str]
+    metadata: dict[str, Any]
+
+    @field_validator("metadata", mode="plain")
+    @classmethod
+    def _validate_metadata(cls, value: Any) -> dict[str, Any] | None:
+        """Store the raw metadata document without validation of nested values
+
+        Metadata documents can contain tens of thousands of entries, only the parsed properties are validated
+        """
+        if value is None and cls.model_fields["metadata"].default is None:
+            return value
+        if not isinstance(value, Mapping):
+            raise ValueError(f"Metadata needs to be a mapping, not {type(value)}")
+        return value if isinstance(value, dict) else dict(value)
 
     @property
     @abstractmethod
@@ -67,18 +222,24 @@ class ImageMetadata(BaseModel, ABC):
     @property
     def parsed_properties(self) -> dict[str, Any]:
         """Return a dictionary of all parsed metadata fields marked with the `_is_parsed` attribute"""
-        return {
-            attr: getattr(self, attr)
-            for attr in dir(self.__class__)
-            if isinstance(getattr(self.__class__, attr), property)
-            and getattr(getattr(self.__class__, attr).fget, "_is_parsed", False)
-        }
+        # Parsed values might be cached, validation returns copies
+        return _PARSED_IMAGE_METADATA_ADAPTER.validate_python(
+            {attr: getattr(self, attr) for attr in _parsed_property_names(type(self))}
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the full metadata document as json-style dictionary"""
+        return self.metadata
 
     @classmethod
     @abstractmethod
     def from_file(cls, path: str) -> BaseModel:
         """Parse metadata from file path
 
+        Metadata is cached by path, modification time, and file size. Repeated calls for an unchanged file
+        (also by :func:`dvpio.read.image.read_metadata` and the image readers) return the same instance
+        without opening the file again.
+
         Parameters
         ----------
         path
@@ -92,7 +253,18 @@ class ImageMetadata(BaseModel, ABC):
 
 
 class CZIImageMetadata(ImageMetadata):
-    metadata: dict[str, Any]
+    """Metadata of CZI files
+
+    Instances created by :meth:`from_file` only extract the metadata fields that are required for the parsed
+    properties from the XML document (see `*_PATH` class variables). The full metadata document is converted
+    on the first call of :meth:`to_dict`. Parsed properties are cached.
+    """
+
+    metadata: dict[str, Any] | None = None
+
+    # Raw XML metadata document and values at the *_PATH keys, if the instance was created from XML
+    _raw_metadata: str | None = PrivateAttr(default=None)
+    _path_values: dict[tuple[str, ...], Any] | None = PrivateAttr(default=None)
 
     # *_PATH keys in nested dict that lead to the metadata field
     _CHANNEL_INFO_PATH: ClassVar = (
@@ -115,7 +287,33 @@ class CZIImageMetadata(ImageMetadata):
         "Objective",
     )
 
-    @property
+    @classmethod
+    def _paths(cls) -> list[tuple[str, ...]]:
+        """All *_PATH keys that are required for the parsed properties"""
+        paths = {name: value for klass in reversed(cls.__mro__) for name, value in vars(klass).items()}
+        return [value for name, value in paths.items() if name.startswith("_") and name.endswith("_PATH")]
+
+    @classmethod
+    def _from_xml(cls, xml: str) -> "CZIImageMetadata":
+        """Create metadata from the raw XML document by only extracting the values at the *_PATH keys"""
+        metadata = cls()
+        metadata._raw_metadata = xml
+        metadata._path_values = _extract_xml_paths(xml, cls._paths())
+        return metadata
+
+    def _get_value(self, keys: tuple[str, ...], default_return_value: Any = None) -> Any:
+        """Get the value at a *_PATH key from the extracted values or the full metadata document"""
+        if self._path_values is not None:
+            return self._path_values.get(tuple(keys), default_return_value)
+        return _get_value_from_nested_dict(self.metadata, keys, default_return_value=default_return_value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the full metadata document as json-style dictionary, converted from XML on the first call"""
+        if self.metadata is None and self._raw_metadata is not None:
+            self.metadata = xmltodict.parse(self._raw_metadata)
+        return self.metadata
+
+    @cached_property
     @is_parsed
     def image_type(self) -> str:
         return "czi"
@@ -139,7 +337,7 @@ class CZIImageMetadata(ImageMetadata):
 
         return float(mpp_dim) if mpp_dim else None
 
-    @property
+    @cached_property
     def _channel_info(self) -> list[dict[str, str]]:
         """Obtain channel metadata from CZI metadata file
 
@@ -149,7 +347,7 @@ class CZIImageMetadata(ImageMetadata):
         The dict minimally contains an `@ID` and a `PixelType` key, but
         may also contain a `Name` key.
         """
-        channels = _get_value_from_nested_dict(self.metadata, self._CHANNEL_INFO_PATH, default_return_value=[])
+        channels = self._get_value(self._CHANNEL_INFO_PATH, default_return_value=[])
 
         # For a single channel, a dict is returned
         if isinstance(channels, dict):
@@ -157,7 +355,7 @@ class CZIImageMetadata(ImageMetadata):
 
         return channels
 
-    @property
+    @cached_property
     @is_parsed
     def channel_id(self) -> list[int]:
         """Parse channel metadata to list of channel ids
@@ -169,7 +367,7 @@ class CZIImageMetadata(ImageMetadata):
         """
         return [self._parse_channel_id(channel.get("@Id")) for channel in self._channel_info]
 
-    @property
+    @cached_property
     @is_parsed
     def channel_names(self) -> list[str]:
         """Parse channel metadata to list of channel ids
@@ -186,7 +384,7 @@ class CZIImageMetadata(ImageMetadata):
         """
         return [channel.get("@Name", str(idx)) for idx, channel in enumerate(self._channel_info)]
 
-    @property
+    @cached_property
     def _mpp(self) -> dict[str, dict[str, str]]:
         """Parse pixel resolution from slide image
 
@@ -194,27 +392,33 @@ class CZIImageMetadata(ImageMetadata):
         ----
         Pixel resolution is stored in `Distance` field and always specified in meters per pixel
         """
-        return _get_value_from_nested_dict(self.metadata, self._MPP_PATH, [])
+        mpp = self._get_value(self._MPP_PATH, [])
 
-    @property
+        # For a single dimension, a dict is returned
+        if isinstance(mpp, dict):
+            mpp = [mpp]
+
+        return mpp
+
+    @cached_property
     @is_parsed
     def mpp_x(self) -> float | None:
         """Return resolution in X dimension in [meters per pixel]"""
         return self._parse_mpp_dim(self._mpp, dimension="X")
 
-    @property
+    @cached_property
     @is_parsed
     def mpp_y(self) -> float | None:
         """Resolution in Y dimension in [meters per pixel]"""
         return self._parse_mpp_dim(self._mpp, dimension="Y")
 
-    @property
+    @cached_property
     @is_parsed
     def mpp_z(self) -> float | None:
         """Resolution in Z dimension in [meters per pixel]"""
         return self._parse_mpp_dim(self._mpp, dimension="Z")
 
-    @property
+    @cached_property
     def objective_name(self) -> str | None:
         """Utilized objective name. Required to infer objective_nominal_magnification
 
@@ -223,11 +427,9 @@ class CZIImageMetadata(ImageMetadata):
         Objective Name is stored as string in `ObjectiveName` field. Presumably,
         this represents the currently utilized objective
         """
-        return _get_value_from_nested_dict(
-            nested_dict=self.metadata, keys=self._OBJECTIVE_NAME_PATH, default_return_value=None
-        )
+        return self._get_value(self._OBJECTIVE_NAME_PATH, default_return_value=None)
 
-    @property
+    @cached_property
     @is_parsed
     def objective_nominal_magnification(self) -> float | None:
         """Utilized objective_nominal_magnification
@@ -238,9 +440,7 @@ class CZIImageMetadata(ImageMetadata):
         from the metadata on all available Objectives. The objective_nominal_magnification of an objective
         is given as `NominalMagnification` field.
         """
-        objectives = _get_value_from_nested_dict(
-            self.metadata, keys=self._OBJECTIVE_NOMINAL_MAGNIFICATION_PATH, default_return_value=[]
-        )
+        objectives = self._get_value(self._OBJECTIVE_NOMINAL_MAGNIFICATION_PATH, default_return_value=[])
 
         if isinstance(objectives, dict):
             objectives = [objectives]
@@ -252,10 +452,11 @@ class CZIImageMetadata(ImageMetadata):
 
     @classmethod
     def from_file(cls, path: str) -> BaseModel:
-        with open_czi(path) as czi:
-            metadata = czi.metadata
+        def load() -> CZIImageMetadata:
+            with open_czi(path) as czi:
+                return cls._from_xml(czi.raw_metadata)
 
-        return cls(metadata=metadata)
+        return _load_metadata(cls, path, load)
 
 
 class OpenslideImageMetadata(ImageMetadata):
@@ -291,7 +492,7 @@ class OpenslideImageMetadata(ImageMetadata):
 
     @property
     @is_parsed
-    def channel_names(self) -> list[int]:
+    def channel_names(self) -> list[str]:
         # Openslide returns RGBA images (channels R, G, B, A)
         # https://openslide.org/api/python/#openslide.OpenSlide.read_region
         return self._CHANNEL_NAMES
@@ -320,14 +521,19 @@ class OpenslideImageMetadata(ImageMetadata):
     @classmethod
     @is_parsed
     def from_file(cls, path) -> BaseModel:
-        slide = openslide.OpenSlide(path)
-        return cls(metadata=slide.properties)
+        def load() -> OpenslideImageMetadata:
+            with openslide.OpenSlide(path) as slide:
+                return cls(metadata=dict(slide.properties))
+
+        return _load_metadata(cls, path, load)
 
 
 def read_metadata(path: str, image_type: Literal["czi", "openslide"], parse_metadata: bool = True) -> dict[str, Any]:
     """Parse relevant microscopy metadata of dvp-io supported image file
 
-    Currently only supports `czi` files and `openslide`-compatible files.
+    Currently only supports `czi` files and `openslide`-compatible files. Metadata is parsed once per file
+    and shared with the image readers, which also attach the parsed metadata to the `metadata` attribute
+    of the returned image (`image.attrs["metadata"]`).
 
     Parameters
     ----------
@@ -422,4 +628,125 @@ def read_metadata(path: str, image_type: Literal["czi", "openslide"], parse_meta
     if parse_metadata:
         return metadata.parsed_properties
 
-    return metadata.metadata
+    # The parsed metadata is cached, do not expose the cached document
+    return copy.deepcopy(metadata.to_dict())
+
+
+def _detect_image_type(path: str) -> Literal["czi", "openslide"]:
+    """Detect whether a file is a CZI file or an openslide-compatible slide"""
+    if os.path.splitext(path)[1].lower() == ".czi":
+        return "czi"
+    if openslide.OpenSlide.detect_format(path) is not None:
+        return "openslide"
+    raise ValueError(f"Image type of {path} could not be detected, needs to be a `czi` or `openslide` file")
+
+
+def _scan_file(path: str, image_type: Literal["auto", "czi", "openslide"]) -> dict[str, Any]:
+    """Parse the metadata of a single file, errors are returned in the `error` field"""
+    record = {"path": path, "size": None, "mtime_ns": None, "error": None}
+    try:
+        path, record["mtime_ns"], record["size"] = _file_identity(path)
+        record["path"] = path
+        if image_type == "auto":
+            image_type = _detect_image_type(path)
+
+        # Properties that are not available in a format warn, which is expected in a scan
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            record.update(read_metadata(path, image_type=image_type, parse_metadata=True))
+    except Exception as e:  # noqa: BLE001
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def scan_metadata(
+    paths: Iterable[str],
+    image_type: Literal["auto", "czi", "openslide"] = "auto",
+    n_jobs: int = 1,
+    previous: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Parse the metadata of many image files, e.g. to audit the resolution and channels of a cohort
+
+    Files are parsed in parallel processes. File handles are closed as soon as the metadata of a file is parsed.
+    Errors do not interrupt the scan but are reported per file.
+
+    Parameters
+    ----------
+    paths
+        Paths to image files
+    image_type
+        One of the supported image data types (`czi`, `openslide`). If `auto` (default), the type is detected per file
+        from the file extension (`.czi`) or by openslide
+    n_jobs
+        Number of parallel processes. `1` (default) parses all files in the current process, `-1` uses all CPUs
+    previous
+        Result of a previous scan. Files whose path, size, and modification time did not change since the previous scan
+        are not parsed again. Files that failed in the previous scan are always parsed again
+
+    Returns
+    -------
+    :class:`pandas.DataFrame`
+        One row per file in the order of `paths` with the columns
+
+            - path: Absolute path of the file
+            - Parsed metadata fields (see :func:`dvpio.read.image.read_metadata`)
+            - size: File size in bytes
+            - mtime_ns: Modification time of the file in nanoseconds
+            - error: Error message if the metadata could not be parsed, otherwise `None`
+
+    Example
+    -------
+    .. code-block:: python
+
+        from glob import glob
+        from dvpio.read.image import scan_metadata
+
+        cohort = scan_metadata(glob("/path/to/cohort/*.czi"), n_jobs=8)
+        cohort[cohort["error"].isna()].groupby("mpp_x").size()
+
+        # Only parse new or modified files
+        cohort = scan_metadata(glob("/path/to/cohort/*.czi"), n_jobs=8, previous=cohort)
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, not {n_jobs}")
+    if image_type not in ("auto", "czi", "openslide"):
+        raise ValueError("Parameter image_type needs to be `auto`, `czi` or `openslide`")
+
+    paths = [str(path) for path in paths]
+    records: list[dict[str, Any] | None] = [None] * len(paths)
+
+    # Reuse records of unchanged files
+    if previous is not None and len(previous) > 0:
+        unchanged = {
+            (record["path"], record["mtime_ns"], record["size"]): record
+            for record in previous.to_dict(orient="records")
+            if pd.isna(record["error"])
+        }
+        for idx, path in enumerate(paths):
+            try:
+                records[idx] = unchanged.get(_file_identity(path))
+            except OSError:
+                continue
+
+    pending = [idx for idx, record in enumerate(records) if record is None]
+    if n_jobs == 1 or len(pending) <= 1:
+        results = map(_scan_file, (paths[idx] for idx in pending), repeat(image_type))
+        for idx, record in zip(pending, results, strict=True):
+            records[idx] = record
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(pending))) as executor:
+            results = executor.map(
+                _scan_file,
+                [paths[idx] for idx in pending],
+                repeat(image_type),
+                chunksize=max(1, len(pending) // (4 * n_jobs)),
+            )
+            for idx, record in zip(pending, results, strict=True):
+                records[idx] = record
+
+    columns = ["path", *ParsedImageMetadata.__annotations__, "size", "mtime_ns", "error"]
+    result = pd.DataFrame({column: [record.get(column) for record in records] for column in columns}, dtype=object)
+    # Nullable integers, modification times in nanoseconds cannot be represented as float without loss
+    return result.astype({"size": "Int64", "mtime_ns": "Int64"})
@@ -1,10 +1,163 @@
-from collections.abc import Callable
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from functools import partial
 from typing import Any
 
+import dask
 import dask.array as da
 import numpy as np
-from dask import delayed
+from dask.utils import parse_bytes
+from geopandas import GeoDataFrame
 from numpy.typing import NDArray
+from spatialdata.models import Image2DModel, Image3DModel
+from spatialdata.transformations import Identity, Sequence, Translation, set_transformation
+from xarray import Dataset, DataTree
+
+from ._cache import _file_identity, _read_cached_tile
+from ._instrument import _instrumented, _tile_event
+
+
+class _HandlePool:
+    """Bounded pool of lazily opened slide handles, keyed by path
+
+    Native slide handles (e.g. :class:`pylibCZIrw.czi.CziReader`) can neither be pickled nor
+    safely be shared between threads. Dask tasks therefore only carry the path to the slide
+    and request a handle from the pool at compute time. Every thread of every process
+    (dask worker) holds its own handles. Per thread, at most `maxsize` handles are kept open, the least
+    recently used handle is closed first. A handle is reopened if the file was modified (modification time or
+    size changed) since it was opened.
+
+    Parameters
+    ----------
+    opener
+        Function that opens a slide handle given a path
+    closer
+        Function that closes a slide handle. Defaults to calling `handle.close()`
+    maxsize
+        Maximum number of open handles per thread
+    """
+
+    def __init__(
+        self,
+        opener: Callable[[str], Any],
+        closer: Callable[[Any], None] | None = None,
+        maxsize: int = 8,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, not {maxsize}")
+
+        self._opener = opener
+        self._closer = closer if closer is not None else lambda handle: handle.close()
+        self.maxsize = maxsize
+        self._local = threading.local()
+
+    @property
+    def _handles(self) -> OrderedDict[str, tuple[tuple[str, int, int], Any]]:
+        """File identities and handles of the current thread in least recently used order"""
+        # Handles must not be reused in forked child processes
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.pid = os.getpid()
+            self._local.handles = OrderedDict()
+        return self._local.handles
+
+    def get(self, path: str) -> Any:
+        """Return an open handle for path, open it if required"""
+        handles = self._handles
+        identity = _file_identity(path)
+
+        if path in handles:
+            handle_identity, handle = handles[path]
+            if handle_identity == identity:
+                handles.move_to_end(path)
+                return handle
+            # Modified file, the handle might refer to the previous version
+            del handles[path]
+            self._closer(handle)
+
+        handle = self._opener(path)
+        handles[path] = (identity, handle)
+
+        while len(handles) > self.maxsize:
+            _, (_, evicted_handle) = handles.popitem(last=False)
+            self._closer(evicted_handle)
+
+        return handle
+
+    def clear(self) -> None:
+        """Close all handles of the current thread"""
+        handles = self._handles
+        while handles:
+            _, (_, handle) = handles.popitem(last=False)
+            self._closer(handle)
+
+
+def _parse_roi(
+    roi: tuple[int, int, int, int] | GeoDataFrame, dimensions: tuple[int, int], margin: int = 0, align: int = 1
+) -> tuple[int, int, int, int]:
+    """Parse a region of interest to a rectangle (x, y, width, height) within the image
+
+    Parameters
+    ----------
+    roi
+        Region of interest as (x, y, width, height) in pixel coordinates of the image or
+        shapes (:class:`spatialdata.models.ShapesModel`) whose total bounds define the region.
+    dimensions
+        Size of the image in (width, height), the region is clipped to the image
+    margin
+        Margin in pixels that is added to all sides of the region
+    align
+        Expand the region so that its borders are multiples of align (e.g. the downsample factor
+        of the lowest resolution pyramid level)
+
+    Returns
+    -------
+    tuple[int, int, int, int]
+        Region of interest (x, y, width, height) clipped to the image
+    """
+    if isinstance(roi, GeoDataFrame):
+        xmin, ymin, xmax, ymax = roi.total_bounds
+    else:
+        xmin, ymin, width, height = roi
+        xmax, ymax = xmin + width, ymin + height
+
+    # Round to pixels that are (partially) covered by the region and clip to image
+    xmin, ymin = (int(np.floor((coord - margin) / align)) * align for coord in (xmin, ymin))
+    xmax, ymax = (int(np.ceil((coord + margin) / align)) * align for coord in (xmax, ymax))
+    xmin, ymin = max(xmin, 0), max(ymin, 0)
+    xmax, ymax = min(xmax, dimensions[0]), min(ymax, dimensions[1])
+
+    if (xmax <= xmin) or (ymax <= ymin):
+        raise ValueError(f"Region of interest does not overlap with image of size {dimensions}")
+
+    return xmin, ymin, xmax - xmin, ymax - ymin
+
+
+def _roi_transformations(
+    roi: tuple[int, int, int, int], transformations: Mapping[str, Any] | None = None
+) -> dict[str, Any]:
+    """Translate a region of interest to its position in the full image
+
+    Parameters
+    ----------
+    roi
+        Region of interest (x, y, width, height)
+    transformations
+        Transformations of the full image. Defaults to an identity transformation to the `global` coordinate system
+
+    Returns
+    -------
+    Transformations of the region of interest
+    """
+    translation = Translation([roi[0], roi[1]], axes=("x", "y"))
+
+    if transformations is None:
+        return {"global": translation}
+    return {
+        coordinate_system: Sequence([translation, transformation])
+        for coordinate_system, transformation in transformations.items()
+    }
 
 
 def _compute_chunk_sizes_positions(size: int, chunk: int, min_coord: int) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
@@ -22,10 +175,65 @@ def _compute_chunk_sizes_positions(size: int, chunk: int, min_coord: int) -> tup
     return positions, lengths
 
 
+def _compute_aligned_chunk_sizes_positions(
+    size: int, chunk: int, min_coord: int, boundaries: NDArray[np.int_]
+) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
+    """Calculate chunk sizes and positions for a given dimension so that chunk borders coincide with boundaries
+
+    Chunks are grown greedily up to the largest boundary within the chunk size. If no boundary is within
+    the chunk size, the chunk is extended to the next boundary.
+
+    Parameters
+    ----------
+    size
+        Size of the dimension
+    chunk
+        Target chunk size
+    min_coord
+        Minimum coordinate of the dimension
+    boundaries
+        Coordinates at which chunks may be split (e.g. start coordinates of acquisition tiles)
+    """
+    max_coord = min_coord + size
+    candidates = np.union1d(np.clip(boundaries, min_coord, max_coord), [min_coord, max_coord])
+
+    positions = [min_coord]
+    while positions[-1] < max_coord:
+        current = positions[-1]
+        # Largest boundary within chunk size, fall back to the next boundary
+        next_position = candidates[np.searchsorted(candidates, current + chunk, side="right") - 1]
+        if next_position <= current:
+            next_position = candidates[np.searchsorted(candidates, current, side="right")]
+        positions.append(next_position)
+
+    positions = np.array(positions, dtype=int)
+    return positions[:-1], np.diff(positions)
+
+
+def _compute_auto_chunk_size(n_channel: int, dtype: np.dtype, target_bytes: int | str | None = None) -> tuple[int, int]:
+    """Compute a square chunk size (width, height) for chunks of approximately target_bytes
+
+    Parameters
+    ----------
+    n_channel
+        Number of channels in a chunk
+    dtype
+        Data type of image
+    target_bytes
+        Target size of a chunk in bytes. Defaults to the dask `array.chunk-size` configuration.
+    """
+    target_bytes = dask.config.get("array.chunk-size") if target_bytes is None else target_bytes
+    target_bytes = parse_bytes(target_bytes) if isinstance(target_bytes, str) else target_bytes
+
+    length = max(1, int(np.sqrt(target_bytes / (n_channel * np.dtype(dtype).itemsize))))
+    return length, length
+
+
 def _compute_chunks(
     dimensions: tuple[int, int],
     chunk_size: tuple[int, int],
     min_coordinates: tuple[int, int] = (0, 0),
+    boundaries: tuple[NDArray[np.int_], NDArray[np.int_]] | None = None,
 ) -> NDArray[np.int_]:
     """Create all chunk specs for a given image and chunk size.
 
@@ -41,6 +249,9 @@ def _compute_chunks(
         Size of individual tiles in (width, height).
     min_coordinates : tuple[int, int], optional
         Minimum coordinates (x, y) in the image, defaults to (0, 0).
+    boundaries : tuple[np.ndarray, np.ndarray], optional
+        Coordinates (x, y) at which the chunks may be split. If passed, chunk borders are snapped to
+        these coordinates and chunk_size is only used as target size.
 
     Returns
     -------
@@ -48,8 +259,16 @@ def _compute_chunks(
         Array of shape (n_tiles_x, n_tiles_y, 4). Each entry defines a tile
         as (x, y, width, height).
     """
-    x_positions, widths = _compute_chunk_sizes_positions(dimensions[0], chunk_size[0], min_coord=min_coordinates[0])
-    y_positions, heights = _compute_chunk_sizes_positions(dimensions[1], chunk_size[1], min_coord=min_coordinates[1])
+    if boundaries is None:
+        x_positions, widths = _compute_chunk_sizes_positions(dimensions[0], chunk_size[0], min_coordinates[0])
+        y_positions, heights = _compute_chunk_sizes_positions(dimensions[1], chunk_size[1], min_coordinates[1])
+    else:
+        x_positions, widths = _compute_aligned_chunk_sizes_positions(
+            dimensions[0], chunk_size[0], min_coordinates[0], boundaries=boundaries[0]
+        )
+        y_positions, heights = _compute_aligned_chunk_sizes_positions(
+            dimensions[1], chunk_size[1], min_coordinates[1], boundaries=boundaries[1]
+        )
 
     # Generate the tiles
     # x/width are inner list
@@ -65,11 +284,200 @@ def _compute_chunks(
     return tiles
 
 
+def _chunk_extents(coords: NDArray, downsample: float = 1) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+    """Return start and end coordinates of the columns (x) and rows (y) of a chunk grid
+
+    Chunk sizes are given in pixels of a pyramid level and scaled by downsample to the coordinates of the positions
+    """
+    x_start, y_start = coords[0, :, 0], coords[:, 0, 1]
+    x_end = x_start + coords[0, :, 2] * downsample
+    y_end = y_start + coords[:, 0, 3] * downsample
+    return x_start, x_end, y_start, y_end
+
+
+def _rects_occupancy(rects: NDArray, coords: NDArray, downsample: float = 1) -> NDArray[np.bool_]:
+    """Return which chunks of a chunk grid intersect with any of the rectangles
+
+    Parameters
+    ----------
+    rects
+        Occupied rectangles (x, y, width, height) of shape (n, 4), e.g. acquisition tiles
+    coords
+        Chunk grid of shape (n_tiles_y, n_tiles_x, 4) (see :func:`_compute_chunks`)
+    downsample
+        Downsample factor of the chunk sizes relative to the coordinate system of the positions and rectangles
+
+    Returns
+    -------
+    Boolean array of shape (n_tiles_y, n_tiles_x)
+    """
+    x_start, x_end, y_start, y_end = _chunk_extents(coords, downsample)
+    # Subblocks of all channels and z-planes often share their position
+    x, y, width, height = np.unique(np.asarray(rects).reshape(-1, 4), axis=0).T
+
+    # Chunks with end > rect start and start < rect end
+    col_start, col_end = np.searchsorted(x_end, x, side="right"), np.searchsorted(x_start, x + width, side="left")
+    row_start, row_end = np.searchsorted(y_end, y, side="right"), np.searchsorted(y_start, y + height, side="left")
+    valid = (col_start < col_end) & (row_start < row_end)
+    col_start, col_end, row_start, row_end = col_start[valid], col_end[valid], row_start[valid], row_end[valid]
+
+    # Mark the chunk ranges of all rectangles in a 2D difference array, its cumulative sum counts the rectangles
+    # that overlap with every chunk
+    counts = np.zeros((coords.shape[0] + 1, coords.shape[1] + 1), dtype=np.int64)
+    np.add.at(counts, (row_start, col_start), 1)
+    np.add.at(counts, (row_start, col_end), -1)
+    np.add.at(counts, (row_end, col_start), -1)
+    np.add.at(counts, (row_end, col_end), 1)
+    counts = counts.cumsum(axis=0).cumsum(axis=1)
+
+    return counts[:-1, :-1] > 0
+
+
+def _rasterize_rects(rects: NDArray, region: tuple[int, int, int, int], downsample: int = 1) -> NDArray[np.bool_]:
+    """Rasterize rectangles (x, y, width, height) to a low resolution mask of a region
+
+    A mask pixel is foreground if it is (partially) covered by any rectangle.
+
+    Parameters
+    ----------
+    rects
+        Rectangles (x, y, width, height) of shape (n, 4)
+    region
+        Region (x, y, width, height) covered by the mask
+    downsample
+        Size of a mask pixel
+
+    Returns
+    -------
+    Boolean mask of shape (ceil(height / downsample), ceil(width / downsample))
+    """
+    xmin, ymin, width, height = region
+    mask = np.zeros((-(-height // downsample), -(-width // downsample)), dtype=bool)
+
+    for x, y, rect_width, rect_height in np.asarray(rects).reshape(-1, 4):
+        col_start, row_start = max((x - xmin) // downsample, 0), max((y - ymin) // downsample, 0)
+        col_end = max(-(-(x + rect_width - xmin) // downsample), 0)
+        row_end = max(-(-(y + rect_height - ymin) // downsample), 0)
+        mask[row_start:row_end, col_start:col_end] = True
+
+    return mask
+
+
+def _mask_occupancy(
+    mask: NDArray[np.bool_],
+    mask_downsample: float,
+    coords: NDArray,
+    downsample: float = 1,
+    origin: tuple[float, float] = (0, 0),
+) -> NDArray[np.bool_]:
+    """Return which chunks of a chunk grid overlap with any foreground pixel of a low resolution mask
+
+    Chunks that partially cover a mask pixel are considered to overlap with it.
+
+    Parameters
+    ----------
+    mask
+        Low resolution foreground mask (y, x)
+    mask_downsample
+        Size of a mask pixel in the coordinate system of the chunk positions
+    coords
+        Chunk grid of shape (n_tiles_y, n_tiles_x, 4) (see :func:`_compute_chunks`)
+    downsample
+        Downsample factor of the chunk sizes relative to the coordinate system of the positions
+    origin
+        Position (x, y) of the upper left corner of the mask
+
+    Returns
+    -------
+    Boolean array of shape (n_tiles_y, n_tiles_x)
+    """
+    x_start, x_end, y_start, y_end = _chunk_extents(coords, downsample)
+    height, width = mask.shape
+
+    def _to_mask(start: NDArray, end: NDArray, offset: float, size: int) -> tuple[NDArray, NDArray]:
+        first = np.clip(np.floor((start - offset) / mask_downsample), 0, size).astype(int)
+        last = np.clip(np.ceil((end - offset) / mask_downsample), 0, size).astype(int)
+        return first, last
+
+    col_start, col_end = _to_mask(x_start, x_end, origin[0], width)
+    row_start, row_end = _to_mask(y_start, y_end, origin[1], height)
+
+    # Number of foreground pixels per chunk from the summed-area table of the mask
+    table = np.zeros((height + 1, width + 1), dtype=np.int64)
+    table[1:, 1:] = mask.astype(np.int64).cumsum(axis=0).cumsum(axis=1)
+    counts = (
+        table[row_end[:, None], col_end[None, :]]
+        - table[row_start[:, None], col_end[None, :]]
+        - table[row_end[:, None], col_start[None, :]]
+        + table[row_start[:, None], col_start[None, :]]
+    )
+    return counts > 0
+
+
+def _read_block(
+    func: Callable[..., NDArray],
+    slide: Any,
+    x_positions: NDArray[np.int_],
+    y_positions: NDArray[np.int_],
+    widths: NDArray[np.int_],
+    heights: NDArray[np.int_],
+    block_id: tuple[int, ...],
+    occupancy: NDArray[np.bool_] | None = None,
+    fill_value: NDArray | None = None,
+    planes: list[Mapping[str, Any]] | None = None,
+    reader: str = "",
+    **func_kwargs: Any,
+) -> NDArray:
+    """Read the tile at the given block index (c, tile_y, tile_x) or (c, plane, tile_y, tile_x) of the chunk grid
+
+    Empty tiles (according to occupancy) are filled with the constant fill_value (c, 1, 1) without reading the slide.
+    If tile events are recorded, the read is timed and emitted as :class:`~dvpio.read.image.TileEvent`
+    """
+    *_, tile_y, tile_x = block_id
+    if planes is not None:
+        func_kwargs = {**func_kwargs, **planes[block_id[1]]}
+    x0, y0 = int(x_positions[tile_x]), int(y_positions[tile_y])
+    width, height = int(widths[tile_x]), int(heights[tile_y])
+    is_empty = occupancy is not None and not occupancy[tile_y, tile_x]
+
+    def read() -> NDArray:
+        if is_empty:
+            block = np.empty((fill_value.shape[0], height, width), dtype=fill_value.dtype)
+            block[...] = fill_value
+            return block
+        return func(slide, x0=x0, y0=y0, width=width, height=height, **func_kwargs)
+
+    if _instrumented():
+        with _tile_event(reader, slide, x0, y0, width, height, **func_kwargs) as event:
+            block = read()
+            event.nbytes = block.nbytes
+            if is_empty:
+                event.cache = "empty"
+    else:
+        block = read()
+
+    # Every block holds a single plane
+    return block if planes is None else block[:, np.newaxis]
+
+
 def _read_chunks(
-    func: Callable[..., NDArray], slide: Any, coords: NDArray, n_channel: int, dtype: np.dtype, **func_kwargs: Any
-) -> list[list[NDArray]]:
+    func: Callable[..., NDArray],
+    slide: Any,
+    coords: NDArray,
+    n_channel: int,
+    dtype: np.dtype,
+    cache_key: Hashable | None = None,
+    occupancy: NDArray[np.bool_] | None = None,
+    fill_value: float | list[float] = 0,
+    planes: list[Mapping[str, Any]] | None = None,
+    **func_kwargs: Any,
+) -> da.Array:
     """Abstract factory method to tile a large microscopy image.
 
+    The image is represented by a single blockwise graph layer, in which every block reads
+    one tile with func. Constructing the array does not scale with the number of tiles and slicing
+    the array only keeps the tasks of the selected tiles.
+
     Parameters
     ----------
     func
@@ -87,41 +495,118 @@ def _read_chunks(
         Slide image in format compatible with func
     coords
         Coordinates of the upper left corner of the image in formt (n_row_x, n_row_y, 4)
-        where the last dimension defines the rectangular tile in format (x, y, width, height)
+        where the last dimension defines the rectangular tile in format (x, y, width, height).
+        Tiles must form a grid, i.e. all tiles in a column share x and width and all tiles in a row share y and height
+        (see :func:`_compute_chunks`)
     n_channel
         Number of channels in array (first dimension)
     dtype
         Data type of image
+    cache_key
+        Identity of the slide (e.g. path and modification time). If passed, tiles are served from
+        and stored in the process-wide tile cache (see :func:`dvpio.read.image.configure_tile_cache`)
+    occupancy
+        Boolean array of shape (n_row_y, n_row_x) that indicates which tiles contain data. Empty tiles are not read
+        but returned as constant blocks. Defaults to `None` (all tiles are read)
+    fill_value
+        Value of empty tiles, either a scalar or one value per channel
+    planes
+        Keyword arguments passed to func for every plane of a stack (e.g. z-planes). If passed, the planes
+        are stacked along the second dimension and every plane is read on the same chunk grid.
+        Defaults to `None` (single plane)
     func_kwargs
         Additional keyword arguments passed to func
+
+    Returns
+    -------
+    dask.array.Array
+        Image in (c, y, x) format with one chunk per tile, or (c, plane, y, x) format with one chunk per
+        tile and plane if `planes` is passed
     """
     func_kwargs = func_kwargs if func_kwargs else {}
+    # Name of the reader in tile events
+    reader = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+    if cache_key is not None:
+        func = partial(_read_cached_tile, func, cache_key)
 
-    # Collect each delayed chunk as item in list of list
-    # Inner list becomes dim=-1 (x in cyx)
-    # Outer list becomes dim=-2 (y in cyx)
-    # see dask.array.block
-    chunks = [
-        [
-            da.from_delayed(
-                delayed(func)(
-                    slide,
-                    x0=coords[tile_y, tile_x, 0],
-                    y0=coords[tile_y, tile_x, 1],
-                    width=coords[tile_y, tile_x, 2],
-                    height=coords[tile_y, tile_x, 3],
-                    **func_kwargs,
-                ),
-                dtype=dtype,
-                shape=(n_channel, *coords[tile_y, tile_x, [3, 2]]),
-            )
-            for tile_x in range(coords.shape[1])
-        ]
-        for tile_y in range(coords.shape[0])
-    ]
-    return chunks
-
-
-def _assemble(chunks: list[list[NDArray]]) -> NDArray:
-    """Assemble chunks (delayed)"""
-    return da.block(chunks, allow_unknown_chunksizes=True)
+    # The chunk grid is separable, only pass the positions and sizes per row and column to the tasks
+    x_positions, widths = coords[0, :, 0], coords[0, :, 2]
+    y_positions, heights = coords[:, 0, 1], coords[:, 0, 3]
+
+    # Constant value of empty tiles in (c, 1, 1) format
+    fill_value = np.broadcast_to(np.asarray(fill_value, dtype=dtype).reshape(-1), (n_channel,))[:, None, None]
+
+    chunks = ((n_channel,), tuple(heights.tolist()), tuple(widths.tolist()))
+    if planes is not None:
+        chunks = (chunks[0], (1,) * len(planes), *chunks[1:])
+
+    return da.map_blocks(
+        partial(_read_block, func, slide, occupancy=occupancy, fill_value=fill_value, planes=planes, reader=reader),
+        x_positions=x_positions,
+        y_positions=y_positions,
+        widths=widths,
+        heights=heights,
+        chunks=chunks,
+        dtype=dtype,
+        meta=np.empty((0,) * len(chunks), dtype=dtype),
+        **func_kwargs,
+    )
+
+
+def _parse_multiscale(
+    arrays: list[NDArray],
+    c_coords: list[str] | None = None,
+    dims: str = "cyx",
+    transformations: Mapping[str, Any] | None = None,
+    **kwargs: Any,
+) -> DataTree:
+    """Parse (c, y, x) or (c, z, y, x) arrays of decreasing resolution to a multiscale Image2DModel/Image3DModel
+
+    In contrast to passing `scale_factors` to :meth:`spatialdata.models.Image2DModel.parse`, the lower resolution
+    scales are not recomputed from the full resolution image, but taken as is (e.g. pyramid levels stored in a file)
+
+    Parameters
+    ----------
+    arrays
+        Image data in (c, y, x) format, ordered from the highest to the lowest resolution
+    c_coords
+        Channel names
+    dims
+        Dimensions of the arrays, either `cyx` (Image2DModel) or `czyx` (Image3DModel). Only y and x differ
+        between scales
+    transformations
+        Transformations of the highest resolution scale. Defaults to an identity transformation to the
+        `global` coordinate system
+    kwargs
+        Keyword arguments passed to :meth:`spatialdata.models.Image2DModel.parse` for every scale
+
+    Returns
+    -------
+    :class:`xarray.DataTree`
+        Multiscale image with scales `scale0`, `scale1`, ...
+    """
+    if "scale_factors" in kwargs:
+        raise ValueError("Argument `scale_factors` is not supported for multiscale images read from file")
+
+    model = Image3DModel if "z" in dims else Image2DModel
+
+    scales = {}
+    height, width = arrays[0].shape[-2:]
+    for idx, array in enumerate(arrays):
+        image = model.parse(array, dims=dims, c_coords=c_coords, **kwargs)
+        del image.attrs["transform"]
+
+        # Pixel centers in coordinates of highest resolution, in line with spatialdata
+        image = image.assign_coords(
+            y=(np.arange(image.sizes["y"]) + 0.5) * height / image.sizes["y"],
+            x=(np.arange(image.sizes["x"]) + 0.5) * width / image.sizes["x"],
+        )
+        scales[f"scale{idx}"] = Dataset({"image": image})
+
+    multiscale = DataTree.from_dict(scales)
+
+    transformations = {"global": Identity()} if transformations is None else transformations
+    set_transformation(multiscale, dict(transformations), set_all=True)
+
+    model.validate(multiscale)
+    return multiscale
@@ -0,0 +1,80 @@
+"""Coverage (tissue) masks of whole slide images"""
+
+import math
+import os
+from typing import Literal
+
+import numpy as np
+import openslide
+from spatialdata.models import Labels2DModel
+from spatialdata.transformations import Scale
+
+from ._utils import _rasterize_rects
+from .czi import _CZI_HANDLES, _get_subblock_rects
+from .openslide import _get_coverage_mask
+
+
+def read_coverage_mask(
+    path: str,
+    image_type: Literal["czi", "openslide"],
+    scene: int | None = None,
+    max_size: int = 4096,
+) -> Labels2DModel:
+    """Read a low resolution mask of the regions of a slide that contain image data
+
+    Whole slide images are often mostly empty background. The mask is derived without decoding any pixel data
+    of the full resolution image and is the same index that is used by the readers to skip empty chunks.
+
+        - `czi`: Area covered by the acquired subblocks (tiles) in the subblock directory of the file
+        - `openslide`: Non-transparent area of the lowest resolution level, dilated by one pixel
+
+    Parameters
+    ----------
+    path
+        Path to file
+    image_type
+        Type of the slide image
+    scene
+        Only for `czi`. Index of the scene, if `None` (default), the mask covers all scenes
+    max_size
+        Only for `czi`. Maximum size of the mask along each axis, defines the resolution of the mask
+
+    Returns
+    -------
+    :class:`spatialdata.models.Labels2DModel`
+        Mask with 1 for regions with image data and 0 for empty regions. The mask is scaled to the coordinate system of
+        the image returned by :func:`dvpio.read.image.read_czi` or :func:`dvpio.read.image.read_openslide`
+
+    Example
+    -------
+    .. code-block:: python
+
+        from dvpio.read.image import read_coverage_mask, read_czi
+
+        image = read_czi(path)
+        mask = read_coverage_mask(path, image_type="czi")
+        # Fraction of the slide that contains tissue
+        mask.mean().item()
+    """
+    if image_type == "czi":
+        slide = _CZI_HANDLES.get(os.path.abspath(path))
+        if scene is not None:
+            region = tuple(slide.scenes_bounding_rectangle[scene])
+        else:
+            region = tuple(slide.total_bounding_rectangle)
+
+        # Subblocks of all planes
+        rects = _get_subblock_rects(slide, planes=[{}], roi=region)
+        downsample = max(1, math.ceil(max(region[2:]) / max_size))
+        mask = _rasterize_rects(rects, region=region, downsample=downsample)
+    elif image_type == "openslide":
+        slide = openslide.OpenSlide(path)
+        mask, downsample = _get_coverage_mask(slide, max_pixels=np.inf)
+    else:
+        raise ValueError("Parameter image_type needs to be `czi` or `openslide`")
+
+    return Labels2DModel.parse(
+        mask.astype(np.uint8),
+        dims=("y", "x"),
+        transformations={"global": Scale([downsample, downsample], axes=("x", "y"))},
+    )
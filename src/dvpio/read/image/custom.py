@@ -14,7 +14,8 @@ def read_custom(
 ) -> Image2DModel:
     """Read a custom image file to Image2DModel
 
-    This function might not be performant for large images.
+    This function might not be performant for large images. For large tiled or pyramidal
+    TIFF files use :func:`dvpio.read.image.read_tiff`.
 
     Uses the :func:`dask.array.image.imread` function to read any image file to dask.
     Support widely used file types, including `.tiff`.
@@ -1,16 +1,35 @@
 """Reader for CZI file format"""
 
+import math
+import os
 from collections.abc import Mapping
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
+from warnings import warn
 
 import numpy as np
+from geopandas import GeoDataFrame
 from numpy.typing import NDArray
 from pylibCZIrw import czi as pyczi
-from spatialdata.models import Image2DModel
-
-from ._metadata import CZIImageMetadata
-from ._utils import _assemble, _compute_chunks, _read_chunks
+from spatialdata.models import Image2DModel, Image3DModel
+
+from ._cache import _file_identity
+from ._instrument import _TilePhase
+from ._metadata import CZIImageMetadata, _attach_metadata, _load_metadata
+from ._utils import (
+    _compute_auto_chunk_size,
+    _compute_chunks,
+    _HandlePool,
+    _parse_multiscale,
+    _parse_roi,
+    _read_chunks,
+    _rects_occupancy,
+    _roi_transformations,
+)
+
+# Readers are opened lazily per thread and worker process
+# Dask tasks only carry the path to the file
+_CZI_HANDLES = _HandlePool(opener=pyczi.CziReader)
 
 
 class CZIPixelType(Enum):
@@ -19,12 +38,15 @@ class CZIPixelType(Enum):
     Stores dimensionality, data type, and channel names of CZI pixel types
     as class for simplified access.
     Documented pixel types https://zeiss.github.io/libczi/accessors.html
+
+    Pixel types are stored in their native data type. Types are defined in order of
+    increasing complexity, so that mixed channels can be widened without data loss.
     """
 
-    Gray8 = (1, np.uint16, None)
+    Gray8 = (1, np.uint8, None)
     Gray16 = (1, np.uint16, None)
     Gray32Float = (1, np.float32, None)
-    Bgr24 = (3, np.uint16, ["b", "g", "r"])
+    Bgr24 = (3, np.uint8, ["b", "g", "r"])
     Bgr48 = (3, np.uint16, ["b", "g", "r"])
     Bgr96Float = (3, np.float32, ["b", "g", "r"])
     Invalid = (np.nan, np.nan, np.nan)
@@ -73,40 +95,195 @@ def _parse_pixel_type(slide: pyczi.CziReader, channels: list[int]) -> tuple[Any,
     return complex_pixel_spec, channel_dim
 
 
+def _get_subblock_boundaries(
+    slide: pyczi.CziReader, planes: list[dict[str, int]], roi: tuple[int, int, int, int]
+) -> tuple[NDArray[np.int_], NDArray[np.int_]] | None:
+    """Return upper left coordinates (x, y) of all full resolution subblocks in the planes and region
+
+    Parameters
+    ----------
+    slide
+        CziReader, slide representation
+    planes
+        Plane coordinates (C, T, Z) of subblocks
+    roi
+        Region of interest (x, y, width, height). Only subblocks that intersect the region are considered
+
+    Returns
+    -------
+    Unique x and y coordinates of the subblocks, `None` if the region does not contain any subblocks
+    """
+    xs, ys = [], []
+
+    def _collect(index: int, info: Any) -> bool:
+        xs.append(info.logicalRect.x)
+        ys.append(info.logicalRect.y)
+        return True
+
+    for plane in planes:
+        slide.enumerate_subblocks_subset(_collect, plane=plane, roi=roi, only_layer0=True)
+
+    if len(xs) == 0:
+        return None
+    return np.unique(xs), np.unique(ys)
+
+
+def _get_subblock_rects(
+    slide: pyczi.CziReader, planes: list[dict[str, int]], roi: tuple[int, int, int, int]
+) -> NDArray[np.int_]:
+    """Return rectangles (x, y, width, height) of all full resolution subblocks in the planes and region
+
+    Parameters
+    ----------
+    slide
+        CziReader, slide representation
+    planes
+        Plane coordinates (C, T, Z) of subblocks
+    roi
+        Region of interest (x, y, width, height). Only subblocks that intersect the region are considered
+
+    Returns
+    -------
+    Array of shape (n_subblocks, 4)
+    """
+    rects = []
+
+    def _collect(index: int, info: Any) -> bool:
+        rect = info.logicalRect
+        rects.append((rect.x, rect.y, rect.w, rect.h))
+        return True
+
+    for plane in planes:
+        slide.enumerate_subblocks_subset(_collect, plane=plane, roi=roi, only_layer0=True)
+
+    return np.array(rects, dtype=int).reshape(-1, 4)
+
+
+def _subblock_downsamples(logical_size: int, physical_size: int) -> set[int]:
+    """Return all integer downsample factors that map the logical size of a subblock to its physical size
+
+    The physical size is the logical size divided by the downsample factor, up to rounding. Subblocks that are
+    cropped at the border of the image can be small, so that several factors are consistent with their size.
+    """
+    lower = logical_size / (physical_size + 1)
+    upper = logical_size / (physical_size - 1) if physical_size > 1 else logical_size + 1
+    return set(range(math.floor(lower) + 1, math.ceil(upper)))
+
+
+def _get_pyramid_downsamples(
+    slide: pyczi.CziReader, plane: dict[str, int], roi: tuple[int, int, int, int]
+) -> list[int]:
+    """Return downsample factors of all pyramid levels stored in a plane and region
+
+    Parameters
+    ----------
+    slide
+        CziReader, slide representation
+    plane
+        Plane coordinates (C, T, Z) of subblocks
+    roi
+        Region of interest (x, y, width, height)
+
+    Returns
+    -------
+    Sorted downsample factors relative to the full resolution, always including the full resolution (1)
+
+    Note
+    ----
+    Pyramid subblocks cover a larger region (logical size) than the number of stored pixels (physical size).
+    Subblocks that are cropped at the border of the image are ignored if their sizes do not determine a single
+    downsample factor.
+    """
+    downsamples = {1}
+
+    def _collect(index: int, info: Any) -> bool:
+        logical, physical = info.logicalRect, info.physicalSize
+        candidates = _subblock_downsamples(logical.w, physical.w) & _subblock_downsamples(logical.h, physical.h)
+        if len(candidates) > 1:
+            # Subblocks that are not cropped cover exactly the downsampled size
+            candidates = {d for d in candidates if logical.w == d * physical.w and logical.h == d * physical.h}
+        if len(candidates) == 1:
+            downsamples.update(candidates)
+        return True
+
+    slide.enumerate_subblocks_subset(_collect, plane=plane, roi=roi, only_layer0=False)
+
+    return sorted(downsamples)
+
+
+def _parse_plane_selection(
+    slide: pyczi.CziReader, selection: int | list[int] | range | Literal["all"], dimension: Literal["T", "Z"]
+) -> int | list[int]:
+    """Parse the selected indices of a plane dimension (T or Z)
+
+    Parameters
+    ----------
+    slide
+        CziReader, slide representation
+    selection
+        Single index, sequence of indices, or `all` for all indices of the dimension in the file
+    dimension
+        Plane dimension
+
+    Returns
+    -------
+    Single index, or list of indices for stacks
+    """
+    if isinstance(selection, int | np.integer):
+        return int(selection)
+
+    start, end = slide.total_bounding_box.get(dimension, (0, 1))
+    if isinstance(selection, str):
+        if selection != "all":
+            raise ValueError(f"Selection of {dimension} needs to be an index, a sequence of indices, or `all`")
+        return list(range(start, end))
+
+    indices = [int(index) for index in selection]
+    if len(indices) == 0:
+        raise ValueError(f"Selection of {dimension} is empty")
+    if not all(start <= index < end for index in indices):
+        raise ValueError(f"Indices {indices} of {dimension} out of range. Available indices: {list(range(start, end))}")
+    return indices
+
+
 def _get_img(
-    slide: pyczi.CziReader,
+    path: str,
     x0: int,
     y0: int,
     width: int,
     height: int,
-    channel: int = 0,
+    channels: list[int] | None = None,
     scene: int | None = None,
     timepoint: int = 0,
     z_stack: int = 0,
+    downsample: int = 1,
 ) -> NDArray:
     """Return numpy array of slide region
 
     Parameters
     ----------
-    slide
-        WSI
+    path
+        Path to CZI file. The reader is obtained from a per-thread handle pool
     x0/y0
-        Upper left corner (x0, y0) to read
+        Upper left corner (x0, y0) to read in full resolution coordinates
     width/height
-        Size of tile in x direction (width) and y direction (height)
-    channel
-        Channel of image
+        Size of returned tile in x direction (width) and y direction (height)
+    channels
+        Channels of image that are read within the same task (defaults to [0])
     scene
         Scene index (None for all scenes)
     timepoint
         Timepoint in image series (0 if only one timepoint exists)
     z_stack
         Z stack in z-series (0 if only one layer exists)
+    downsample
+        Downsample factor of the pyramid level. The tile covers a region of size (width * downsample, height * downsample)
+        in full resolution coordinates and is read from the stored pyramid subblocks with libCZI zoom
 
     Returns
     -------
     np.array
-        Image in (c, y, x) format and RGBA channels
+        Image in (c, y, x) format, with all requested channels stacked along the first axis
     """
     # pylibCZIrw returns an np.ndarray
     # Shape VIHT*Z*Y*X*C (*: Obligatory)
@@ -120,47 +297,380 @@ def _get_img(
     # M-index starts counting from zero to the number of tiles on that plane
     # S: Scene: Tag-like- tags images of similar interest, default None considers all scenes
     # Add scene parameter if specified
-    img = slide.read(plane={"C": channel, "T": timepoint, "Z": z_stack}, roi=(x0, y0, width, height), scene=scene)
+    channels = [0] if channels is None else channels
+    slide = _CZI_HANDLES.get(path)
+
+    roi = (x0, y0, width * downsample, height * downsample)
+    zoom = None if downsample == 1 else 1 / downsample
+
+    # Decode all channels of the tile in a single task
+    with _TilePhase("decode"):
+        imgs = [
+            slide.read(plane={"C": channel, "T": timepoint, "Z": z_stack}, roi=roi, scene=scene, zoom=zoom)
+            for channel in channels
+        ]
+
+    # Return image (y, x, c) -> (c, y, x) format as contiguous block
+    # Zoomed reads might deviate from the requested size by rounding, crop or pad them
+    with _TilePhase("transpose"):
+        block = np.zeros((sum(img.shape[-1] for img in imgs), height, width), dtype=np.result_type(*imgs))
+        offset = 0
+        for img in imgs:
+            h, w, c = min(img.shape[0], height), min(img.shape[1], width), img.shape[-1]
+            block[offset : offset + c, :h, :w] = np.moveaxis(img[:h, :w], -1, 0)
+            offset += c
+    return block
+
+
+def _projection_dtype(dtype: np.dtype, z_projection: Literal["max", "mean", "sum"]) -> np.dtype:
+    """Return the data type of a z-projection
+
+    Maximum projections keep the pixel type, sums of integer types are widened to at least 32 bit
+    to prevent overflows and means are returned as floats.
+    """
+    if z_projection == "max":
+        return np.dtype(dtype)
+    if z_projection == "sum":
+        return np.promote_types(dtype, np.uint32 if np.issubdtype(dtype, np.unsignedinteger) else np.int32)
+    if z_projection == "mean":
+        return np.promote_types(dtype, np.float32)
+    raise ValueError(f"Parameter z_projection needs to be one of `max`, `mean`, `sum`, not {z_projection}")
+
+
+def _get_projected_img(
+    path: str,
+    x0: int,
+    y0: int,
+    width: int,
+    height: int,
+    z_stacks: list[int],
+    z_projection: Literal["max", "mean", "sum"],
+    projection_dtype: np.dtype,
+    **kwargs: Any,
+) -> NDArray:
+    """Return the z-projection of a slide region
+
+    Planes are read one after another and reduced into the projection, so that at most two planes of the
+    tile are held in memory.
+
+    Parameters
+    ----------
+    path
+        Path to CZI file
+    x0/y0
+        Upper left corner (x0, y0) to read in full resolution coordinates
+    width/height
+        Size of returned tile in x direction (width) and y direction (height)
+    z_stacks
+        Z-planes that are projected
+    z_projection
+        Reduction across planes
+    projection_dtype
+        Data type of the projection (see :func:`_projection_dtype`)
+    kwargs
+        Passed to :func:`_get_img`
+
+    Returns
+    -------
+    np.array
+        Projected image in (c, y, x) format
+    """
+    reduce = np.maximum if z_projection == "max" else np.add
+
+    projection = None
+    for z_stack in z_stacks:
+        img = _get_img(path, x0=x0, y0=y0, width=width, height=height, z_stack=z_stack, **kwargs)
+        with _TilePhase("project"):
+            if projection is None:
+                projection = img.astype(projection_dtype)
+            else:
+                reduce(projection, img, out=projection, dtype=projection_dtype)
+
+    if z_projection == "mean":
+        projection /= len(z_stacks)
+    return projection
+
+
+def _read_czi_region(
+    path: str,
+    slide: pyczi.CziReader,
+    region: tuple[int, int, int, int],
+    scene: int | None,
+    chunk_size: tuple[int, int] | Literal["auto"],
+    channels: list[int],
+    channel_names: list[str],
+    pixel_spec: CZIPixelType,
+    n_channel: int,
+    timepoint: int,
+    grid_timepoints: list[int],
+    z_stack: int | list[int],
+    z_projection: Literal["max", "mean", "sum"] | None,
+    pyramidal: bool,
+    roi: tuple[int, int, int, int] | GeoDataFrame | None,
+    roi_margin: int,
+    skip_empty: bool,
+    **kwargs: Any,
+) -> Image2DModel | Image3DModel:
+    """Read a rectangular region (x, y, width, height) of a CZI file to a (multiscale) image
+
+    The reader handle and parsed metadata are shared between all regions of a file. If multiple z-planes
+    are selected, the planes are stacked to a (c, z, y, x) image and all planes share the same chunk grid,
+    or they are projected within every tile if `z_projection` is passed. The automatic chunk grid is derived
+    from the subblocks of all selected planes and the timepoints in `grid_timepoints`.
+    """
+    # Tiles are cached per file version
+    cache_key = _file_identity(path)
+    xmin, ymin, width, height = region
+
+    # Restrict region to the region of interest
+    if roi is not None:
+        roi = _parse_roi(roi, dimensions=(width, height), margin=roi_margin)
+        xmin, ymin, width, height = xmin + roi[0], ymin + roi[1], roi[2], roi[3]
+        kwargs["transformations"] = _roi_transformations(roi, kwargs.get("transformations"))
+
+    # Z-stacks are read plane by plane on the same chunk grid or projected within every tile
+    z_stacks = z_stack if isinstance(z_stack, list) else [z_stack]
+    func, dtype = _get_img, pixel_spec.dtype
+    if z_projection is not None:
+        func, dtype = _get_projected_img, _projection_dtype(pixel_spec.dtype, z_projection)
+        plane_kwargs = {"z_stacks": z_stacks, "z_projection": z_projection, "projection_dtype": dtype}
+    elif isinstance(z_stack, list):
+        plane_kwargs = {"planes": [{"z_stack": z} for z in z_stacks]}
+    else:
+        plane_kwargs = {"z_stack": z_stack}
+
+    # Define coordinates for chunkwise loading of the slide
+    boundaries = None
+    if chunk_size == "auto":
+        chunk_size = _compute_auto_chunk_size(n_channel=n_channel, dtype=pixel_spec.dtype)
+        # Chunk boundaries follow the subblocks of all selected planes, so that all planes and timepoints
+        # share the same chunk grid
+        boundaries = _get_subblock_boundaries(
+            slide,
+            planes=[{"C": channel, "T": t, "Z": z} for channel in channels for t in grid_timepoints for z in z_stacks],
+            roi=(xmin, ymin, width, height),
+        )
+
+    chunk_coords = _compute_chunks(
+        dimensions=(width, height), chunk_size=chunk_size, min_coordinates=(xmin, ymin), boundaries=boundaries
+    )
+
+    # Chunks without subblocks are not read, the compositor would return zeros
+    subblock_rects = None
+    if skip_empty:
+        subblock_rects = _get_subblock_rects(
+            slide,
+            planes=[{"C": channel, "T": timepoint, "Z": z} for channel in channels for z in z_stacks],
+            roi=(xmin, ymin, width, height),
+        )
+
+    # One task per tile returns all selected channels as (c, y, x) block
+    array = _read_chunks(
+        func,
+        slide=path,
+        cache_key=cache_key,
+        coords=chunk_coords,
+        occupancy=_rects_occupancy(subblock_rects, chunk_coords) if skip_empty else None,
+        n_channel=n_channel,
+        dtype=dtype,
+        channels=channels,
+        scene=scene,
+        timepoint=timepoint,
+        **plane_kwargs,
+    )
+
+    arrays = [array]
+
+    if pyramidal:
+        downsamples = _get_pyramid_downsamples(
+            slide,
+            plane={"C": channels[0], "T": timepoint, "Z": z_stacks[0]},
+            roi=(xmin, ymin, width, height),
+        )
+
+        if len(downsamples) == 1:
+            warn(
+                "CZI file does not contain pyramid levels, pass `scale_factors` to compute them",
+                stacklevel=3,
+            )
+
+        for downsample in downsamples[1:]:
+            level_width, level_height = width // downsample, height // downsample
+            if (level_width == 0) or (level_height == 0):
+                break
+
+            # Chunk the pyramid level and map chunk corners back to full resolution coordinates
+            level_coords = _compute_chunks(dimensions=(level_width, level_height), chunk_size=chunk_size)
+            level_coords[..., 0] = xmin + level_coords[..., 0] * downsample
+            level_coords[..., 1] = ymin + level_coords[..., 1] * downsample
+
+            level_array = _read_chunks(
+                func,
+                slide=path,
+                cache_key=cache_key,
+                coords=level_coords,
+                occupancy=_rects_occupancy(subblock_rects, level_coords, downsample=downsample) if skip_empty else None,
+                n_channel=n_channel,
+                dtype=dtype,
+                channels=channels,
+                scene=scene,
+                timepoint=timepoint,
+                downsample=downsample,
+                **plane_kwargs,
+            )
+            arrays.append(level_array)
+
+    is_stack = isinstance(z_stack, list) and z_projection is None
+    dims = "czyx" if is_stack else "cyx"
+    if pyramidal:
+        return _parse_multiscale(arrays, c_coords=channel_names, dims=dims, **kwargs)
+
+    model = Image3DModel if is_stack else Image2DModel
+    return model.parse(
+        arrays[0],
+        dims=dims,
+        c_coords=channel_names,
+        **kwargs,
+    )
+
+
+def _read_czi_scene(
+    slide: pyczi.CziReader,
+    scene: int | Literal["all"] | None,
+    roi: tuple[int, int, int, int] | GeoDataFrame | None,
+    roi_margin: int,
+    **kwargs: Any,
+) -> Image2DModel | Image3DModel | dict[int, Image2DModel | Image3DModel]:
+    """Read a single scene, all scenes (`scene=None`), or every scene separately (`scene="all"`) of a CZI file
+
+    Keyword arguments are passed to :func:`_read_czi_region`
+    """
+    if scene == "all":
+        # Every scene only covers its own bounding rectangle, the space between scenes is never read
+        total_xmin, total_ymin, total_width, total_height = slide.total_bounding_rectangle
+        if roi is not None:
+            # Region of interest in coordinates of the full slide
+            roi = _parse_roi(roi, dimensions=(total_width, total_height), margin=roi_margin)
+
+        images = {}
+        for scene_idx, scene_rect in sorted(slide.scenes_bounding_rectangle.items()):
+            # Place scenes at their position within the slide
+            offset_x, offset_y = scene_rect.x - total_xmin, scene_rect.y - total_ymin
+            scene_kwargs = {
+                **kwargs,
+                "transformations": _roi_transformations(
+                    (offset_x, offset_y, scene_rect.w, scene_rect.h), kwargs.get("transformations")
+                ),
+            }
+            scene_roi = None if roi is None else (roi[0] - offset_x, roi[1] - offset_y, roi[2], roi[3])
+            try:
+                images[scene_idx] = _read_czi_region(
+                    slide=slide,
+                    region=tuple(scene_rect),
+                    scene=scene_idx,
+                    roi=scene_roi,
+                    roi_margin=0,
+                    **scene_kwargs,
+                )
+            except ValueError as e:
+                # Scenes that do not overlap with the region of interest are omitted
+                if roi is None or "does not overlap" not in str(e):
+                    raise
+        if not images:
+            raise ValueError("Region of interest does not overlap with any scene")
+        return images
+
+    # Determine bounding rectangle based on scene selection
+    if scene is not None:
+        # Get scene-specific bounding rectangle
+        scenes_rect = slide.scenes_bounding_rectangle
+        if scene not in scenes_rect:
+            raise ValueError(f"Scene {scene} not found in CZI file. Available scenes: {list(scenes_rect.keys())}")
+        region = tuple(scenes_rect[scene])
+    else:
+        # Use total bounding rectangle for all scenes
+        region = tuple(slide.total_bounding_rectangle)
 
-    # Return image (y, x, c) -> (c, y, x) format
-    return np.array(img).transpose(2, 0, 1)
+    return _read_czi_region(slide=slide, region=region, scene=scene, roi=roi, roi_margin=roi_margin, **kwargs)
 
 
 def read_czi(
     path: str,
-    chunk_size: tuple[int, int] = (10000, 10000),
+    chunk_size: tuple[int, int] | Literal["auto"] = (10000, 10000),
     channels: int | list[int] | None = None,
-    scene: int | None = None,
-    timepoint: int = 0,
-    z_stack: int = 0,
+    scene: int | Literal["all"] | None = None,
+    timepoint: int | list[int] | range | Literal["all"] = 0,
+    z_stack: int | list[int] | range | Literal["all"] = 0,
+    z_projection: Literal["max", "mean", "sum"] | None = None,
+    pyramidal: bool = False,
+    roi: tuple[int, int, int, int] | GeoDataFrame | None = None,
+    roi_margin: int = 0,
+    skip_empty: bool = False,
     **kwargs: Mapping[str, Any],
-) -> Image2DModel:
+) -> Image2DModel | Image3DModel | dict[int, Image2DModel | Image3DModel]:
     """Read .czi to Image2DModel
 
     Uses the CZI API to read .czi Carl Zeiss image format to spatialdata image format.
+    The returned image is lazy and can be computed with any dask scheduler (threads, processes, distributed).
+    Each thread/worker opens its own reader of the file on demand.
 
     Parameters
     ----------
     path
         Path to file
     chunk_size
-        Size of the individual regions that are read into memory during the process.
+        Size of the individual regions that are read into memory during the process in format (x, y).
+        If `auto`, chunk borders are aligned to the acquisition tiles (subblocks) of all selected channels,
+        z-planes, and timepoints in the file, so that every subblock is only decoded once. Chunks are grown to approximately the dask `array.chunk-size` configuration.
     channels
         Defaults to `None` which automatically selects all available channels. Passing the numeric index of a single or multiple channels
         subsets the data to the specified channels.
     scene
         Index of the scene to read. If `None` (default), all scenes will be considered.
         If specified, only subblocks of the specified scene contribute to the parsed image.
+        If `all`, every scene is read as a separate image that only covers the bounding rectangle of the scene,
+        and a mapping of scene index to image is returned. The images share the file handle and the
+        parsed metadata and can be computed concurrently (e.g. with a single :func:`dask.compute` call).
+        Each image is translated to the position of the scene within the full slide.
     timepoint
-        If timeseries, select the given index (defaults to 0 [first])
+        If timeseries, select the given index (defaults to 0 [first]). If a sequence of indices (e.g. a `range`)
+        or `all` is passed, a mapping of timepoint index to image is returned. The images of all timepoints share
+        the file handle, the parsed metadata, and the chunk grid. Cannot be combined with `scene="all"`.
     z_stack
-        If z_stack, selects the given z-plane (defaults to 0 [first])
+        If z_stack, selects the given z-plane (defaults to 0 [first]). If a sequence of indices (e.g. a `range`)
+        or `all` is passed, the planes are stacked to a single lazy :class:`spatialdata.models.Image3DModel`
+        with dimensions (c, z, y, x). Every chunk holds a single plane of a tile, and all planes are read on
+        the same chunk grid.
+    z_projection
+        Project the selected z-planes to a 2D image, either by their maximum (`max`), mean (`mean`, float),
+        or sum (`sum`, integer types widened to at least 32 bit). The planes are reduced within the task that reads
+        a tile, so that the stack is never held in memory and the number of tasks equals the number of tiles.
+        Defaults to `None` (no projection)
+    pyramidal
+        Whether to create a multiscale image from the pyramid levels stored in the file. Lower resolution
+        scales are read directly from the stored pyramid subblocks and are not recomputed from the full resolution
+        image. Cannot be combined with `scale_factors`.
+    roi
+        Only read a region of interest, passed as (x, y, width, height) in pixel coordinates of the image or
+        as :class:`spatialdata.models.ShapesModel` whose total bounds define the region.
+        The region is clipped to the image (or the selected scene). The returned image is translated to the position
+        of the region in the full image. For `scene="all"`, the region is defined in coordinates of the full slide
+        and scenes that do not overlap with the region are omitted. Defaults to `None` (full image)
+    roi_margin
+        Margin in pixels added to all sides of the region of interest
+    skip_empty
+        Whether to skip chunks that do not contain any acquired subblock according to the subblock directory of the
+        file (e.g. background between tissue regions). Empty chunks are returned as constant zero blocks without
+        reading the file. The result is identical to reading all chunks. See :func:`dvpio.read.image.read_coverage_mask`
+        for the corresponding mask. Defaults to `False`, as for :func:`dvpio.read.image.read_openslide`
     kwargs
         Keyword arguments passed to :meth:`spatialdata.models.Image2DModel.parse`
 
     Returns
     -------
-    :class:`spatialdata.models.Image2DModel`
+    :class:`spatialdata.models.Image2DModel`, or :class:`spatialdata.models.Image3DModel` for multiple z-planes.
+    A mapping of scene index to image for `scene="all"` and of timepoint index to image for multiple timepoints.
+    The parsed metadata (see :func:`dvpio.read.image.read_metadata`) is stored in `image.attrs["metadata"]`.
 
 
     Example
@@ -187,6 +697,21 @@ def read_czi(
         read_czi(czi_path_multi_scene, scene=0)
         # > <xarray.DataArray 'image' (c: 2, y: 1416, x: 1960)> Size: 11MB
 
+    For slides with multiple scattered scenes, read all scenes separately without the empty space in between
+
+    .. code-block:: python
+
+        scenes = read_czi(czi_path_multi_scene, scene="all")
+        # > {0: <xarray.DataArray 'image' (c: 2, y: 1416, x: 1960)>, 1: <xarray.DataArray 'image' ...>}
+        sdata = SpatialData(images={f"scene_{idx}": image for idx, image in scenes.items()})
+
+    To only read the region around a set of shapes (e.g. cells selected for excision), pass them as `roi`
+
+    .. code-block:: python
+
+        shapes = read_lmd(...)
+        read_czi(czi_path, roi=shapes, roi_margin=100)
+
     You can pass additional keyword arguments to :meth:`spatialdata.models.Image2DModel.parse`. For example,
     to generate a pyramidal image for overall faster data access, pass the `scale_factors` argument
 
@@ -199,26 +724,40 @@ def read_czi(
         #   |-- Group: /scale0
         #   |-- Group: /scale1
         #   `-- Group: /scale2
+
+    If the file already contains a pyramid, read the stored pyramid levels instead
+
+    .. code-block:: python
+
+        read_czi(czi_path, pyramidal=True)
+
+    Read all planes of a z-stack as a single 3D image, or a range of timepoints
+
+    .. code-block:: python
+
+        read_czi(czi_path_z_stack, z_stack="all")
+        # > <xarray.DataArray 'image' (c: 2, z: 30, y: 1440, x: 21718)>
+        read_czi(czi_path_time_series, timepoint=range(0, 10), z_stack="all")
+        # > {0: <xarray.DataArray 'image' (c: 2, z: 30, y: 1440, x: 21718)>, 1: ...}
+
+    Or directly read the maximum projection of all planes
+
+    .. code-block:: python
+
+        read_czi(czi_path_z_stack, z_stack="all", z_projection="max")
+        # > <xarray.DataArray 'image' (c: 2, y: 1440, x: 21718)>
     """
-    # Read slide
-    czidoc_r = pyczi.CziReader(path)
+    if pyramidal and kwargs.get("scale_factors") is not None:
+        raise ValueError("Arguments `pyramidal` and `scale_factors` are mutually exclusive")
 
-    # Parse metadata
-    czi_metadata = CZIImageMetadata(metadata=czidoc_r.metadata)
+    # Tasks only store the absolute path, so that they can be sent to other processes
+    path = os.path.abspath(path)
 
-    # Determine bounding rectangle based on scene selection
-    if scene is not None:
-        # Get scene-specific bounding rectangle
-        scenes_rect = czidoc_r.scenes_bounding_rectangle
-        if scene not in scenes_rect:
-            raise ValueError(f"Scene {scene} not found in CZI file. Available scenes: {list(scenes_rect.keys())}")
-        xmin, ymin, width, height = scenes_rect[scene]
-    else:
-        # Use total bounding rectangle for all scenes
-        xmin, ymin, width, height = czidoc_r.total_bounding_rectangle
+    # Read slide
+    czidoc_r = _CZI_HANDLES.get(path)
 
-    # Define coordinates for chunkwise loading of the slide
-    chunk_coords = _compute_chunks(dimensions=(width, height), chunk_size=chunk_size, min_coordinates=(xmin, ymin))
+    # Parse metadata, metadata is parsed once per file and shared with read_metadata
+    czi_metadata = _load_metadata(CZIImageMetadata, path, lambda: CZIImageMetadata._from_xml(czidoc_r.raw_metadata))
 
     # We support the option to automatically extract channels from the metadata (None)
     # Pass a list of indices list[int] or a single index
@@ -238,23 +777,6 @@ def read_czi(
             Currently, only 1D channels are supported for multi-channel images"""
         )
 
-    chunks = [
-        _read_chunks(
-            _get_img,
-            slide=czidoc_r,
-            coords=chunk_coords,
-            n_channel=dimensionality,
-            dtype=pixel_spec.dtype,
-            channel=channel,
-            scene=scene,
-            timepoint=timepoint,
-            z_stack=z_stack,
-        )
-        for channel, dimensionality in zip(channels, channel_dim, strict=True)  # type: ignore
-    ]
-
-    array = _assemble(chunks)
-
     # Passed channel names (c_coords) should take precendence
     # If no channel names are passed, use pixel_specs.
     # This is useful for BRG images as it automatically sets the channel order correctly
@@ -266,9 +788,36 @@ def read_czi(
     if channel_names is None:
         channel_names = np.array(czi_metadata.channel_names)[channels]
 
-    return Image2DModel.parse(
-        array,
-        dims="cyx",
-        c_coords=channel_names,
-        **kwargs,
-    )
+    timepoint = _parse_plane_selection(czidoc_r, timepoint, dimension="T")
+    z_stack = _parse_plane_selection(czidoc_r, z_stack, dimension="Z")
+    if z_projection is not None:
+        # Validate early, a single plane is projected to itself
+        _projection_dtype(pixel_spec.dtype, z_projection)
+
+    read_kwargs = {
+        "path": path,
+        "slide": czidoc_r,
+        "chunk_size": chunk_size,
+        "channels": channels,
+        "channel_names": channel_names,
+        "pixel_spec": pixel_spec,
+        "n_channel": sum(channel_dim),
+        "z_stack": z_stack,
+        "z_projection": z_projection,
+        "pyramidal": pyramidal,
+        "roi": roi,
+        "roi_margin": roi_margin,
+        "skip_empty": skip_empty,
+    }
+
+    if isinstance(timepoint, list):
+        if scene == "all":
+            raise ValueError("Multiple timepoints cannot be combined with `scene='all'`")
+        images = {
+            t: _read_czi_scene(scene=scene, timepoint=t, grid_timepoints=timepoint, **read_kwargs, **kwargs)
+            for t in timepoint
+        }
+    else:
+        images = _read_czi_scene(scene=scene, timepoint=timepoint, grid_timepoints=[timepoint], **read_kwargs, **kwargs)
+
+    return _attach_metadata(images, czi_metadata, channels=channels)
@@ -1,11 +1,25 @@
 """Reader for Whole Slide Images"""
 
+import math
+
 import numpy as np
 import openslide
+from geopandas import GeoDataFrame
 from numpy.typing import NDArray
+from PIL import Image
 from spatialdata.models import Image2DModel
 
-from ._utils import _assemble, _compute_chunks, _read_chunks
+from ._cache import _file_identity
+from ._instrument import _TilePhase
+from ._metadata import OpenslideImageMetadata, _attach_metadata, _load_metadata
+from ._utils import (
+    _compute_chunks,
+    _mask_occupancy,
+    _parse_multiscale,
+    _parse_roi,
+    _read_chunks,
+    _roi_transformations,
+)
 
 
 def _get_img(
@@ -15,6 +29,7 @@ def _get_img(
     width: int,
     height: int,
     level: int,
+    drop_alpha: bool = False,
 ) -> NDArray:
     """Return numpy array of slide region
 
@@ -23,27 +38,105 @@ def _get_img(
     slide
         WSI
     x0, y0
-        Upper left corner (x, y) to read
+        Upper left corner (x, y) to read in level 0 coordinates
     width, height
         Size of tile in x direction (width) and y direction (height)
     level
         Level in pyramidal image format
+    drop_alpha
+        Whether to return RGB instead of RGBA channels. Transparent pixels (e.g. outside of the
+        scanned region) are composited onto the background color of the slide, in line with openslide
 
     Returns
     -------
     np.array
-        Image in (c=4, y, x) format and RGBA channels
+        C-contiguous image in (c=4, y, x) format and RGBA channels or (c=3, y, x) format and RGB channels
     """
-    # Openslide returns a PILLOW image in RGBA format
+    # Openslide returns a PILLOW image in (non-premultiplied) RGBA format
     # Shape (x, y, c)
-    img = slide.read_region((x0, y0), level=level, size=(width, height))
+    with _TilePhase("decode"):
+        img = slide.read_region((x0, y0), level=level, size=(width, height))
+
+    if drop_alpha:
+        # Only composite if tile is not fully opaque
+        if img.getextrema()[3][0] < 255:
+            background_color = slide.properties.get(openslide.PROPERTY_NAME_BACKGROUND_COLOR, "ffffff")
+            background = Image.new("RGB", img.size, f"#{background_color}")
+            background.paste(img, mask=img.getchannel("A"))
+            img = background
+        else:
+            img = img.convert("RGB")
 
     # Pillow stores images in (y, x, c) format
-    # Return image in (c=4, y, x) format
-    return np.array(img).transpose(2, 0, 1)
+    # Copy directly into planar (c, y, x) buffer
+    with _TilePhase("transpose"):
+        block = np.empty((len(img.getbands()), height, width), dtype=np.uint8)
+        np.copyto(block, np.moveaxis(np.asarray(img), -1, 0))
+    return block
+
+
+def _get_coverage_mask(slide: openslide.OpenSlide, max_pixels: int = 4096**2) -> tuple[NDArray[np.bool_], float] | None:
+    """Return a low resolution mask of the scanned (non-transparent) area of a slide
+
+    The mask is read from the lowest resolution level. Regions that were not scanned are transparent in openslide.
+    The mask is dilated by one pixel to account for interpolation at the borders of scanned regions.
+
+    Parameters
+    ----------
+    slide
+        WSI
+    max_pixels
+        Maximum number of pixels of the level used for the mask
+
+    Returns
+    -------
+    Mask (y, x) and its downsample factor relative to level 0, `None` if the lowest resolution level is too large
+    """
+    level = slide.level_count - 1
+    width, height = slide.level_dimensions[level]
+    if width * height > max_pixels:
+        return None
+
+    alpha = np.asarray(slide.read_region((0, 0), level=level, size=(width, height)).getchannel("A"))
+    mask = np.pad(alpha > 0, 1)
+    # 3x3 dilation
+    mask = np.logical_or.reduce(
+        [
+            mask[1 + dy : mask.shape[0] - 1 + dy, 1 + dx : mask.shape[1] - 1 + dx]
+            for dy in (-1, 0, 1)
+            for dx in (-1, 0, 1)
+        ]
+    )
+    return mask, slide.level_downsamples[level]
+
+
+def _get_level_region(
+    slide: openslide.OpenSlide, level: int, roi: tuple[int, int, int, int] | None
+) -> tuple[int, int, int, int]:
+    """Return region (x, y, width, height) of a level that covers a region of interest in level 0 coordinates"""
+    level_width, level_height = slide.level_dimensions[level]
+    if roi is None:
+        return 0, 0, level_width, level_height
+
+    downsample = slide.level_downsamples[level]
+    x, y, width, height = roi
+
+    # Downsamples are not necessarily integers, round to the closest level pixel
+    xmin, ymin = round(x / downsample), round(y / downsample)
+    xmax = min(round((x + width) / downsample), level_width)
+    ymax = min(round((y + height) / downsample), level_height)
+    return xmin, ymin, max(xmax - xmin, 1), max(ymax - ymin, 1)
 
 
-def read_openslide(path: str, chunk_size: tuple[int, int] = (10000, 10000), pyramidal: bool = True) -> Image2DModel:
+def read_openslide(
+    path: str,
+    chunk_size: tuple[int, int] = (10000, 10000),
+    pyramidal: bool = True,
+    drop_alpha: bool = False,
+    roi: tuple[int, int, int, int] | GeoDataFrame | None = None,
+    roi_margin: int = 0,
+    skip_empty: bool = False,
+) -> Image2DModel:
     """Read WSI to Image2DModel
 
     Uses openslide to read multiple pathology slide representations and parse them
@@ -77,40 +170,101 @@ def read_openslide(path: str, chunk_size: tuple[int, int] = (10000, 10000), pyra
     chunk_size
         Size of the individual regions that are read into memory during the process in format (x, y)
     pyramidal
-        Whether to create a pyramidal image with same scales as original image
+        Whether to create a pyramidal image with same scales as original image. Every scale is read
+        directly from the corresponding level stored in the file.
+    drop_alpha
+        Whether to drop the alpha channel and return an RGB image. Reduces memory and storage by 25%.
+        Transparent pixels (e.g. regions outside of the scanned area) are filled with the background color
+        of the slide (`openslide.background-color`, defaults to white), as done by openslide for thumbnails.
+    roi
+        Only read a region of interest, passed as (x, y, width, height) in pixel coordinates of the image or
+        as :class:`spatialdata.models.ShapesModel` whose total bounds define the region.
+        The region is clipped to the image. The returned image is translated to the position
+        of the region in the full image. For pyramidal images, the region is expanded to multiples of the
+        downsample factors, so that all scales cover the same region. Defaults to `None` (full image)
+    roi_margin
+        Margin in pixels added to all sides of the region of interest
+    skip_empty
+        Whether to skip chunks outside of the scanned area. The scanned area is derived from the transparency of
+        the lowest resolution level (see :func:`dvpio.read.image.read_coverage_mask`). Empty chunks are returned as
+        constant blocks (transparent, or the background color if `drop_alpha=True`) without reading the file.
+        Only formats that mark unscanned regions as transparent (e.g. MIRAX) benefit from this option.
+        Defaults to `False`, as for :func:`dvpio.read.image.read_czi`
 
     Returns
     -------
     :class:`spatialdata.models.Image2DModel`
+        The parsed metadata (see :func:`dvpio.read.image.read_metadata`) is stored in `image.attrs["metadata"]`.
     """
     slide = openslide.OpenSlide(path)
+    cache_key = _file_identity(path)
 
-    # Image is represented as pyramid. Read highest resolution
-    dimensions = slide.dimensions
+    n_channel = 3 if drop_alpha else 4
+    channel_names = ["r", "g", "b"] if drop_alpha else ["r", "g", "b", "a"]
+
+    transformations = None
+    if roi is not None:
+        # Align region with pixels of all levels
+        align = math.lcm(*(round(downsample) for downsample in slide.level_downsamples)) if pyramidal else 1
+        roi = _parse_roi(roi, dimensions=slide.dimensions, margin=roi_margin, align=align)
+        transformations = _roi_transformations(roi)
+
+    # Low resolution mask of the scanned area, chunks outside of it are not read
+    coverage = _get_coverage_mask(slide) if skip_empty else None
+    if drop_alpha:
+        background_color = slide.properties.get(openslide.PROPERTY_NAME_BACKGROUND_COLOR, "ffffff")
+        fill_value = list(bytes.fromhex(background_color))
+    else:
+        fill_value = 0
 
     # Openslide represents scales in format (level[0], level[1], ...)
-    # Each scale factor is represented relative to top level
-    # Get downsamples in format that can be passed to Image2DModel
-    scale_factors = None
-    if pyramidal:
-        scale_factors = [
-            int(slide.level_downsamples[i] / slide.level_downsamples[i - 1])
-            for i in range(1, len(slide.level_downsamples))
-        ]
+    # Read every level natively instead of downsampling the highest resolution
+    levels = range(slide.level_count) if pyramidal else [0]
 
-    # Define coordinates for chunkwise loading of the slide
-    chunk_coords = _compute_chunks(dimensions=dimensions, chunk_size=chunk_size, min_coordinates=(0, 0))
+    arrays = []
+    for level in levels:
+        # Define coordinates for chunkwise loading of the level
+        xmin, ymin, width, height = _get_level_region(slide, level=level, roi=roi)
+        chunk_coords = _compute_chunks(dimensions=(width, height), chunk_size=chunk_size, min_coordinates=(xmin, ymin))
 
-    # Load chunkwise (parallelized with dask.delayed)
-    chunks = _read_chunks(_get_img, slide=slide, coords=chunk_coords, n_channel=4, dtype=np.uint8, level=0)
+        # Openslide expects the upper left corner of a region in level 0 coordinates
+        # Downsamples are not necessarily integers, round to the closest level 0 pixel.
+        # Openslide interpolates regions that do not start on a pixel of the level
+        downsample = slide.level_downsamples[level]
+        chunk_coords[..., :2] = np.round(chunk_coords[..., :2] * downsample)
 
-    # Assemble into a single dask array
-    array = _assemble(chunks)
+        # Load chunkwise (one task per tile)
+        array = _read_chunks(
+            _get_img,
+            slide=slide,
+            cache_key=cache_key,
+            coords=chunk_coords,
+            occupancy=_mask_occupancy(*coverage, chunk_coords, downsample=downsample) if coverage is not None else None,
+            fill_value=fill_value,
+            n_channel=n_channel,
+            dtype=np.uint8,
+            level=level,
+            drop_alpha=drop_alpha,
+        )
+
+        arrays.append(array)
+
+    if pyramidal:
+        image = _parse_multiscale(
+            arrays, c_coords=channel_names, transformations=transformations, chunks=(n_channel, *chunk_size[::-1])
+        )
+    else:
+        image = Image2DModel.parse(
+            arrays[0],
+            dims="cyx",
+            c_coords=channel_names,
+            transformations=transformations,
+            chunks=(n_channel, *chunk_size[::-1]),
+        )
 
-    return Image2DModel.parse(
-        array,
-        dims="cyx",
-        c_coords=["r", "g", "b", "a"],
-        scale_factors=scale_factors,
-        chunks=(4, *chunk_size[::-1]),
+    # Metadata is parsed once per file and shared with read_metadata
+    metadata = _load_metadata(
+        OpenslideImageMetadata, path, lambda: OpenslideImageMetadata(metadata=dict(slide.properties))
     )
+    # The alpha channel is the last channel of openslide images
+    return _attach_metadata(image, metadata, channels=list(range(n_channel)))
@@ -0,0 +1,256 @@
+"""Reader for tiled and pyramidal TIFF/OME-TIFF files"""
+
+import os
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import tifffile
+import zarr
+from numpy.typing import NDArray
+from spatialdata.models import Image2DModel
+
+from ._cache import _file_identity
+from ._instrument import _TilePhase
+from ._utils import _compute_auto_chunk_size, _compute_chunks, _HandlePool, _parse_multiscale, _read_chunks
+
+# Axes that are interpreted as channels, S are samples of a pixel (e.g. RGB)
+_CHANNEL_AXES = "CS"
+
+
+class _TiffHandle:
+    """Per-thread handle to the pyramid levels of a TIFF file
+
+    Uncompressed, contiguously stored levels are memory-mapped, all other levels are accessed through
+    the zarr interface of tifffile, which decodes only the tiles/strips that overlap with a selection.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._tif = tifffile.TiffFile(path)
+        self._stores = []
+        self._levels: dict[tuple[int, int], NDArray | zarr.Array] = {}
+
+    def level(self, series: int, level: int) -> NDArray | zarr.Array:
+        if (series, level) not in self._levels:
+            tiff_series = self._tif.series[series]
+            if tiff_series.levels[level].dataoffset is not None:
+                array = tifffile.memmap(self.path, series=series, level=level, mode="r")
+            else:
+                store = tiff_series.aszarr(level=level)
+                self._stores.append(store)
+                array = zarr.open(store, mode="r")
+            self._levels[(series, level)] = array
+        return self._levels[(series, level)]
+
+    def close(self) -> None:
+        self._levels.clear()
+        for store in self._stores:
+            store.close()
+        self._tif.close()
+
+
+_TIFF_HANDLES = _HandlePool(opener=_TiffHandle)
+
+
+def _parse_axes(axes: str, shape: tuple[int, ...]) -> str | None:
+    """Validate the axes of a TIFF series and return its channel axis
+
+    Besides Y and X, an image may have a single non-singleton channel axis (C or S). All other
+    axes (e.g. Z or T) must be singleton.
+    """
+    sizes = dict(zip(axes, shape, strict=True))
+    if "Y" not in sizes or "X" not in sizes:
+        raise ValueError(f"TIFF series with axes {axes} has no Y and X axes")
+
+    extra_axes = [ax for ax in axes if ax not in "YX" + _CHANNEL_AXES and sizes[ax] > 1]
+    if extra_axes:
+        raise ValueError(f"Only 2D images are supported, but TIFF series has non-singleton axes {extra_axes}")
+
+    channel_axes = [ax for ax in _CHANNEL_AXES if ax in sizes]
+    if len([ax for ax in channel_axes if sizes[ax] > 1]) > 1:
+        raise ValueError(f"TIFF series with axes {axes} has more than one channel axis")
+
+    # Non-singleton channel axis, otherwise any (singleton) channel axis
+    channel_axes = sorted(channel_axes, key=lambda ax: sizes[ax], reverse=True)
+    return channel_axes[0] if channel_axes else None
+
+
+def _get_img(
+    path: str,
+    x0: int,
+    y0: int,
+    width: int,
+    height: int,
+    axes: str,
+    channel_axis: str | None,
+    series: int = 0,
+    level: int = 0,
+) -> NDArray:
+    """Return numpy array of a TIFF region
+
+    Parameters
+    ----------
+    path
+        Path to TIFF file. The file handle is obtained from a per-thread handle pool
+    x0/y0
+        Upper left corner (x0, y0) of the region in coordinates of the level
+    width/height
+        Size of returned tile in x direction (width) and y direction (height)
+    axes
+        Axes of the TIFF series (tifffile convention, e.g. `CYX` or `YXS`)
+    channel_axis
+        Axis that is returned as channel dimension, `None` if the image has no channels
+    series
+        Index of the image series in the file
+    level
+        Pyramid level
+
+    Returns
+    -------
+    np.array
+        Image in (c, y, x) format. For memory-mapped levels, a view of the file without copy
+    """
+    array = _TIFF_HANDLES.get(path).level(series, level)
+
+    index = []
+    for ax in axes:
+        if ax == "Y":
+            index.append(slice(y0, y0 + height))
+        elif ax == "X":
+            index.append(slice(x0, x0 + width))
+        elif ax == channel_axis:
+            index.append(slice(None))
+        else:
+            index.append(0)
+    with _TilePhase("decode"):
+        block = array[tuple(index)]
+
+    if channel_axis is None:
+        return block[np.newaxis]
+    return np.moveaxis(block, [ax for ax in axes if ax in (channel_axis, "Y", "X")].index(channel_axis), 0)
+
+
+def _get_channel_names(tif: tifffile.TiffFile, series: int, n_channel: int, photometric: int) -> list[str] | None:
+    """Return channel names from OME metadata or photometric interpretation"""
+    if tif.is_ome:
+        images = tifffile.xml2dict(tif.ome_metadata)["OME"]["Image"]
+        images = images if isinstance(images, list) else [images]
+        channels = images[series]["Pixels"].get("Channel", [])
+        channels = channels if isinstance(channels, list) else [channels]
+        names = [channel.get("Name") for channel in channels]
+        if len(names) == n_channel and all(names):
+            return [str(name) for name in names]
+
+    if photometric == tifffile.PHOTOMETRIC.RGB and n_channel in (3, 4):
+        return ["r", "g", "b", "a"][:n_channel]
+
+    return None
+
+
+def _get_chunk_size(
+    page: tifffile.TiffPage,
+    shape: tuple[int, int],
+    n_channel: int,
+    dtype: np.dtype,
+    chunk_size: tuple[int, int] | None,
+) -> tuple[int, int]:
+    """Return chunk size (x, y) aligned to the native tiles or strips of a page
+
+    For tiled pages, chunks are single tiles or multiples of the tile size. Stripped pages are read in bands of
+    full width, which are contiguous in memory-mapped files.
+    """
+    height, width = shape
+    if page.is_tiled:
+        tile_size = (page.tilewidth, page.tilelength)
+    else:
+        tile_size = (width, page.rowsperstrip if page.rowsperstrip else height)
+        if chunk_size is None:
+            # Group strips to chunks of approximately the dask chunk size
+            target_height = _compute_auto_chunk_size(n_channel, dtype)[1] ** 2 // width
+            chunk_size = (width, target_height)
+
+    if chunk_size is None:
+        return tile_size
+
+    return tuple(
+        int(min(max(1, round(chunk / tile)) * tile, size))
+        for chunk, tile, size in zip(chunk_size, tile_size, (width, height), strict=True)
+    )
+
+
+def read_tiff(
+    path: str,
+    chunk_size: tuple[int, int] | None = None,
+    series: int = 0,
+    pyramidal: bool = True,
+    **kwargs: Mapping[str, Any],
+) -> Image2DModel:
+    """Read tiled and pyramidal TIFF/OME-TIFF to Image2DModel
+
+    In contrast to :func:`dvpio.read.image.read_custom`, the image is never loaded into memory as a whole. The chunks of the
+    returned lazy image correspond to the tiles (or groups of strips) stored in the file, so that every task decodes
+    each tile only once. Pyramid levels stored in the file (OME-TIFF SubIFDs, SVS, NDPI, ...) are read natively as
+    scales of a multiscale image. Uncompressed, contiguously stored images are memory-mapped and read without copy.
+
+    Parameters
+    ----------
+    path
+        Path to file
+    chunk_size
+        Size of the individual regions that are read into memory during the process in format (x, y).
+        Rounded to multiples of the native tile size. If `None` (default), native tiles are used as chunks.
+        For stripped TIFFs, bands of strips with approximately the dask `array.chunk-size` configuration are used.
+    series
+        Index of the image series in the file
+    pyramidal
+        Whether to create a multiscale image from the pyramid levels stored in the file. Cannot be combined with
+        `scale_factors`.
+    **kwargs
+        Keyword arguments passed to :meth:`spatialdata.models.Image2DModel.parse`
+
+    Returns
+    -------
+    :class:`spatialdata.models.Image2DModel`
+    """
+    if pyramidal and kwargs.get("scale_factors") is not None:
+        raise ValueError("Arguments `pyramidal` and `scale_factors` are mutually exclusive")
+
+    # Tasks only store the absolute path, so that they can be sent to other processes
+    path = os.path.abspath(path)
+    cache_key = _file_identity(path)
+
+    with tifffile.TiffFile(path) as tif:
+        tiff_series = tif.series[series]
+        levels = tiff_series.levels if pyramidal else tiff_series.levels[:1]
+
+        axes = tiff_series.axes
+        channel_axis = _parse_axes(axes, tiff_series.shape)
+        n_channel = tiff_series.shape[axes.index(channel_axis)] if channel_axis is not None else 1
+        channel_names = _get_channel_names(tif, series, n_channel, tiff_series.keyframe.photometric)
+
+        arrays = []
+        for idx, level in enumerate(levels):
+            shape = (level.shape[level.axes.index("Y")], level.shape[level.axes.index("X")])
+            level_chunk_size = _get_chunk_size(level.keyframe, shape, n_channel, level.dtype, chunk_size)
+            chunk_coords = _compute_chunks(dimensions=shape[::-1], chunk_size=level_chunk_size)
+
+            arrays.append(
+                _read_chunks(
+                    _get_img,
+                    slide=path,
+                    cache_key=cache_key,
+                    coords=chunk_coords,
+                    n_channel=n_channel,
+                    dtype=level.dtype,
+                    axes=level.axes,
+                    channel_axis=channel_axis,
+                    series=series,
+                    level=idx,
+                )
+            )
+
+    if len(arrays) > 1:
+        return _parse_multiscale(arrays, c_coords=channel_names, **kwargs)
+
+    return Image2DModel.parse(arrays[0], dims="cyx", c_coords=channel_names, **kwargs)
@@ -1,6 +1,8 @@
 from typing import Literal
 
 import numpy as np
+import shapely
+from geopandas import GeoSeries
 from numpy.typing import NDArray
 from skimage.transform import estimate_transform
 
@@ -71,9 +73,35 @@ def apply_transformation(
     NDArray[np.float64]
         Shape (N, 2) after affine transformation.
     """
-    # Extend shape with ones
-    shape_mod = np.hstack([shape, np.ones(shape=(shape.shape[0], 1))])
-    # Apply affine transformation
-    shape_transformed = shape_mod @ affine_transformation
-    # Reuturn shape without padded ones
-    return shape_transformed[:, :-1]
+    affine_transformation = np.asarray(affine_transformation, dtype=np.float64)
+    # Equivalent to padding the shape with ones and multiplying with the full matrix,
+    # without allocating the padded array
+    return shape @ affine_transformation[:-1, :-1] + affine_transformation[-1, :-1]
+
+
+def transform_geometry(
+    geometry: GeoSeries,
+    affine_transformation: NDArray[np.float64],
+) -> GeoSeries:
+    """Transform all shapes of a geometry column between coordinate systems
+
+    The coordinates of all shapes are transformed with a single matrix multiplication,
+    memory usage is linear in the total number of vertices.
+
+    Parameters
+    ----------
+    geometry
+        Shapes with (x, y) coordinates
+    affine_transformation
+        Affine transformation applied to shapes, see :func:`apply_transformation`
+
+    Returns
+    -------
+    GeoSeries
+        Transformed shapes with the index, name, and crs of `geometry`
+    """
+    # shapely passes the coordinates of all geometries as a single (N, 2) array to the transformation
+    transformed = shapely.transform(
+        geometry.to_numpy(), transformation=lambda coords: apply_transformation(coords, affine_transformation)
+    )
+    return GeoSeries(transformed, index=geometry.index, crs=geometry.crs, name=geometry.name)
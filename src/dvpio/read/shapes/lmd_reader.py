@@ -2,11 +2,13 @@ from typing import Literal
 
 import lmd.lib as pylmd
 import numpy as np
-import shapely
 from spatialdata.models import PointsModel, ShapesModel
 from spatialdata.transformations import Affine, set_transformation
 
-from .geometry import apply_transformation, compute_transformation
+from .geometry import compute_transformation, transform_geometry
+
+# Mirrors (x, y) coordinates at the main diagonal (x, y) -> (y, x)
+_SWITCH_ORIENTATION = np.array([[0, 1, 0], [1, 0, 0], [0, 0, 1]], dtype=float)
 
 
 def transform_shapes(
@@ -16,6 +18,7 @@ def transform_shapes(
     *,
     precision: int | None = None,
     transformation_type: Literal["similarity", "affine", "euclidean"] = "similarity",
+    switch_orientation: bool = False,
 ) -> ShapesModel:
     """Apply coordinate transformation to shapes based on calibration points from a target and a source
 
@@ -44,6 +47,9 @@ def transform_shapes(
             Only translation and rotation are allowed
     precision
         Rounding digit of affine transformation matrix. Small values (~6) might be necessary for numerical stability of shape transformations.
+    switch_orientation
+        If True, additionally switch x/y coordinates of the transformed shapes (mirror at main diagonal),
+        see :func:`dvpio.read.shapes.read_lmd`
 
     Returns
     -------
@@ -78,6 +84,10 @@ def transform_shapes(
         transformation_type=transformation_type,
     )
 
+    # Fold the switch of x/y coordinates into the same transformation
+    if switch_orientation:
+        affine_transformation = affine_transformation @ _SWITCH_ORIENTATION
+
     affine_transformation_inverse = np.linalg.inv(affine_transformation)
 
     # Rounding might be required for numerical stability of shapely transformation
@@ -85,13 +95,8 @@ def transform_shapes(
         affine_transformation = np.around(affine_transformation, precision)
         affine_transformation_inverse = np.around(affine_transformation_inverse, precision)
 
-    # Transform shapes
-    # Iterate through shapes and apply affine transformation
-    transformed_shapes = shapes["geometry"].apply(
-        lambda shape: shapely.transform(
-            shape, transformation=lambda geom: apply_transformation(geom, affine_transformation)
-        )
-    )
+    # Transform all shapes at once
+    transformed_shapes = transform_geometry(shapes["geometry"], affine_transformation)
 
     # Reassign as DataFrame and parse with spatialdata
     transformed_shapes = ShapesModel.parse(shapes.assign(geometry=transformed_shapes))
@@ -181,13 +186,7 @@ def read_lmd(
         calibration_points_source=calibration_points_lmd,
         transformation_type=transformation_type,
         precision=precision,
+        switch_orientation=switch_orientation,
     )
 
-    if switch_orientation:
-        # Transformation switches x/y coordinates (mirror at main diagonal)
-        switch_axes = lambda geom: geom @ np.array([[0, 1], [1, 0]])
-        transformed_shapes["geometry"] = transformed_shapes["geometry"].apply(
-            lambda geom: shapely.transform(geom, transformation=switch_axes)
-        )
-
     return transformed_shapes
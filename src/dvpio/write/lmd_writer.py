@@ -2,10 +2,10 @@ import os
 
 import lmd.lib as pylmd
 import numpy as np
-import shapely
+import pandas as pd
 import spatialdata as sd
 
-from dvpio.read.shapes.geometry import apply_transformation
+from dvpio.read.shapes.geometry import apply_transformation, transform_geometry
 
 
 def write_lmd(
@@ -99,14 +99,12 @@ def write_lmd(
         calibration_points[["x", "y"]].to_dask_array().compute(), affine_transformation
     )
 
-    annotation_transformed = annotation["geometry"].apply(
-        lambda shape: shapely.transform(
-            shape,
-            transformation=lambda geom: apply_transformation(geom, affine_transformation),
-        )
-    )
-
-    annotation_transformed = annotation.assign(geometry=annotation_transformed)
+    # Transform all shapes at once. Only pass the exported columns to pylmd instead of copying the full annotation
+    columns = {"geometry": transform_geometry(annotation["geometry"], affine_transformation)}
+    for column in (annotation_name_column, annotation_well_column):
+        if column is not None:
+            columns[column] = annotation[column]
+    annotation_transformed = pd.DataFrame(columns, index=annotation.index, copy=False)
 
     # Load annotation and optional columns
     collection.load_geopandas(
@@ -0,0 +1,220 @@
+import os
+import time
+
+import dask.array as da
+import numpy as np
+import pytest
+import spatialdata as sd
+import zarr
+from pylibCZIrw import czi as pyczi
+from spatialdata.models import Image2DModel
+
+from dvpio.convert import convert_image
+from dvpio.convert.image import _MANIFEST_NAME, _stream_element, _write_template
+from dvpio.read.image import read_czi, read_openslide
+
+
+def _fingerprint(levels):
+    return {"levels": [list(level.shape) for level in levels]}
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, size=(2, 100, 70), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("scale_factors", [None, [2]])
+@pytest.mark.parametrize("n_workers", [1, 3])
+def test_stream_element(tmp_path, image, scale_factors, n_workers) -> None:
+    element = Image2DModel.parse(
+        da.from_array(image, chunks=(2, 32, 32)), dims=("c", "y", "x"), scale_factors=scale_factors
+    )
+    store = os.path.join(tmp_path, "image.zarr")
+
+    _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint, n_workers=n_workers)
+
+    sdata = sd.read_zarr(store)
+    result = sdata["image"] if scale_factors is None else sdata["image"]["scale0"]["image"]
+    assert np.array_equal(result.data.compute(), image)
+
+
+def test_stream_element_irregular_chunks(tmp_path, image) -> None:
+    element = Image2DModel.parse(da.from_array(image, chunks=((2,), (40, 20, 40), (10, 60))), dims=("c", "y", "x"))
+    store = os.path.join(tmp_path, "image.zarr")
+
+    _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint)
+
+    assert np.array_equal(sd.read_zarr(store)["image"].data.compute(), image)
+
+
+@pytest.mark.parametrize("n_workers", [1, 4])
+def test_stream_element_irregular_chunks_read_once(tmp_path, image, n_workers) -> None:
+    calls = []
+
+    def read_block(block, block_info=None):
+        calls.append(tuple(block_info[0]["chunk-location"]))
+        return block
+
+    array = da.from_array(image, chunks=((2,), (40, 20, 25, 15), (10, 45, 15)))
+    element = Image2DModel.parse(array.map_blocks(read_block, dtype=image.dtype), dims=("c", "y", "x"))
+    store = os.path.join(tmp_path, "image.zarr")
+
+    _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint, n_workers=n_workers)
+
+    # Every source chunk is read exactly once
+    assert sorted(calls) == sorted(set(calls))
+    assert len(calls) == np.prod(array.numblocks)
+    assert np.array_equal(sd.read_zarr(store)["image"].data.compute(), image)
+
+
+@pytest.mark.parametrize("scale_factors", [None, [2, 3]])
+def test_write_template(tmp_path, image, scale_factors) -> None:
+    def read_block(block):
+        raise AssertionError("Chunks of the image must not be computed")
+
+    array = da.from_array(image, chunks=(2, 32, 32))
+    element = Image2DModel.parse(array, dims=("c", "y", "x"), scale_factors=scale_factors)
+    template = Image2DModel.parse(
+        array.map_blocks(read_block, dtype=image.dtype), dims=("c", "y", "x"), scale_factors=scale_factors
+    )
+    expected_store = os.path.join(tmp_path, "expected.zarr")
+    store = os.path.join(tmp_path, "image.zarr")
+
+    sd.SpatialData(images={"image": element}).write(expected_store)
+    _write_template(template, store=store, element_name="image")
+
+    expected, result = zarr.open_group(expected_store, mode="r"), zarr.open_group(store, mode="r")
+    assert result["images/image"].attrs.asdict() == expected["images/image"].attrs.asdict()
+    for path, array in expected["images/image"].arrays():
+        assert result["images/image"][path].metadata == array.metadata
+        assert result["images/image"][path].nchunks_initialized == 0
+
+
+def test_stream_element_resume(tmp_path, image) -> None:
+    calls = []
+
+    def read_block(block, fail, block_info=None):
+        location = tuple(block_info[0]["chunk-location"])
+        calls.append(location)
+        if fail and location == (0, 1, 1):
+            raise RuntimeError("Interrupted")
+        return block
+
+    store = os.path.join(tmp_path, "image.zarr")
+    array = da.from_array(image, chunks=(2, 32, 32))
+
+    element = Image2DModel.parse(array.map_blocks(read_block, fail=True, dtype=image.dtype), dims=("c", "y", "x"))
+    with pytest.raises(RuntimeError, match="Interrupted"):
+        _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint, n_workers=1)
+    n_calls_interrupted = len(calls)
+
+    calls.clear()
+    element = Image2DModel.parse(array.map_blocks(read_block, fail=False, dtype=image.dtype), dims=("c", "y", "x"))
+    _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint, n_workers=1)
+
+    # Only missing chunks are computed again
+    assert len(calls) == np.prod(array.numblocks) - n_calls_interrupted + 1
+    assert np.array_equal(sd.read_zarr(store)["image"].data.compute(), image)
+
+    # Finished conversions are not repeated
+    calls.clear()
+    _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint, n_workers=1)
+    assert len(calls) == 0
+
+
+def test_stream_element_resume_parallel(tmp_path, image) -> None:
+    calls = []
+
+    def read_block(block, fail, block_info=None):
+        location = tuple(block_info[0]["chunk-location"])
+        if fail and location == (0, 0, 1):
+            raise RuntimeError("Interrupted")
+        # Other chunks are still running when the failure is raised
+        time.sleep(0.05)
+        calls.append(location)
+        return block
+
+    store = os.path.join(tmp_path, "image.zarr")
+    array = da.from_array(image, chunks=(2, 32, 32))
+
+    element = Image2DModel.parse(array.map_blocks(read_block, fail=True, dtype=image.dtype), dims=("c", "y", "x"))
+    with pytest.raises(RuntimeError, match="Interrupted"):
+        _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint, n_workers=4)
+    finished = set(calls)
+
+    calls.clear()
+    element = Image2DModel.parse(array.map_blocks(read_block, fail=False, dtype=image.dtype), dims=("c", "y", "x"))
+    _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint, n_workers=4)
+
+    # Chunks that finished after the failure are recorded and not computed again
+    assert finished
+    assert not finished & set(calls)
+    assert np.array_equal(sd.read_zarr(store)["image"].data.compute(), image)
+
+
+def test_stream_element_overwrite(tmp_path, image) -> None:
+    store = os.path.join(tmp_path, "image.zarr")
+    element = Image2DModel.parse(image, dims=("c", "y", "x"))
+    _stream_element(element, store=store, element_name="image", fingerprint=_fingerprint)
+
+    other = Image2DModel.parse(image[:, :50], dims=("c", "y", "x"))
+    with pytest.raises(ValueError, match="different conversion"):
+        _stream_element(other, store=store, element_name="image", fingerprint=_fingerprint)
+
+    _stream_element(other, store=store, element_name="image", fingerprint=_fingerprint, overwrite=True)
+    assert np.array_equal(sd.read_zarr(store)["image"].data.compute(), image[:, :50])
+    assert os.path.exists(os.path.join(store, "images", "image", _MANIFEST_NAME))
+
+
+@pytest.fixture
+def czi_multi_channel(tmp_path) -> tuple[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 2**16, size=(2, 40, 50), dtype=np.uint16)
+    path = str(tmp_path / "image.czi")
+    with pyczi.create_czi(path) as czidoc_w:
+        for channel in range(image.shape[0]):
+            czidoc_w.write(image[channel, :, :, np.newaxis], plane={"C": channel})
+    return path, image
+
+
+def test_convert_image_reader_arguments(tmp_path, czi_multi_channel) -> None:
+    path, image = czi_multi_channel
+    store = os.path.join(tmp_path, "image.zarr")
+
+    convert_image(path, store, image_type="czi", channels=0)
+    # Same conversion with default arguments passed explicitly is not repeated
+    convert_image(path, store, image_type="czi", channels=0, timepoint=0)
+
+    # Same output shape but different channel
+    with pytest.raises(ValueError, match="different conversion"):
+        convert_image(path, store, image_type="czi", channels=1)
+
+    convert_image(path, store, image_type="czi", channels=1, overwrite=True)
+    assert np.array_equal(sd.read_zarr(store)["image"].data.compute(), image[[1]])
+
+
+def test_convert_image_multiple_images(tmp_path, czi_multi_channel) -> None:
+    path, _ = czi_multi_channel
+    store = os.path.join(tmp_path, "image.zarr")
+
+    with pytest.raises(ValueError, match="multiple images"):
+        convert_image(path, store, image_type="czi", scene="all")
+    assert not os.path.exists(store)
+
+
+@pytest.mark.parametrize(
+    ["dataset", "image_type", "kwargs"],
+    [
+        ["./data/zeiss/zeiss/rect-upper-left.multi-channel.czi", "czi", {"chunk_size": (32, 32)}],
+        ["./data/openslide-mirax/Mirax2.2-4-PNG.mrxs", "openslide", {"chunk_size": (256, 256), "pyramidal": False}],
+    ],
+)
+def test_convert_image(tmp_path, dataset, image_type, kwargs) -> None:
+    store = os.path.join(tmp_path, "image.zarr")
+    reader = {"czi": read_czi, "openslide": read_openslide}[image_type]
+
+    convert_image(dataset, store, image_type=image_type, n_workers=2, memory_limit="1MiB", **kwargs)
+
+    result = sd.read_zarr(store)["image"]
+    assert np.array_equal(result.data.compute(), reader(dataset, **kwargs).data.compute())
@@ -0,0 +1,215 @@
+import os
+
+import numpy as np
+import pytest
+from xarray import DataTree
+
+from dvpio.read.image import (
+    clear_tile_cache,
+    configure_disk_tile_cache,
+    configure_tile_cache,
+    read_czi,
+    read_openslide,
+    tile_cache_info,
+)
+from dvpio.read.image._cache import _DiskTileCache, _freeze, _read_cached_tile, _TileCache
+
+
+@pytest.fixture
+def tile_cache():
+    configure_tile_cache(max_bytes="64MiB", policy="lru")
+    clear_tile_cache()
+    yield
+    configure_tile_cache(max_bytes=0, policy="lru")
+    clear_tile_cache()
+
+
+def _tile(value: int, nbytes: int = 100) -> np.ndarray:
+    return np.full(nbytes, value, dtype=np.uint8)
+
+
+@pytest.mark.parametrize(
+    ["policy", "expected_keys"],
+    [
+        # "a" was used recently and survives
+        ["lru", {"a", "c"}],
+        # "a" was added first and is evicted
+        ["fifo", {"b", "c"}],
+    ],
+)
+def test_tile_cache_eviction(policy, expected_keys) -> None:
+    cache = _TileCache(max_bytes=200, policy=policy)
+    cache.put("a", _tile(0))
+    cache.put("b", _tile(1))
+    cache.get("a")
+    cache.put("c", _tile(2))
+
+    assert {key for key in "abc" if key in cache._tiles} == expected_keys
+    assert cache.info()["evictions"] == 1
+    assert cache.info()["nbytes"] == 200
+
+
+def test_tile_cache_counters() -> None:
+    cache = _TileCache(max_bytes=1000)
+    assert cache.get("a") is None
+    cache.put("a", _tile(1))
+
+    tile = cache.get("a")
+    assert np.array_equal(tile, _tile(1))
+
+    # Modifying returned tiles does not modify the cache
+    tile[:] = 0
+    assert np.array_equal(cache.get("a"), _tile(1))
+
+    info = cache.info()
+    assert (info["hits"], info["misses"], info["n_tiles"], info["nbytes"]) == (2, 1, 1, 100)
+
+    cache.clear()
+    assert cache.info()["nbytes"] == 0
+
+
+def test_tile_cache_budget() -> None:
+    cache = _TileCache(max_bytes=150)
+
+    # Tiles larger than the budget are not stored
+    cache.put("a", _tile(0, nbytes=200))
+    assert cache.info()["n_tiles"] == 0
+
+    cache.put("b", _tile(0))
+    cache.configure(max_bytes=50)
+    assert cache.info()["n_tiles"] == 0
+
+    with pytest.raises(ValueError):
+        cache.configure(policy="random")
+
+
+def test_freeze() -> None:
+    assert _freeze({"channels": [0, 1], "scene": None}) == (("channels", (0, 1)), ("scene", None))
+    hash(_freeze({"channels": [np.int64(0)], "level": 1}))
+
+
+def test_read_cached_tile(tile_cache) -> None:
+    calls = []
+
+    def read(slide, x0, y0, width, height, level=0):
+        calls.append((x0, y0, level))
+        return np.zeros((1, height, width), dtype=np.uint8)
+
+    for _ in range(2):
+        _read_cached_tile(read, ("slide", 0), None, x0=0, y0=0, width=10, height=10, level=0)
+    _read_cached_tile(read, ("slide", 0), None, x0=0, y0=0, width=10, height=10, level=1)
+    _read_cached_tile(read, ("slide", 1), None, x0=0, y0=0, width=10, height=10, level=1)
+
+    assert calls == [(0, 0, 0), (0, 0, 1), (0, 0, 1)]
+    assert tile_cache_info()["hits"] == 1
+
+
+@pytest.mark.parametrize(
+    ["reader", "dataset"],
+    [
+        [read_czi, "./data/zeiss/zeiss/rect-upper-left.multi-channel.czi"],
+        [read_openslide, "./data/openslide-mirax/Mirax2.2-4-PNG.mrxs"],
+    ],
+)
+def test_read_tile_cache(tile_cache, reader, dataset) -> None:
+    img = reader(dataset, chunk_size=(64, 64))
+    img = img["scale0"]["image"] if isinstance(img, DataTree) else img
+
+    first = img.data.compute()
+    n_chunks = np.prod(img.data.numblocks)
+    assert tile_cache_info()["misses"] == n_chunks
+
+    second = img.data.compute()
+    assert tile_cache_info()["hits"] == n_chunks
+    assert np.array_equal(first, second)
+
+
+def test_disk_tile_cache(tmp_path) -> None:
+    cache = _DiskTileCache(directory=str(tmp_path), max_bytes="1MiB")
+    key = (("slide.czi", 0, 100), "read", 0, 0, 10, 10)
+    tile = np.arange(300, dtype=np.uint16).reshape(3, 10, 10)
+
+    assert cache.get(key) is None
+    cache.put(key, tile)
+    assert np.array_equal(cache.get(key), tile)
+    assert cache.get(key).dtype == tile.dtype
+
+    # Tiles persist across sessions
+    cache = _DiskTileCache(directory=str(tmp_path), max_bytes="1MiB")
+    assert np.array_equal(cache.get(key), tile)
+    assert cache.info()["nbytes"] > 0
+
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_disk_tile_cache_eviction(tmp_path) -> None:
+    rng = np.random.default_rng(0)
+    tiles = [rng.integers(0, 255, size=1000, dtype=np.uint8) for _ in range(3)]
+    cache = _DiskTileCache(directory=str(tmp_path), max_bytes=2500)
+
+    for i, tile in enumerate(tiles):
+        cache.put(("slide", i), tile)
+        # Ensure distinct access times
+        os.utime(cache._path(("slide", i)), (i, i))
+        if i == 1:
+            # Tile 0 is used most recently
+            cache.get(("slide", 0))
+
+    assert cache.info()["evictions"] == 1
+    assert cache.get(("slide", 1)) is None
+    assert np.array_equal(cache.get(("slide", 0)), tiles[0])
+    assert np.array_equal(cache.get(("slide", 2)), tiles[2])
+
+
+def test_read_cached_tile_disk(tmp_path) -> None:
+    calls = []
+
+    def read(slide, x0, y0, width, height):
+        calls.append((x0, y0))
+        return np.ones((1, height, width), dtype=np.uint8)
+
+    configure_disk_tile_cache(str(tmp_path))
+    try:
+        for _ in range(2):
+            tile = _read_cached_tile(read, ("slide", 0), None, x0=0, y0=0, width=10, height=10)
+        assert calls == [(0, 0)]
+        assert np.array_equal(tile, np.ones((1, 10, 10)))
+        assert tile_cache_info()["disk"]["hits"] == 1
+    finally:
+        clear_tile_cache(disk=True)
+        configure_disk_tile_cache(None)
+
+
+def test_disk_tile_cache_eviction_low_water_mark(tmp_path, monkeypatch) -> None:
+    rng = np.random.default_rng(0)
+    cache = _DiskTileCache(directory=str(tmp_path), max_bytes=20_000)
+
+    n_scans = 0
+    scan = cache._scan
+
+    def count_scan():
+        nonlocal n_scans
+        n_scans += 1
+        return scan()
+
+    monkeypatch.setattr(cache, "_scan", count_scan)
+
+    for i in range(40):
+        cache.put(("slide", i), rng.integers(0, 255, size=1000, dtype=np.uint8))
+
+    info = cache.info()
+    assert info["nbytes"] <= info["max_bytes"]
+    assert info["nbytes"] == sum(size for _, _, size in scan())
+    # Full cache is not rescanned on every write
+    assert n_scans < 40 - 20
+
+
+def test_disk_tile_cache_replace(tmp_path) -> None:
+    rng = np.random.default_rng(0)
+    cache = _DiskTileCache(directory=str(tmp_path), max_bytes="1MiB")
+
+    for _ in range(3):
+        cache.put(("slide", 0), rng.integers(0, 255, size=1000, dtype=np.uint8))
+
+    assert cache.info()["nbytes"] == os.path.getsize(cache._path(("slide", 0)))
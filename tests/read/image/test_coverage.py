@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from pylibCZIrw import czi as pyczi
+from spatialdata.transformations import get_transformation
+
+from dvpio.read.image import read_coverage_mask
+
+
+@pytest.mark.parametrize("scene", [None, 0])
+def test_read_coverage_mask_czi(scene: int | None) -> None:
+    dataset = "./data/zeiss/zeiss/zeiss_multi-scenes.czi"
+    mask = read_coverage_mask(dataset, image_type="czi", scene=scene, max_size=512)
+
+    czidoc_r = pyczi.CziReader(dataset)
+    _, _, width, height = (
+        czidoc_r.total_bounding_rectangle if scene is None else czidoc_r.scenes_bounding_rectangle[scene]
+    )
+    downsample = get_transformation(mask).scale[0]
+
+    assert max(mask.shape) <= 512
+    assert mask.shape == (np.ceil(height / downsample), np.ceil(width / downsample))
+    # Scenes cover a fraction of the total bounding box
+    if scene is None:
+        assert 0 < mask.mean() < 0.5
+    else:
+        assert (mask == 1).all()
+
+
+def test_read_coverage_mask_openslide() -> None:
+    dataset = "./data/openslide-mirax/Mirax2.2-4-PNG.mrxs"
+    mask = read_coverage_mask(dataset, image_type="openslide")
+
+    assert mask.dtype == np.uint8
+    assert set(np.unique(mask)) <= {0, 1}
+
+
+def test_read_coverage_mask_image_type() -> None:
+    with pytest.raises(ValueError):
+        read_coverage_mask("./data/zeiss/zeiss/zeiss_multi-scenes.czi", image_type="tiff")
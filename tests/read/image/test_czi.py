@@ -1,8 +1,14 @@
+from types import SimpleNamespace
+
+import dask
 import numpy as np
 import pytest
 from pylibCZIrw import czi as pyczi
+from spatialdata.transformations import get_transformation
 
+import dvpio.read.image.czi
 from dvpio.read.image import read_czi
+from dvpio.read.image.czi import CZIPixelType, _get_img, _get_pyramid_downsamples, _parse_pixel_type
 
 
 @pytest.mark.parametrize(
@@ -69,6 +75,128 @@ def test_read_czi_multichannel(
     assert (img_test.transpose("y", "x", "c") == img_ref).all()
 
 
+class _MockSlide:
+    def __init__(self, pixel_types: list[str]) -> None:
+        self.pixel_types = pixel_types
+
+    def get_channel_pixel_type(self, channel: int) -> str:
+        return self.pixel_types[channel]
+
+
+@pytest.mark.parametrize(
+    ("pixel_types", "dtype", "channel_dim"),
+    [
+        (["Gray8"], np.uint8, [1]),
+        (["Gray8", "Gray8"], np.uint8, [1, 1]),
+        (["Gray8", "Gray16"], np.uint16, [1, 1]),
+        (["Gray16", "Gray8"], np.uint16, [1, 1]),
+        (["Gray16", "Gray32Float"], np.float32, [1, 1]),
+        (["Bgr24"], np.uint8, [3]),
+        (["Bgr48"], np.uint16, [3]),
+    ],
+)
+def test_parse_pixel_type(pixel_types: list[str], dtype: np.dtype, channel_dim: list[int]) -> None:
+    """Test that native dtypes are kept and only widened for mixed channels"""
+    pixel_spec, parsed_channel_dim = _parse_pixel_type(_MockSlide(pixel_types), channels=list(range(len(pixel_types))))
+
+    assert pixel_spec.dtype == dtype
+    assert parsed_channel_dim == channel_dim
+
+
+def test_czi_pixel_type_unique() -> None:
+    """Test that pixel types are not aliased by identical specifications"""
+    assert CZIPixelType.Gray8 is not CZIPixelType.Gray16
+    assert CZIPixelType.Gray8 < CZIPixelType.Gray16
+
+
+@pytest.mark.parametrize(
+    ("dataset"),
+    [
+        ("./data/zeiss/zeiss/rect-upper-left.czi"),
+        ("./data/zeiss/zeiss/rect-upper-left.rgb.czi"),
+        ("./data/zeiss/zeiss/kabatnik2023_20211129_C1.czi"),
+        ("./data/zeiss/zeiss/zeiss_multi-channel.czi"),
+    ],
+)
+def test_read_czi_dtype(dataset: str) -> None:
+    """Test that images are read in their native dtype without altering pixel values"""
+    czidoc_r = pyczi.CziReader(dataset)
+    img_ref = czidoc_r.read(plane={"C": 0})
+
+    img_test = read_czi(dataset, channels=0)
+    img_computed = img_test.data.compute()
+
+    assert img_test.dtype == img_ref.dtype
+    assert img_computed.dtype == img_ref.dtype
+    assert (img_computed.transpose(1, 2, 0) == img_ref).all()
+
+
+@pytest.mark.parametrize(
+    ("dataset", "channels"),
+    [
+        ("./data/zeiss/zeiss/rect-upper-left.multi-channel.czi", [0, 1, 2]),
+        ("./data/zeiss/zeiss/rect-upper-left.multi-channel.czi", [2, 0]),
+        ("./data/zeiss/zeiss/rect-upper-left.rgb.czi", [0]),
+    ],
+)
+def test_get_img_channels(dataset: str, channels: list[int]) -> None:
+    """Test that all channels of a tile are decoded into a single (c, y, x) block"""
+    czidoc_r = pyczi.CziReader(dataset)
+    img_ref = np.concatenate([czidoc_r.read(plane={"C": channel}, roi=(0, 0, 5, 4)) for channel in channels], axis=-1)
+
+    img = _get_img(dataset, x0=0, y0=0, width=5, height=4, channels=channels)
+
+    assert img.flags["C_CONTIGUOUS"]
+    assert (img == img_ref.transpose(2, 0, 1)).all()
+
+
+@pytest.mark.parametrize(
+    ("dataset", "channels"),
+    [
+        ("./data/zeiss/zeiss/zeiss_multi-channel.czi", [0, 1]),
+    ],
+)
+def test_read_czi_fused_channels(dataset: str, channels: list[int]) -> None:
+    """Test that channels are not split into separate chunks"""
+    img_test = read_czi(dataset, channels=channels, chunk_size=(1000, 1000))
+
+    assert img_test.data.numblocks == (1, 3, 3)
+
+
+@pytest.mark.parametrize(
+    ("dataset", "scene"),
+    [
+        ("./data/zeiss/zeiss/zeiss_multi-channel.czi", None),
+        ("./data/zeiss/zeiss/zeiss_multi-scenes.czi", None),
+        ("./data/zeiss/zeiss/zeiss_multi-scenes.czi", 1),
+    ],
+)
+def test_read_czi_auto_chunks(dataset: str, scene: int | None) -> None:
+    """Test that auto chunks are aligned to subblocks and the image is not altered"""
+    czidoc_r = pyczi.CziReader(dataset)
+    xmin, ymin, width, height = (
+        czidoc_r.total_bounding_rectangle if scene is None else czidoc_r.scenes_bounding_rectangle[scene]
+    )
+    img_ref = czidoc_r.read(plane={"C": 0}, roi=(xmin, ymin, width, height), scene=scene)
+
+    subblock_x, subblock_y = set(), set()
+
+    def _collect(index, info):
+        subblock_x.add(info.logicalRect.x)
+        subblock_y.add(info.logicalRect.y)
+        return True
+
+    czidoc_r.enumerate_subblocks_subset(_collect, plane={"C": 0}, roi=(xmin, ymin, width, height), only_layer0=True)
+
+    with dask.config.set({"array.chunk-size": "1MiB"}):
+        img_test = read_czi(dataset, channels=0, chunk_size="auto", scene=scene)
+
+    # All chunk borders start at a subblock
+    assert set((xmin + np.cumsum((0, *img_test.data.chunks[2][:-1]))).tolist()) <= subblock_x | {xmin}
+    assert set((ymin + np.cumsum((0, *img_test.data.chunks[1][:-1]))).tolist()) <= subblock_y | {ymin}
+    assert (img_test.transpose("y", "x", "c") == img_ref).all()
+
+
 @pytest.mark.parametrize(
     ("dataset", "scene", "result_shape"),
     [
@@ -84,6 +212,33 @@ def test_read_czi_scene(dataset: str, scene: int | None, result_shape: tuple[int
     assert img_test.shape == result_shape
 
 
+def test_read_czi_scene_all() -> None:
+    """Test to read all scenes of a multi-scene czi image as separate images"""
+    dataset = "./data/zeiss/zeiss/zeiss_multi-scenes.czi"
+    img_full = read_czi(dataset, chunk_size=(512, 512))
+    img_scenes = read_czi(dataset, scene="all", chunk_size=(512, 512))
+
+    assert list(img_scenes.keys()) == [0, 1]
+
+    # Scenes are computed within the same graph
+    scenes = dask.compute(*[img.data for img in img_scenes.values()])
+    for idx, (img, scene) in enumerate(zip(img_scenes.values(), scenes, strict=True)):
+        assert scene.shape == (2, 1416, 1960)
+        assert (scene == read_czi(dataset, scene=idx, chunk_size=(512, 512)).to_numpy()).all()
+
+        # Scenes are placed at their position in the slide
+        x, y = get_transformation(img).translation.astype(int)
+        assert (scene == img_full[:, y : y + scene.shape[1], x : x + scene.shape[2]].to_numpy()).all()
+
+
+def test_read_czi_scene_all_roi() -> None:
+    """Test that scenes outside of the region of interest are omitted"""
+    img_scenes = read_czi("./data/zeiss/zeiss/zeiss_multi-scenes.czi", scene="all", roi=(19800, 30, 100, 100))
+
+    assert list(img_scenes.keys()) == [1]
+    assert img_scenes[1].shape == (2, 100, 100)
+
+
 @pytest.mark.parametrize(
     ("dataset", "scene"),
     [
@@ -94,3 +249,252 @@ def test_read_czi_scene_error(dataset: str, scene: int | None) -> None:
     """Test to read a non-existent scene from a multi-scene czi image"""
     with pytest.raises(ValueError, match="not found in CZI file"):
         read_czi(dataset, scene=scene)
+
+
+@pytest.mark.parametrize("scheduler", ["threads", "processes", "synchronous"])
+@pytest.mark.parametrize(
+    ("dataset", "chunk_size"),
+    [
+        ("./data/zeiss/zeiss/zeiss_multi-channel.czi", (1000, 1000)),
+    ],
+)
+def test_read_czi_scheduler(dataset: str, chunk_size: tuple[int, int], scheduler: str) -> None:
+    """Test that images can be computed with schedulers that require pickling of the tasks"""
+    czidoc_r = pyczi.CziReader(dataset)
+    img_ref = np.concatenate([czidoc_r.read(plane={"C": channel}) for channel in range(2)], axis=-1)
+
+    img_test = read_czi(dataset, chunk_size=chunk_size)
+
+    with dask.config.set(scheduler=scheduler):
+        assert (img_test.transpose("y", "x", "c").to_numpy() == img_ref).all()
+
+
+@pytest.mark.parametrize(
+    ("dataset", "downsample"),
+    [
+        ("./data/zeiss/zeiss/zeiss_multi-channel.czi", 2),
+        ("./data/zeiss/zeiss/zeiss_multi-channel.czi", 4),
+    ],
+)
+def test_get_img_downsample(dataset: str, downsample: int) -> None:
+    """Test reading of downsampled tiles with libCZI zoom"""
+    czidoc_r = pyczi.CziReader(dataset)
+    img_ref = czidoc_r.read(plane={"C": 0}, roi=(0, 0, 100 * downsample, 50 * downsample), zoom=1 / downsample)
+
+    img = _get_img(dataset, x0=0, y0=0, width=100, height=50, channels=[0], downsample=downsample)
+
+    assert img.shape == (1, 50, 100)
+    assert (img == img_ref.transpose(2, 0, 1)).all()
+
+
+@pytest.mark.parametrize(
+    ("dataset", "downsamples"),
+    [
+        ("./data/zeiss/zeiss/zeiss_multi-channel.czi", [1, 2, 4]),
+    ],
+)
+def test_read_czi_pyramidal(dataset: str, downsamples: list[int], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that scales of a multiscale image are read from the file"""
+    # Test data does not contain pyramid levels, mock their detection
+    monkeypatch.setattr(dvpio.read.image.czi, "_get_pyramid_downsamples", lambda *args, **kwargs: downsamples)
+
+    czidoc_r = pyczi.CziReader(dataset)
+
+    img_test = read_czi(dataset, channels=0, pyramidal=True, chunk_size=(1000, 1000))
+
+    assert list(img_test.keys()) == [f"scale{idx}" for idx in range(len(downsamples))]
+    for scale, downsample in zip(img_test.values(), downsamples, strict=True):
+        img_ref = czidoc_r.read(plane={"C": 0}, zoom=1 / downsample)
+        assert (scale["image"].transpose("y", "x", "c") == img_ref).all()
+
+
+class _PyramidSlide:
+    """Subblock directory with logical rectangles and physical sizes (width, height) of subblocks"""
+
+    def __init__(self, subblocks: list[tuple[int, int, int, int]]) -> None:
+        self.subblocks = [
+            SimpleNamespace(
+                logicalRect=SimpleNamespace(w=logical_w, h=logical_h),
+                physicalSize=SimpleNamespace(w=physical_w, h=physical_h),
+            )
+            for logical_w, logical_h, physical_w, physical_h in subblocks
+        ]
+
+    def enumerate_subblocks_subset(self, callback, plane, roi, only_layer0) -> None:
+        for index, info in enumerate(self.subblocks):
+            callback(index, info)
+
+
+def test_get_pyramid_downsamples_cropped_subblocks() -> None:
+    """Test that subblocks cropped at the border of the image do not add pyramid levels"""
+    slide = _PyramidSlide(
+        [
+            # Full resolution
+            (100, 100, 100, 100),
+            # Downsample 4, interior subblock and cropped subblocks at the right border and the corner
+            (400, 400, 100, 100),
+            (10, 400, 3, 100),
+            (10, 6, 3, 2),
+            # Downsample 64, single small subblock
+            (640, 640, 10, 10),
+        ]
+    )
+
+    assert _get_pyramid_downsamples(slide, plane={}, roi=(0, 0, 1000, 1000)) == [1, 4, 64]
+
+
+def test_read_czi_pyramidal_scale_factors() -> None:
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        read_czi("./data/zeiss/zeiss/zeiss_multi-channel.czi", pyramidal=True, scale_factors=[2])
+
+
+@pytest.mark.parametrize(
+    ("dataset", "scene", "roi"),
+    [
+        ("./data/zeiss/zeiss/zeiss_multi-channel.czi", None, (100, 200, 300, 150)),
+        ("./data/zeiss/zeiss/zeiss_multi-scenes.czi", 1, (10, 20, 500, 400)),
+        ("./data/zeiss/zeiss/kabatnik2023_20211129_C1.czi", None, (1000, 500, 20, 30)),
+    ],
+)
+def test_read_czi_roi(dataset: str, scene: int | None, roi: tuple[int, int, int, int]) -> None:
+    """Test reading of a region of interest in image coordinates"""
+    x, y, width, height = roi
+    img_full = read_czi(dataset, scene=scene, chunk_size=(256, 256))
+    img_roi = read_czi(dataset, scene=scene, roi=roi, chunk_size=(256, 256))
+
+    assert img_roi.shape[1:] == (height, width)
+    assert (img_roi.to_numpy() == img_full[:, y : y + height, x : x + width].to_numpy()).all()
+
+    translation = get_transformation(img_roi)
+    assert (translation.translation == np.array([x, y])).all()
+
+
+@pytest.mark.parametrize("pyramidal", [False, True])
+def test_read_czi_skip_empty(monkeypatch, pyramidal: bool) -> None:
+    """Test that skipping chunks without subblocks does not change the image"""
+    dataset = "./data/zeiss/zeiss/zeiss_multi-scenes.czi"
+    if pyramidal:
+        monkeypatch.setattr(dvpio.read.image.czi, "_get_pyramid_downsamples", lambda *args, **kwargs: [1, 2])
+
+    img_full = read_czi(dataset, chunk_size=(512, 512), skip_empty=False, pyramidal=pyramidal)
+    img_skip = read_czi(dataset, chunk_size=(512, 512), skip_empty=True, pyramidal=pyramidal)
+
+    if pyramidal:
+        for scale in img_full.children:
+            assert (img_full[scale]["image"].to_numpy() == img_skip[scale]["image"].to_numpy()).all()
+    else:
+        assert (img_full.to_numpy() == img_skip.to_numpy()).all()
+
+
+@pytest.fixture
+def czi_time_z_stack(tmp_path) -> tuple[str, np.ndarray]:
+    """CZI file with 2 timepoints, 3 z-planes, and 2 channels, tiled with an empty quadrant"""
+    path = str(tmp_path / "time_z_stack.czi")
+    rng = np.random.default_rng(0)
+    # (t, z, c, y, x)
+    data = np.zeros((2, 3, 2, 160, 200), dtype=np.uint16)
+    with pyczi.create_czi(path) as czidoc_w:
+        for t, z, c in np.ndindex(data.shape[:3]):
+            for x, y in [(0, 0), (100, 0), (0, 80)]:
+                tile = rng.integers(1, 60000, size=(80, 100), dtype=np.uint16)
+                data[t, z, c, y : y + 80, x : x + 100] = tile
+                czidoc_w.write(tile[..., np.newaxis], plane={"T": t, "Z": z, "C": c}, location=(x, y))
+    return path, data
+
+
+@pytest.mark.parametrize(
+    ["z_stack", "z_indices"],
+    [(1, 1), ([2, 0], [2, 0]), (range(1, 3), [1, 2]), ("all", [0, 1, 2])],
+)
+def test_read_czi_z_stack(czi_time_z_stack, z_stack, z_indices) -> None:
+    path, data = czi_time_z_stack
+    img = read_czi(path, chunk_size=(64, 64), timepoint=1, z_stack=z_stack)
+
+    if isinstance(z_stack, int):
+        assert img.dims == ("c", "y", "x")
+        assert (img.to_numpy() == data[1, z_indices]).all()
+    else:
+        assert img.dims == ("c", "z", "y", "x")
+        # Every chunk holds a single plane of a tile
+        assert img.data.chunks[1] == (1,) * len(z_indices)
+        assert (img.to_numpy() == np.moveaxis(data[1, z_indices], 0, 1)).all()
+
+
+def test_read_czi_timepoints(czi_time_z_stack) -> None:
+    path, data = czi_time_z_stack
+    images = read_czi(path, chunk_size=(64, 64), timepoint="all", z_stack="all", pyramidal=False)
+
+    assert list(images) == [0, 1]
+    for timepoint, img in images.items():
+        assert (img.to_numpy() == np.moveaxis(data[timepoint], 0, 1)).all()
+
+
+def test_read_czi_timepoints_auto_chunks(tmp_path) -> None:
+    """Test that timepoints with a different tiling share the automatic chunk grid"""
+    path = str(tmp_path / "time_tiling.czi")
+    rng = np.random.default_rng(0)
+    # (t, y, x), the timepoints are acquired with tiles of different widths
+    data = np.zeros((2, 80, 240), dtype=np.uint16)
+    tilings = [[(0, 120), (120, 120)], [(0, 60), (60, 100), (160, 80)]]
+    with pyczi.create_czi(path) as czidoc_w:
+        for t, tiling in enumerate(tilings):
+            for x, width in tiling:
+                tile = rng.integers(1, 60000, size=(80, width), dtype=np.uint16)
+                data[t, :, x : x + width] = tile
+                czidoc_w.write(tile[..., np.newaxis], plane={"T": t, "Z": 0, "C": 0}, location=(x, 0))
+
+    with dask.config.set({"array.chunk-size": "10KiB"}):
+        images = read_czi(path, chunk_size="auto", timepoint="all")
+
+    assert images[0].data.chunks == images[1].data.chunks
+    # Chunk borders start at subblocks of any timepoint
+    assert set(np.cumsum((0, *images[0].data.chunks[2][:-1])).tolist()) <= {0, 60, 120, 160}
+    for timepoint, img in images.items():
+        assert (img.to_numpy()[0] == data[timepoint]).all()
+
+
+def test_read_czi_z_stack_pyramidal(monkeypatch, czi_time_z_stack) -> None:
+    path, data = czi_time_z_stack
+    monkeypatch.setattr(dvpio.read.image.czi, "_get_pyramid_downsamples", lambda *args, **kwargs: [1, 2])
+
+    img = read_czi(path, chunk_size=(64, 64), z_stack="all", pyramidal=True)
+
+    assert img["scale0"]["image"].dims == ("c", "z", "y", "x")
+    assert img["scale1"]["image"].shape == (2, 3, 80, 100)
+    assert (img["scale0"]["image"].to_numpy() == np.moveaxis(data[0], 0, 1)).all()
+
+
+@pytest.mark.parametrize(
+    ["kwargs"],
+    [({"z_stack": [3]},), ({"z_stack": []},), ({"timepoint": "first"},), ({"timepoint": [0, 1], "scene": "all"},)],
+)
+def test_read_czi_plane_selection_invalid(czi_time_z_stack, kwargs) -> None:
+    path, _ = czi_time_z_stack
+    with pytest.raises(ValueError):
+        read_czi(path, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ["z_projection", "dtype"],
+    [("max", np.uint16), ("sum", np.uint32), ("mean", np.float32)],
+)
+@pytest.mark.parametrize("pyramidal", [False, True])
+def test_read_czi_z_projection(monkeypatch, czi_time_z_stack, z_projection, dtype, pyramidal) -> None:
+    path, data = czi_time_z_stack
+    monkeypatch.setattr(dvpio.read.image.czi, "_get_pyramid_downsamples", lambda *args, **kwargs: [1, 2])
+
+    img = read_czi(path, chunk_size=(64, 64), z_stack="all", z_projection=z_projection, pyramidal=pyramidal)
+    img = img["scale0"]["image"] if pyramidal else img
+
+    reference = getattr(data[0].astype(np.float64), z_projection)(axis=0)
+    assert img.dims == ("c", "y", "x")
+    assert img.dtype == dtype
+    # One task per tile, planes are reduced within the task
+    assert img.data.npartitions == 3 * 4
+    assert np.allclose(img.to_numpy(), reference)
+
+
+def test_read_czi_z_projection_invalid(czi_time_z_stack) -> None:
+    path, _ = czi_time_z_stack
+    with pytest.raises(ValueError):
+        read_czi(path, z_stack="all", z_projection="median")
@@ -0,0 +1,118 @@
+import time
+
+import numpy as np
+import pytest
+
+from dvpio.read.image import (
+    TileEvent,
+    add_tile_event_callback,
+    clear_tile_cache,
+    configure_tile_cache,
+    read_czi,
+    record_tile_events,
+    remove_tile_event_callback,
+)
+from dvpio.read.image._instrument import TileReadSummary, _instrumented, _TilePhase
+from dvpio.read.image._utils import _compute_chunks, _read_chunks
+
+
+def _read(slide, x0: int, y0: int, width: int, height: int, level: int = 0) -> np.ndarray:
+    with _TilePhase("decode"):
+        time.sleep(0.001)
+    return np.ones((2, height, width), dtype=np.uint16)
+
+
+@pytest.fixture
+def tiles():
+    coords = _compute_chunks(dimensions=(30, 20), chunk_size=(10, 10))
+    occupancy = np.array([[True, True, True], [True, True, False]])
+    return _read_chunks(_read, slide="slide", coords=coords, n_channel=2, dtype=np.uint16, occupancy=occupancy, level=1)
+
+
+def test_record_tile_events(tiles) -> None:
+    with record_tile_events() as summary:
+        tiles.compute(scheduler="threads")
+
+    assert not _instrumented()
+    assert summary.n_tiles == 6
+    assert summary.nbytes == 6 * 2 * 10 * 10 * 2
+    assert summary.cache == {"disabled": 5, "empty": 1}
+    assert summary.phases["decode"] >= 5 * 0.001
+
+    event = min(summary.events, key=lambda event: (event.y0, event.x0))
+    assert (event.x0, event.y0, event.width, event.height) == (0, 0, 10, 10)
+    assert event.reader.endswith("_read")
+    assert event.path == "slide"
+    assert event.params == {"level": 1}
+    assert event.duration >= event.phases["decode"]
+
+    latency = summary.latency((50, 100))
+    assert latency[50] <= latency[100] <= summary.wall_time
+    assert summary.throughput > 0
+    assert set(summary.to_dict()) >= {"n_tiles", "throughput", "latency", "phases", "cache"}
+
+
+def test_record_tile_events_callback(tiles) -> None:
+    events = []
+    with record_tile_events(callback=events.append) as summary:
+        tiles.compute(scheduler="synchronous")
+    # Tiles computed outside of the context are not recorded
+    tiles.compute(scheduler="synchronous")
+
+    assert len(events) == summary.n_tiles == 6
+    assert all(isinstance(event, TileEvent) for event in events)
+
+
+def test_add_tile_event_callback(tiles) -> None:
+    events = []
+    add_tile_event_callback(events.append)
+    try:
+        tiles[:, :10, :10].compute(scheduler="synchronous")
+    finally:
+        remove_tile_event_callback(events.append)
+
+    assert len(events) == 1
+    assert not _instrumented()
+
+
+def test_tile_phase_without_event() -> None:
+    # Phases outside of recorded tile reads are ignored
+    with _TilePhase("decode"):
+        pass
+
+
+def test_tile_read_summary_empty() -> None:
+    summary = TileReadSummary()
+    assert summary.n_tiles == 0
+    assert summary.wall_time == 0
+    assert np.isnan(summary.latency()[50])
+    repr(summary)
+
+
+def test_record_tile_events_cache(tiles) -> None:
+    configure_tile_cache(max_bytes="1MiB")
+    clear_tile_cache()
+    try:
+        coords = _compute_chunks(dimensions=(20, 10), chunk_size=(10, 10))
+        cached_tiles = _read_chunks(
+            _read, slide="slide", coords=coords, n_channel=2, dtype=np.uint16, cache_key=("slide", 0)
+        )
+        with record_tile_events() as summary:
+            cached_tiles.compute(scheduler="synchronous")
+            cached_tiles.compute(scheduler="synchronous")
+    finally:
+        configure_tile_cache(max_bytes=0)
+        clear_tile_cache()
+
+    assert summary.cache == {"miss": 2, "memory": 2}
+
+
+def test_record_tile_events_czi() -> None:
+    img = read_czi("./data/zeiss/zeiss/zeiss_multi-channel.czi", chunk_size=(512, 512))
+
+    with record_tile_events() as summary:
+        img.compute()
+
+    assert summary.n_tiles == img.data.npartitions
+    assert summary.nbytes == img.nbytes
+    assert {"decode", "transpose"} <= set(summary.phases)
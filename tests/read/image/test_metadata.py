@@ -1,13 +1,22 @@
+import os
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import pytest
-from pydantic import BaseModel
+import xmltodict
+from pydantic import BaseModel, ValidationError
+from pylibCZIrw import czi as pyczi
 
+from dvpio.read.image import read_czi
 from dvpio.read.image._metadata import (
     CZIImageMetadata,
     OpenslideImageMetadata,
+    _clear_metadata_cache,
+    _extract_xml_paths,
     _get_value_from_nested_dict,
     read_metadata,
+    scan_metadata,
 )
 
 CZI_GROUND_TRUTH = {
@@ -93,6 +102,30 @@ def test_get_value_from_nested_dict_return_value(
     )
 
 
+@pytest.mark.parametrize(
+    "path",
+    [
+        ("ImageDocument", "Metadata", "Scaling", "Items", "Distance"),
+        ("ImageDocument", "Metadata", "Information", "Image", "Dimensions", "Channels", "Channel"),
+        ("ImageDocument", "Metadata", "Scaling", "AutoScaling", "ObjectiveName"),
+    ],
+)
+def test_extract_xml_paths(path: tuple[str, ...]) -> None:
+    xml = (
+        '<?xml version="1.0"?><ImageDocument><Metadata><Information><Image><Dimensions><Channels>'
+        '<Channel Id="Channel:0" Name="DAPI"><PixelType>Gray16</PixelType></Channel></Channels></Dimensions></Image>'
+        "</Information><Scaling><AutoScaling><ObjectiveName>Objective</ObjectiveName></AutoScaling><Items>"
+        '<Distance Id="X"><Value>2.2E-07</Value></Distance><Distance Id="Y"><Value>2.2E-07</Value></Distance>'
+        "</Items></Scaling></Metadata></ImageDocument>"
+    )
+
+    assert _extract_xml_paths(xml, [path]) == {path: _get_value_from_nested_dict(xmltodict.parse(xml), path)}
+
+
+def test_extract_xml_paths_missing() -> None:
+    assert _extract_xml_paths("<ImageDocument><Metadata/></ImageDocument>", [("ImageDocument", "Information")]) == {}
+
+
 @pytest.fixture(params=CZI_GROUND_TRUTH.keys())
 def czi_metadata_parser(request) -> BaseModel:
     path = request.param
@@ -172,3 +205,129 @@ def test_openslide_read_metadata(path, ground_truth):
     metadata = read_metadata(path, image_type="czi", parse_metadata=True)
 
     assert all(metadata[k] == ground_truth[k] for k in metadata.keys())
+
+
+@pytest.fixture
+def czi_file(tmp_path) -> str:
+    path = str(tmp_path / "image.czi")
+    with pyczi.create_czi(path) as czidoc_w:
+        czidoc_w.write(np.zeros((32, 32, 1), dtype=np.uint16), plane={"C": 0})
+    return path
+
+
+def test_metadata_cache(czi_file):
+    _clear_metadata_cache()
+    metadata = CZIImageMetadata.from_file(czi_file)
+
+    # Unchanged file is not parsed again
+    assert CZIImageMetadata.from_file(czi_file) is metadata
+
+    # Modified file invalidates the cache
+    stat = os.stat(czi_file)
+    os.utime(czi_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert CZIImageMetadata.from_file(czi_file) is not metadata
+
+
+def test_czi_metadata_from_xml(czi_file):
+    with pyczi.open_czi(czi_file) as czidoc:
+        xml = czidoc.raw_metadata
+        document = czidoc.metadata
+
+    metadata = CZIImageMetadata._from_xml(xml)
+
+    assert metadata.parsed_properties == CZIImageMetadata(metadata=document).parsed_properties
+    # Full document is only converted on request
+    assert metadata.metadata is None
+    assert metadata.to_dict() == document
+
+
+def test_metadata_no_deep_validation():
+    document = {"ImageDocument": {"Metadata": {"Value": [1, 2.0, None, {"nested": object()}]}}}
+    metadata = CZIImageMetadata(metadata=document)
+
+    # Raw document is stored as is
+    assert metadata.metadata is document
+
+    with pytest.raises(ValidationError):
+        CZIImageMetadata(metadata=["ImageDocument"])
+
+
+def test_parsed_properties_validation():
+    channel = {"@Id": "Channel:0", "@Name": 1}
+    document = {
+        "ImageDocument": {"Metadata": {"Information": {"Image": {"Dimensions": {"Channels": {"Channel": channel}}}}}}
+    }
+
+    with pytest.raises(ValidationError):
+        _ = CZIImageMetadata(metadata=document).parsed_properties
+
+
+def test_read_metadata_copy(czi_file):
+    _clear_metadata_cache()
+    raw = read_metadata(czi_file, image_type="czi", parse_metadata=False)
+    raw.clear()
+
+    assert read_metadata(czi_file, image_type="czi", parse_metadata=False)
+
+
+def test_read_czi_attrs_metadata(czi_file):
+    image = read_czi(czi_file)
+
+    assert image.attrs["metadata"] == read_metadata(czi_file, image_type="czi", parse_metadata=True)
+
+
+def test_read_czi_attrs_metadata_channels(tmp_path):
+    path = str(tmp_path / "multi_channel.czi")
+    with pyczi.create_czi(path) as czidoc_w:
+        for channel in range(3):
+            czidoc_w.write(np.zeros((32, 32, 1), dtype=np.uint16), plane={"C": channel})
+        czidoc_w.write_metadata(channel_names={0: "DAPI", 1: "GFP", 2: "RFP"})
+
+    image = read_czi(path, channels=[2, 1])
+
+    assert image.attrs["metadata"]["channel_id"] == [2, 1]
+    assert image.attrs["metadata"]["channel_names"] == ["RFP", "GFP"]
+    assert image.coords["c"].values.tolist() == image.attrs["metadata"]["channel_names"]
+
+
+def test_scan_metadata(czi_file, tmp_path):
+    invalid_file = tmp_path / "image.txt"
+    invalid_file.write_text("no image")
+    paths = [czi_file, str(invalid_file), str(tmp_path / "missing.czi")]
+
+    result = scan_metadata(paths)
+
+    assert result["path"].tolist() == [os.path.abspath(path) for path in paths]
+    assert result.loc[0, "error"] is None
+    assert result.loc[0, "image_type"] == "czi"
+    assert result.loc[0, "channel_id"] == [0]
+    assert result.loc[0, "size"] == os.path.getsize(czi_file)
+    assert result.loc[0, "mtime_ns"] == os.stat(czi_file).st_mtime_ns
+    assert result.loc[1, "error"].startswith("ValueError")
+    assert result.loc[2, "error"].startswith("FileNotFoundError")
+
+
+def test_scan_metadata_parallel(czi_file, tmp_path):
+    paths = [czi_file, str(tmp_path / "missing.czi"), czi_file]
+
+    result = scan_metadata(paths, n_jobs=2)
+
+    pd.testing.assert_frame_equal(result, scan_metadata(paths, n_jobs=1))
+
+
+def test_scan_metadata_previous(czi_file):
+    previous = scan_metadata([czi_file])
+    previous.loc[0, "mpp_x"] = 1.0
+
+    # Unchanged file is not parsed again
+    assert scan_metadata([czi_file], previous=previous).loc[0, "mpp_x"] == 1.0
+
+    # Modified file is parsed again
+    stat = os.stat(czi_file)
+    os.utime(czi_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert scan_metadata([czi_file], previous=previous).loc[0, "mpp_x"] != 1.0
+
+
+def test_scan_metadata_invalid_n_jobs(czi_file):
+    with pytest.raises(ValueError, match="n_jobs"):
+        scan_metadata([czi_file], n_jobs=0)
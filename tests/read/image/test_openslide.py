@@ -1,6 +1,7 @@
 import numpy as np
 import openslide
 import pytest
+from spatialdata.transformations import get_transformation
 
 from dvpio.read.image import read_openslide
 from dvpio.read.image.openslide import _get_img
@@ -22,6 +23,44 @@ def test_get_image_openslide(dataset, xmin: int, ymin: int, width: int, height:
     assert all(img_dim == ref_dim for img_dim, ref_dim in zip(img.shape, ground_truth_shape, strict=True))
 
 
+@pytest.mark.parametrize(
+    ("dataset", "xmin", "ymin", "width", "height"),
+    [
+        ("./data/openslide-mirax/Mirax2.2-4-PNG.mrxs", 0, 0, 500, 1000),
+    ],
+)
+def test_get_image_openslide_drop_alpha(dataset, xmin: int, ymin: int, width: int, height: int) -> None:
+    """Test that RGB tiles are returned as contiguous planar arrays"""
+    slide = openslide.OpenSlide(dataset)
+
+    img_rgba = _get_img(slide, x0=xmin, y0=ymin, width=width, height=height, level=0)
+    img_rgb = _get_img(slide, x0=xmin, y0=ymin, width=width, height=height, level=0, drop_alpha=True)
+
+    assert img_rgba.flags["C_CONTIGUOUS"] and img_rgb.flags["C_CONTIGUOUS"]
+    assert img_rgb.shape == (3, height, width)
+
+    # Opaque pixels are identical
+    opaque = img_rgba[3] == 255
+    assert (img_rgb[:, opaque] == img_rgba[:3, opaque]).all()
+
+
+@pytest.mark.parametrize(
+    ("dataset"),
+    [
+        ("./data/openslide-mirax/Mirax2.2-4-PNG.mrxs"),
+    ],
+)
+def test_get_image_openslide_drop_alpha_background(dataset) -> None:
+    """Test that transparent pixels outside of the slide are filled with the background color"""
+    slide = openslide.OpenSlide(dataset)
+    width, height = slide.dimensions
+    background_color = slide.properties.get(openslide.PROPERTY_NAME_BACKGROUND_COLOR, "ffffff")
+
+    img_rgb = _get_img(slide, x0=width, y0=height, width=10, height=10, level=0, drop_alpha=True)
+
+    assert (img_rgb == np.frombuffer(bytes.fromhex(background_color), dtype=np.uint8)[:, None, None]).all()
+
+
 # @pytest.mark.skipif(sys.platform != "darwin", reason="Tests fail online due to limited resources")
 @pytest.mark.parametrize(
     ("dataset", "xmin", "ymin", "xmax", "ymax"),
@@ -43,3 +82,69 @@ def test_read_openslide(dataset: str, xmin: int, xmax: int, ymin: int, ymax: int
     ref_image = np.array(slide.read_region((xmin, ymin), level=0, size=(xmax - xmin, ymax - ymin)))
 
     assert (test_image == ref_image).all()
+
+
+@pytest.mark.parametrize(
+    ("dataset"),
+    [
+        ("./data/openslide-mirax/Mirax2.2-4-PNG.mrxs"),
+    ],
+)
+def test_read_openslide_pyramidal(dataset: str) -> None:
+    """Test whether scales are read from the levels stored in the file"""
+    image_model = read_openslide(dataset, pyramidal=True)
+    slide = openslide.OpenSlide(dataset)
+
+    assert len(image_model.keys()) == slide.level_count
+    for level, scale in enumerate(image_model.values()):
+        assert scale["image"].shape == (4, *slide.level_dimensions[level][::-1])
+
+    # Compare lowest resolution level
+    level = slide.level_count - 1
+    test_image = image_model[f"scale{level}"].image.transpose("y", "x", "c").to_numpy()
+    ref_image = np.array(slide.read_region((0, 0), level=level, size=slide.level_dimensions[level]))
+
+    assert (test_image == ref_image).all()
+
+
+@pytest.mark.parametrize(
+    ("dataset"),
+    [
+        ("./data/openslide-mirax/Mirax2.2-4-PNG.mrxs"),
+    ],
+)
+def test_read_openslide_drop_alpha(dataset: str) -> None:
+    image_model = read_openslide(dataset, pyramidal=False, drop_alpha=True)
+
+    assert image_model.c.to_numpy().tolist() == ["r", "g", "b"]
+    assert image_model.shape[0] == 3
+    assert image_model.attrs["metadata"]["channel_id"] == [0, 1, 2]
+    assert image_model.attrs["metadata"]["channel_names"] == ["R", "G", "B"]
+
+
+@pytest.mark.parametrize(
+    ("dataset", "roi"),
+    [
+        ("./data/openslide-mirax/Mirax2.2-4-PNG.mrxs", (100, 200, 300, 150)),
+    ],
+)
+def test_read_openslide_roi(dataset: str, roi: tuple[int, int, int, int]) -> None:
+    """Test reading of a region of interest"""
+    x, y, width, height = roi
+    image_model = read_openslide(dataset, pyramidal=False, roi=roi)
+
+    slide = openslide.OpenSlide(dataset)
+    ref_image = np.array(slide.read_region((x, y), level=0, size=(width, height)))
+
+    assert (image_model.transpose("y", "x", "c").to_numpy() == ref_image).all()
+    assert (get_transformation(image_model).translation == np.array([x, y])).all()
+
+
+@pytest.mark.parametrize("drop_alpha", [False, True])
+def test_read_openslide_skip_empty(drop_alpha: bool) -> None:
+    """Test that skipping chunks outside of the scanned area does not change the image"""
+    dataset = "./data/openslide-mirax/Mirax2.2-4-PNG.mrxs"
+    img_full = read_openslide(dataset, chunk_size=(256, 256), drop_alpha=drop_alpha, pyramidal=False)
+    img_skip = read_openslide(dataset, chunk_size=(256, 256), drop_alpha=drop_alpha, pyramidal=False, skip_empty=True)
+
+    assert (img_full.to_numpy() == img_skip.to_numpy()).all()
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+import tifffile
+from xarray import DataTree
+
+from dvpio.read.image import read_tiff
+from dvpio.read.image.tiff import _get_img, _parse_axes
+
+
+@pytest.fixture
+def image() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 2**16, size=(3, 300, 500), dtype=np.uint16)
+
+
+@pytest.fixture
+def pyramidal_ome_tiff(tmp_path, image) -> str:
+    path = str(tmp_path / "pyramid.ome.tif")
+    options = {
+        "tile": (64, 128),
+        "compression": "zlib",
+        "photometric": "minisblack",
+        "metadata": {"axes": "CYX", "Channel": {"Name": ["DAPI", "CD3", "CK"]}},
+    }
+    with tifffile.TiffWriter(path, ome=True) as tif:
+        tif.write(image, subifds=2, **options)
+        tif.write(image[:, ::2, ::2], subfiletype=1, **options)
+        tif.write(image[:, ::4, ::4], subfiletype=1, **options)
+    return path
+
+
+@pytest.mark.parametrize(
+    ["axes", "shape", "channel_axis"],
+    [
+        ["YX", (10, 10), None],
+        ["CYX", (3, 10, 10), "C"],
+        ["YXS", (10, 10, 3), "S"],
+        ["TCYX", (1, 3, 10, 10), "C"],
+        ["CYXS", (1, 10, 10, 3), "S"],
+    ],
+)
+def test_parse_axes(axes, shape, channel_axis) -> None:
+    assert _parse_axes(axes, shape) == channel_axis
+
+
+@pytest.mark.parametrize(["axes", "shape"], [["ZYX", (3, 10, 10)], ["CYXS", (2, 10, 10, 3)], ["CX", (3, 10)]])
+def test_parse_axes_invalid(axes, shape) -> None:
+    with pytest.raises(ValueError):
+        _parse_axes(axes, shape)
+
+
+def test_read_tiff_pyramidal(pyramidal_ome_tiff, image) -> None:
+    img = read_tiff(pyramidal_ome_tiff)
+
+    assert isinstance(img, DataTree)
+    assert list(img["scale0"]["c"].values) == ["DAPI", "CD3", "CK"]
+
+    for idx, downsample in enumerate([1, 2, 4]):
+        scale = img[f"scale{idx}"]["image"]
+        # Native tiles are chunks
+        assert scale.data.chunks[1][0] == min(64, scale.sizes["y"])
+        assert scale.data.chunks[2][0] == min(128, scale.sizes["x"])
+        assert np.array_equal(scale.data.compute(), image[:, ::downsample, ::downsample])
+
+
+def test_read_tiff_chunk_size(pyramidal_ome_tiff, image) -> None:
+    img = read_tiff(pyramidal_ome_tiff, chunk_size=(200, 100), pyramidal=False)
+
+    # Multiples of the tile size
+    assert img.data.chunksize == (3, 128, 256)
+    assert np.array_equal(img.data.compute(), image)
+
+
+def test_read_tiff_rgb(tmp_path, image) -> None:
+    path = str(tmp_path / "rgb.tif")
+    rgb = (image[..., :256] >> 8).astype(np.uint8)
+    tifffile.imwrite(path, np.moveaxis(rgb, 0, -1), photometric="rgb", tile=(128, 128))
+
+    img = read_tiff(path)
+
+    assert list(img["c"].values) == ["r", "g", "b"]
+    assert np.array_equal(img.data.compute(), rgb)
+
+
+def test_read_tiff_memmap(tmp_path, image) -> None:
+    path = str(tmp_path / "strips.tif")
+    tifffile.imwrite(path, image[0], rowsperstrip=16)
+
+    img = read_tiff(path, chunk_size=(100, 40))
+
+    # Bands of full width and multiples of the strip size
+    assert img.data.chunksize == (1, 32, 500)
+    assert np.array_equal(img.data.compute(), image[:1])
+
+    # Uncompressed strips are not copied
+    block = _get_img(path, x0=0, y0=16, width=500, height=32, axes="YX", channel_axis=None)
+    assert isinstance(block.base, np.memmap | np.ndarray)
+    assert not block.flags.owndata
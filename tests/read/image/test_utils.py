@@ -1,12 +1,30 @@
+import threading
 from typing import Any
 
 import dask.array as da
+import geopandas as gpd
 import numpy as np
 import pytest
+import shapely
 from dask import delayed
 from numpy.typing import NDArray
+from spatialdata.models import ShapesModel
+from spatialdata.transformations import Identity, Sequence, Translation, get_transformation
 
-from dvpio.read.image._utils import _compute_chunk_sizes_positions, _compute_chunks, _read_chunks
+from dvpio.read.image._utils import (
+    _compute_aligned_chunk_sizes_positions,
+    _compute_auto_chunk_size,
+    _compute_chunk_sizes_positions,
+    _compute_chunks,
+    _HandlePool,
+    _mask_occupancy,
+    _parse_multiscale,
+    _parse_roi,
+    _rasterize_rects,
+    _read_chunks,
+    _rects_occupancy,
+    _roi_transformations,
+)
 
 
 @pytest.mark.parametrize(
@@ -35,6 +53,61 @@ def test_compute_chunk_sizes_positions(
     assert (lengths == computed_lengths).all()
 
 
+@pytest.mark.parametrize(
+    ("size", "chunk", "min_coordinate", "boundaries", "positions", "lengths"),
+    [
+        # Boundaries coincide with chunk size
+        (6, 2, 0, np.array([0, 2, 4]), np.array([0, 2, 4]), np.array([2, 2, 2])),
+        # Multiple subblocks per chunk
+        (6, 4, 0, np.array([0, 2, 4]), np.array([0, 4]), np.array([4, 2])),
+        # Chunk smaller than subblocks, extend to next boundary
+        (6, 1, 0, np.array([0, 3]), np.array([0, 3]), np.array([3, 3])),
+        # Irregular boundaries and negative start coordinate
+        (6, 2, -1, np.array([-1, 1, 2, 4]), np.array([-1, 1, 2, 4]), np.array([2, 1, 2, 1])),
+        # Boundaries outside of dimension are ignored
+        (4, 2, 0, np.array([-2, 2, 6]), np.array([0, 2]), np.array([2, 2])),
+    ],
+)
+def test_compute_aligned_chunk_sizes_positions(
+    size: int,
+    chunk: int,
+    min_coordinate: int,
+    boundaries: NDArray[np.number],
+    positions: NDArray[np.number],
+    lengths: NDArray[np.number],
+) -> None:
+    """Test whether 1D chunking is aligned to boundaries"""
+    computed_positions, computed_lengths = _compute_aligned_chunk_sizes_positions(
+        size, chunk, min_coordinate, boundaries=boundaries
+    )
+    assert (positions == computed_positions).all()
+    assert (lengths == computed_lengths).all()
+
+
+@pytest.mark.parametrize(
+    ("n_channel", "dtype", "target_bytes", "result"),
+    [
+        (1, np.uint8, 100, (10, 10)),
+        (4, np.uint16, 800, (10, 10)),
+        (1, np.uint8, "1KiB", (32, 32)),
+        (1, np.float32, 1, (1, 1)),
+    ],
+)
+def test_compute_auto_chunk_size(
+    n_channel: int, dtype: np.dtype, target_bytes: int | str, result: tuple[int, int]
+) -> None:
+    assert _compute_auto_chunk_size(n_channel, dtype, target_bytes=target_bytes) == result
+
+
+def test_compute_chunks_boundaries() -> None:
+    """Test two dimensional chunking aligned to boundaries"""
+    tiles = _compute_chunks(
+        dimensions=(3, 2), chunk_size=(2, 1), min_coordinates=(0, 0), boundaries=(np.array([0, 1]), np.array([0]))
+    )
+
+    assert (tiles == np.array([[[0, 0, 1, 2], [1, 0, 2, 2]]])).all()
+
+
 @pytest.mark.parametrize(
     ("dimensions", "chunk_size", "min_coordinates", "result"),
     [
@@ -137,3 +210,246 @@ def test_read_chunks_dtype(dtype) -> None:
     tiles = da.block(tiles_)
 
     assert tiles.dtype == dtype
+
+
+def test_read_chunks_blockwise() -> None:
+    """Test if tiles are read into a single graph layer with chunks from the chunk grid"""
+
+    def func(slide: Any, x0: int, y0: int, width: int, height: int, offset: int = 0) -> NDArray[np.int_]:
+        """Encode tile position in values"""
+        return np.full((2, height, width), 100 * y0 + x0 + offset, dtype=np.int32)
+
+    coords = _compute_chunks(dimensions=(25, 12), chunk_size=(10, 5), min_coordinates=(-5, 3))
+    tiles = _read_chunks(func, slide=None, coords=coords, n_channel=2, dtype=np.int32, offset=1)
+
+    assert len(tiles.dask.layers) == 1
+    assert tiles.chunks == ((2,), (5, 5, 2), (10, 10, 5))
+
+    result = tiles.compute()
+    assert result[0, 0, 0] == 100 * 3 - 5 + 1
+    assert result[1, -1, -1] == 100 * 13 + 15 + 1
+
+    # Slicing only keeps the tasks of selected tiles (2 of 9)
+    sliced = tiles[:, :5, 10:]
+    assert len(sliced.__dask_optimize__(sliced.dask, sliced.__dask_keys__())) < tiles.npartitions
+
+
+def test_read_chunks_occupancy() -> None:
+    """Test that empty tiles are not read but filled with a constant value"""
+    calls = []
+
+    def func(slide: Any, x0: int, y0: int, width: int, height: int) -> NDArray[np.int_]:
+        calls.append((x0, y0))
+        return np.ones((2, height, width), dtype=np.uint8)
+
+    coords = _compute_chunks(dimensions=(4, 4), chunk_size=(2, 2))
+    occupancy = np.array([[True, False], [False, False]])
+    tiles = _read_chunks(
+        func, slide=None, coords=coords, n_channel=2, dtype=np.uint8, occupancy=occupancy, fill_value=[3, 4]
+    )
+
+    result = tiles.compute(scheduler="synchronous")
+    assert calls == [(0, 0)]
+    assert (result[:, :2, :2] == 1).all()
+    assert (result[0, 2:] == 3).all() and (result[1, 2:] == 4).all()
+
+
+def test_read_chunks_planes() -> None:
+    """Test that planes are stacked along the second dimension on the same chunk grid"""
+
+    def func(slide: Any, x0: int, y0: int, width: int, height: int, z: int) -> NDArray[np.int_]:
+        return np.full((2, height, width), z, dtype=np.uint8)
+
+    coords = _compute_chunks(dimensions=(5, 4), chunk_size=(2, 2))
+    tiles = _read_chunks(func, slide=None, coords=coords, n_channel=2, dtype=np.uint8, planes=[{"z": 3}, {"z": 7}])
+
+    assert tiles.chunks == ((2,), (1, 1), (2, 2), (2, 2, 1))
+    result = tiles.compute(scheduler="synchronous")
+    assert (result[:, 0] == 3).all() and (result[:, 1] == 7).all()
+
+
+def test_rects_occupancy() -> None:
+    coords = _compute_chunks(dimensions=(30, 20), chunk_size=(10, 10), min_coordinates=(-10, 0))
+    rects = np.array([[-10, 0, 5, 5], [5, 12, 1, 1], [10, 0, 1, 1]])
+
+    expected = np.array([[True, False, True], [False, True, False]])
+    assert (_rects_occupancy(rects, coords) == expected).all()
+    assert not _rects_occupancy(np.empty((0, 4)), coords).any()
+
+    # Chunk sizes of a pyramid level with downsample 2 cover twice the region
+    level_coords = _compute_chunks(dimensions=(15, 10), chunk_size=(5, 5), min_coordinates=(-10, 0))
+    level_coords[..., :2] = (level_coords[..., :2] - [-10, 0]) * 2 + [-10, 0]
+    assert (_rects_occupancy(rects, level_coords, downsample=2) == expected).all()
+
+
+def test_rects_occupancy_overlapping_rects() -> None:
+    coords = _compute_chunks(dimensions=(100, 80), chunk_size=(7, 9), min_coordinates=(3, -5))
+    rng = np.random.default_rng(0)
+    rects = np.concatenate([rng.integers(-20, 110, size=(50, 2)), rng.integers(0, 30, size=(50, 2))], axis=1)
+    # Duplicated rectangles, e.g. subblocks of several channels
+    rects = np.concatenate([rects, rects])
+
+    x_start, y_start = coords[..., 0], coords[..., 1]
+    x_end, y_end = x_start + coords[..., 2], y_start + coords[..., 3]
+    expected = np.logical_or.reduce(
+        [(x_end > x) & (x_start < x + w) & (y_end > y) & (y_start < y + h) for x, y, w, h in rects]
+    )
+    assert (_rects_occupancy(rects, coords) == expected).all()
+
+
+def test_rasterize_rects() -> None:
+    mask = _rasterize_rects(np.array([[2, 0, 3, 1], [8, 8, 10, 10]]), region=(0, 0, 10, 10), downsample=4)
+
+    assert mask.shape == (3, 3)
+    assert (mask == np.array([[True, True, False], [False, False, False], [False, False, True]])).all()
+
+
+def test_mask_occupancy() -> None:
+    mask = np.array([[True, False], [False, False]])
+    coords = _compute_chunks(dimensions=(8, 8), chunk_size=(3, 3))
+
+    # Mask pixel covers (0, 0, 4, 4), chunks that partially cover it are occupied
+    expected = np.array([[True, True, False], [True, True, False], [False, False, False]])
+    assert (_mask_occupancy(mask, 4, coords) == expected).all()
+
+
+class _DummyHandle:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def slide_paths(tmp_path) -> list[str]:
+    paths = [str(tmp_path / name) for name in ("a", "b", "c")]
+    for path in paths:
+        with open(path, "w") as f:
+            f.write("slide")
+    return paths
+
+
+def test_handle_pool_reuse(slide_paths) -> None:
+    """Test that handles are opened lazily and reused within a thread"""
+    pool = _HandlePool(opener=_DummyHandle, maxsize=2)
+    path_a, *_ = slide_paths
+
+    handle = pool.get(path_a)
+    assert pool.get(path_a) is handle
+    assert not handle.closed
+
+
+def test_handle_pool_eviction(slide_paths) -> None:
+    """Test that the least recently used handle is closed when the pool is full"""
+    pool = _HandlePool(opener=_DummyHandle, maxsize=2)
+    path_a, path_b, path_c = slide_paths
+
+    handle_a = pool.get(path_a)
+    handle_b = pool.get(path_b)
+    # Mark a as recently used
+    pool.get(path_a)
+    handle_c = pool.get(path_c)
+
+    assert handle_b.closed
+    assert not handle_a.closed and not handle_c.closed
+
+    pool.clear()
+    assert handle_a.closed and handle_c.closed
+
+
+def test_handle_pool_modified_file(slide_paths) -> None:
+    """Test that the handle of a modified file is closed and reopened"""
+    pool = _HandlePool(opener=_DummyHandle, maxsize=2)
+    path_a, *_ = slide_paths
+
+    handle = pool.get(path_a)
+    with open(path_a, "w") as f:
+        f.write("modified slide")
+
+    assert pool.get(path_a) is not handle
+    assert handle.closed
+
+
+def test_handle_pool_per_thread(slide_paths) -> None:
+    """Test that every thread obtains its own handle"""
+    pool = _HandlePool(opener=_DummyHandle, maxsize=2)
+    path_a, *_ = slide_paths
+    handles = []
+
+    thread = threading.Thread(target=lambda: handles.append(pool.get(path_a)))
+    thread.start()
+    thread.join()
+
+    assert pool.get(path_a) is not handles[0]
+
+
+def test_handle_pool_maxsize() -> None:
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        _HandlePool(opener=_DummyHandle, maxsize=0)
+
+
+def test_parse_multiscale() -> None:
+    """Test that scales are not recomputed and transformations match the scale factors"""
+    arrays = [da.zeros((1, 12, 9)), da.ones((1, 6, 3)), da.full((1, 4, 3), 2)]
+
+    multiscale = _parse_multiscale(arrays, c_coords=["a"])
+
+    assert list(multiscale.keys()) == ["scale0", "scale1", "scale2"]
+    for idx, array in enumerate(arrays):
+        image = multiscale[f"scale{idx}"]["image"]
+        assert image.shape == array.shape
+        assert (image == idx).all()
+
+    scale = get_transformation(multiscale["scale2"]["image"]).transformations[0]
+    assert (scale.scale == np.array([3, 3])).all()
+
+
+def test_parse_multiscale_scale_factors() -> None:
+    with pytest.raises(ValueError, match="scale_factors"):
+        _parse_multiscale([da.zeros((1, 2, 2))], scale_factors=[2])
+
+
+@pytest.mark.parametrize(
+    ("roi", "margin", "align", "result"),
+    [
+        # Region within image
+        ((1, 2, 3, 4), 0, 1, (1, 2, 3, 4)),
+        # Margin
+        ((2, 2, 3, 4), 1, 1, (1, 1, 5, 6)),
+        # Clip to image
+        ((-2, 5, 20, 20), 0, 1, (0, 5, 10, 5)),
+        # Align borders
+        ((1, 3, 2, 2), 0, 2, (0, 2, 4, 4)),
+    ],
+)
+def test_parse_roi(roi: tuple[int, int, int, int], margin: int, align: int, result: tuple[int, int, int, int]) -> None:
+    assert _parse_roi(roi, dimensions=(10, 10), margin=margin, align=align) == result
+
+
+def test_parse_roi_shapes() -> None:
+    """Test that the total bounds of shapes define the region of interest"""
+    shapes = ShapesModel.parse(
+        gpd.GeoDataFrame(
+            geometry=[shapely.Polygon([[1.5, 2], [3, 2], [3, 4]]), shapely.Polygon([[5, 5], [6, 5], [6, 6.2]])]
+        )
+    )
+
+    assert _parse_roi(shapes, dimensions=(10, 10)) == (1, 2, 5, 5)
+    assert _parse_roi(shapes, dimensions=(10, 10), margin=1) == (0, 1, 7, 7)
+
+
+def test_parse_roi_outside() -> None:
+    with pytest.raises(ValueError, match="does not overlap"):
+        _parse_roi((10, 10, 5, 5), dimensions=(10, 10))
+
+
+def test_roi_transformations() -> None:
+    transformations = _roi_transformations((1, 2, 3, 4))
+    assert isinstance(transformations["global"], Translation)
+    assert (transformations["global"].translation == np.array([1, 2])).all()
+
+    transformations = _roi_transformations((1, 2, 3, 4), transformations={"aligned": Identity()})
+    assert list(transformations.keys()) == ["aligned"]
+    assert isinstance(transformations["aligned"], Sequence)
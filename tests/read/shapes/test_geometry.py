@@ -1,10 +1,13 @@
+import geopandas as gpd
 import numpy as np
 import pytest
+import shapely
 from numpy.typing import NDArray
 
 from dvpio.read.shapes.geometry import (
     apply_transformation,
     compute_transformation,
+    transform_geometry,
 )
 
 test_cases = [
@@ -91,3 +94,22 @@ def test_apply_transformation(
 ) -> None:
     target = apply_transformation(query, affine_transformation)
     assert np.isclose(target, reference, rtol=0.001).all()
+
+
+@pytest.mark.parametrize(["query", "reference", "affine_transformation"], test_cases)
+def test_transform_geometry(
+    query: NDArray[np.float64],
+    reference: NDArray[np.float64],
+    affine_transformation: NDArray[np.float64],
+) -> None:
+    geometry = gpd.GeoSeries(
+        [shapely.Polygon(query), shapely.Point(query[1]), shapely.MultiPoint(query)], index=[3, 1, 2], name="geometry"
+    )
+
+    transformed = transform_geometry(geometry, affine_transformation)
+
+    assert transformed.index.tolist() == [3, 1, 2]
+    assert transformed.name == "geometry"
+    assert np.isclose(shapely.get_coordinates(transformed[3])[:-1], reference).all()
+    assert np.isclose(shapely.get_coordinates(transformed[1]), reference[1]).all()
+    assert np.isclose(shapely.get_coordinates(transformed[2]), reference).all()
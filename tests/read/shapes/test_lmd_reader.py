@@ -4,11 +4,12 @@ import pytest
 from numpy.typing import NDArray
 from scipy.optimize import linear_sum_assignment as lsa
 from scipy.spatial.distance import cdist
-from shapely import Polygon
+from shapely import Polygon, get_coordinates
 from spatialdata.models import PointsModel, ShapesModel
-from spatialdata.transformations import BaseTransformation
+from spatialdata.transformations import BaseTransformation, get_transformation
 
 from dvpio.read.shapes import read_lmd, transform_shapes
+from dvpio.read.shapes.geometry import apply_transformation
 
 
 def _get_centroid_xy(geometry: gpd.GeoSeries) -> NDArray[np.float64]:
@@ -33,6 +34,37 @@ def test_transform_shapes() -> None:
     assert len(transformed_shapes) == len(shapes)
 
 
+def test_transform_shapes_switch_orientation() -> None:
+    calibration_points_source = PointsModel.parse(np.array([[0, 0], [1, 0], [0, 1]]))
+    calibration_points_target = PointsModel.parse(np.array([[1, 1], [3, 1], [1, 3]]))
+    shapes = ShapesModel.parse(
+        gpd.GeoDataFrame(geometry=[Polygon([[0, 0], [1, 1], [0, 1]]), Polygon([[2, 0], [3, 1], [2, 2]])])
+    )
+
+    transformed_shapes = transform_shapes(
+        shapes=shapes,
+        calibration_points_source=calibration_points_source,
+        calibration_points_target=calibration_points_target,
+    )
+    switched_shapes = transform_shapes(
+        shapes=shapes,
+        calibration_points_source=calibration_points_source,
+        calibration_points_target=calibration_points_target,
+        switch_orientation=True,
+    )
+
+    for shape, switched_shape in zip(transformed_shapes.geometry, switched_shapes.geometry, strict=True):
+        assert np.allclose(get_coordinates(shape)[:, ::-1], get_coordinates(switched_shape))
+
+    # Transformation to LMD coordinates recovers the original shapes
+    # spatialdata stores affine matrices for column vectors
+    to_lmd = (
+        get_transformation(switched_shapes, to_coordinate_system="to_lmd").to_affine_matrix(("x", "y"), ("x", "y")).T
+    )
+    for shape, switched_shape in zip(shapes.geometry, switched_shapes.geometry, strict=True):
+        assert np.allclose(get_coordinates(shape), apply_transformation(get_coordinates(switched_shape), to_lmd))
+
+
 @pytest.mark.parametrize(
     ["path", "calibration_points", "ground_truth_path"],
     [
@@ -5,7 +5,8 @@ import geopandas as gpd
 import lmd.lib as pylmd
 import numpy as np
 import pytest
-from spatialdata.models import PointsModel
+from shapely import Polygon, get_coordinates
+from spatialdata.models import PointsModel, ShapesModel
 
 from dvpio.read.shapes import read_lmd
 from dvpio.write import write_lmd
@@ -112,3 +113,32 @@ def test_read_write_lmd(read_path, calibration_points):
     query = query.to_geopandas()
 
     assert query.equals(ref)
+
+
+def test_write_lmd_affine_transformation() -> None:
+    """Test whether shapes and calibration points are transformed to the Leica coordinate system"""
+    path = os.path.join(mkdtemp(), "test.xml")
+    annotation = ShapesModel.parse(
+        gpd.GeoDataFrame(
+            data={"name": ["001", "002"], "well": ["A1", "B1"]},
+            geometry=[Polygon([[0, 0], [0, 1], [1, 0], [0, 0]]), Polygon([[2, 2], [2, 4], [4, 2], [2, 2]])],
+        )
+    )
+    affine_transformation = np.array([[2, 0, 0], [0, 3, 0], [10, 20, 1]])
+
+    write_lmd(
+        path=path,
+        annotation=annotation,
+        calibration_points=calibration_points_image,
+        affine_transformation=affine_transformation,
+        annotation_name_column="name",
+    )
+
+    collection = pylmd.Collection()
+    collection.load(path)
+    result = collection.to_geopandas()
+
+    assert len(result) == len(annotation)
+    for shape, transformed_shape in zip(annotation.geometry, result.geometry, strict=True):
+        expected = get_coordinates(shape) * [2, 3] + [10, 20]
+        assert np.allclose(get_coordinates(transformed_shape), expected)